@@ -0,0 +1,88 @@
+from generator.maze_generator import maze_batch_generator
+from search_algorithms.bread_first_search import bfs_solve
+from search_algorithms.a_star_search import a_star_solve, TIE_BREAKS
+from search_algorithms.heuristics import HEURISTICS
+import argparse
+import sys
+import time
+import numpy as np
+
+
+def check_optimality(dimension=30, count=2000, probabilities=(0.1, 0.2, 0.3, 0.4), seed=0):
+    """
+    Check that A* finds a path exactly when BFS does, and that it is as short as the BFS path,
+    for every heuristic and tie-breaking order.
+
+    Args:
+        dimension (int, optional): Size of the mazes. Defaults to 30.
+        count (int, optional): Number of mazes per wall probability. Defaults to 2000.
+        probabilities (sequence of float, optional): Wall probabilities to sweep.
+        seed (int, optional): Seed of the maze batches. Defaults to 0.
+
+    Returns:
+        list of str: One message per mismatch, empty when every path was optimal.
+    """
+
+    mismatches = []
+    for probabillity in probabilities:
+        for index, maze in enumerate(maze_batch_generator(count, dimension, probabillity, seed)):
+            optimal = bfs_solve(maze)
+            for h in HEURISTICS:
+                for tie_break in TIE_BREAKS:
+                    result = a_star_solve(maze, h, tie_break=tie_break)
+                    if result.found != optimal.found or result.path_length != optimal.path_length:
+                        mismatches.append(f"p={probabillity} maze {index} h={h} tie_break={tie_break}: "
+                                          f"length {result.path_length}, optimal {optimal.path_length}")
+    return mismatches
+
+
+def a_star_benchmark(dimension=200, count=20, probabilities=(0.0, 0.1, 0.2, 0.3, 0.4), h="euclid", seed=0):
+    """
+    Compare the expanded nodes and wall time of A* under every tie-breaking order across wall probabilities.
+
+    Returns:
+        list of dict: One row per (probability, tie_break) with the mean expanded nodes and seconds per maze.
+    """
+
+    rows = []
+    for probabillity in probabilities:
+        mazes = maze_batch_generator(count, dimension, probabillity, seed)
+        for tie_break in TIE_BREAKS:
+            expanded, seconds = [], []
+            for maze in mazes:
+                started = time.perf_counter()
+                result = a_star_solve(maze, h, tie_break=tie_break)
+                seconds.append(time.perf_counter() - started)
+                expanded.append(result.expanded)
+            rows.append({
+                "probability": probabillity,
+                "tie_break": tie_break,
+                "expanded": np.mean(expanded),
+                "seconds": np.mean(seconds),
+            })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="A* optimality check and tie-breaking benchmark")
+    parser.add_argument("--dimension", type=int, default=200, help="Size of the benchmark mazes")
+    parser.add_argument("--count", type=int, default=20, help="Number of benchmark mazes per wall probability")
+    parser.add_argument("--probabilities", type=float, nargs="+", default=[0.0, 0.1, 0.2, 0.3, 0.4],
+                        help="Wall probabilities to sweep")
+    parser.add_argument("--heuristic", default="euclid", choices=HEURISTICS, help="Heuristic of the benchmark")
+    parser.add_argument("--check-count", type=int, default=2000,
+                        help="Number of small mazes per wall probability checked against BFS, 0 to skip")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the maze batches")
+    args = parser.parse_args()
+
+    if args.check_count > 0:
+        mismatches = check_optimality(count=args.check_count, seed=args.seed)
+        for mismatch in mismatches:
+            print(mismatch)
+        print(f"optimality check: {len(mismatches)} mismatches")
+        if mismatches:
+            sys.exit(1)
+
+    print(f"{'p':>4} {'tie_break':>9} {'expanded':>10} {'ms':>8}")
+    for row in a_star_benchmark(args.dimension, args.count, args.probabilities, args.heuristic, args.seed):
+        print(f"{row['probability']:>4.1f} {row['tie_break']:>9} {row['expanded']:>10.0f} {row['seconds'] * 1e3:>8.2f}")
@@ -0,0 +1,78 @@
+from generator.maze_generator import maze_batch_generator
+from search_algorithms.bread_first_search import bfs_solve
+from search_algorithms.a_star_search import a_star_solve
+from search_algorithms.bidirectional_search import bidirectional_bfs_solve, bidirectional_a_star_solve
+import argparse
+import time
+import numpy as np
+
+# (single-direction solver, bidirectional solver) pairs to compare
+PAIRS = {
+    "bfs": (bfs_solve, bidirectional_bfs_solve),
+    "a-star": (a_star_solve, bidirectional_a_star_solve),
+}
+
+
+def measure(solver, mazes):
+    """
+    Run a solver over every maze and return the mean expanded nodes and mean wall time per maze.
+    """
+
+    expanded, seconds = [], []
+    for maze in mazes:
+        started = time.perf_counter()
+        result = solver(maze)
+        seconds.append(time.perf_counter() - started)
+        expanded.append(result.expanded)
+    return np.mean(expanded), np.mean(seconds)
+
+
+def bidirectional_benchmark(dimension=200, count=20, probabilities=(0.0, 0.1, 0.2, 0.3, 0.4), seed=0):
+    """
+    Compare the single-direction and bidirectional BFS and A* solvers across wall probabilities.
+
+    Args:
+        dimension (int, optional): Size of the mazes. Defaults to 200.
+        count (int, optional): Number of mazes per wall probability. Defaults to 20.
+        probabilities (sequence of float, optional): Wall probabilities to sweep.
+        seed (int, optional): Seed of the maze batches. Defaults to 0.
+
+    Returns:
+        list of dict: One row per (probability, algorithm) with the mean expanded nodes and seconds of both
+                      versions and the bidirectional/single ratios.
+    """
+
+    rows = []
+    for probabillity in probabilities:
+        mazes = maze_batch_generator(count, dimension, probabillity, seed)
+        for name, (single, bidirectional) in PAIRS.items():
+            single_expanded, single_seconds = measure(single, mazes)
+            bi_expanded, bi_seconds = measure(bidirectional, mazes)
+            rows.append({
+                "probability": probabillity,
+                "algorithm": name,
+                "expanded": single_expanded,
+                "bidirectional_expanded": bi_expanded,
+                "expanded_ratio": bi_expanded / max(single_expanded, 1),
+                "seconds": single_seconds,
+                "bidirectional_seconds": bi_seconds,
+                "seconds_ratio": bi_seconds / single_seconds,
+            })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Single-direction vs bidirectional search benchmark")
+    parser.add_argument("--dimension", type=int, default=200, help="Size of the mazes")
+    parser.add_argument("--count", type=int, default=20, help="Number of mazes per wall probability")
+    parser.add_argument("--probabilities", type=float, nargs="+", default=[0.0, 0.1, 0.2, 0.3, 0.4],
+                        help="Wall probabilities to sweep")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the maze batches")
+    args = parser.parse_args()
+
+    print(f"{'p':>4} {'algorithm':>8} {'expanded':>10} {'bi-expanded':>12} {'ratio':>6} "
+          f"{'ms':>8} {'bi-ms':>8} {'ratio':>6}")
+    for row in bidirectional_benchmark(args.dimension, args.count, args.probabilities, args.seed):
+        print(f"{row['probability']:>4.1f} {row['algorithm']:>8} {row['expanded']:>10.0f} "
+              f"{row['bidirectional_expanded']:>12.0f} {row['expanded_ratio']:>6.2f} "
+              f"{row['seconds'] * 1e3:>8.2f} {row['bidirectional_seconds'] * 1e3:>8.2f} {row['seconds_ratio']:>6.2f}")
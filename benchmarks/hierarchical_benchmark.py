@@ -0,0 +1,112 @@
+from generator.maze_generator import maze_batch_generator
+from search_algorithms.bread_first_search import bfs_solve
+from search_algorithms.a_star_search import a_star_solve
+from search_algorithms.hierarchical_search import HierarchicalIndex
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+
+
+def random_queries(rng, maze, count):
+    """
+    Pairs of distinct open (row, column) nodes of the maze.
+    """
+
+    open_cells = np.argwhere(maze == 0)
+    picks = rng.choice(len(open_cells), size=(count, 2))
+    return [(tuple(map(int, open_cells[a])), tuple(map(int, open_cells[b]))) for a, b in picks if a != b]
+
+
+def hierarchical_benchmark(dimension=1000, probabilities=(0.1, 0.2, 0.3), cluster_sizes=(16, 32, 64), queries=20,
+                           seed=0):
+    """
+    Compare HPA* queries on a prebuilt HierarchicalIndex against cell-level A* between random open nodes.
+
+    Args:
+        dimension (int, optional): Size of the mazes. Defaults to 1000.
+        probabilities (sequence of float, optional): Wall probabilities to sweep.
+        cluster_sizes (sequence of int, optional): Cluster sides to index the mazes with.
+        queries (int, optional): Number of random queries per maze. Defaults to 20.
+        seed (int, optional): Seed of the mazes and queries. Defaults to 0.
+
+    Returns:
+        list of dict: One row per (probability, cluster size) with the index build, save and load times, its
+                      file size and number of entrances, the mean seconds per query of both, the mean abstract
+                      nodes expanded by HPA*, and the found mismatches and mean excess path length over BFS.
+    """
+
+    rng = np.random.default_rng(seed)
+    rows = []
+    for probabillity in probabilities:
+        maze = maze_batch_generator(1, dimension, probabillity, seed)[0]
+        pairs = random_queries(rng, maze, queries)
+
+        # Cell-level references, shared by every cluster size
+        a_star_seconds, optimal = [], []
+        for source, destination in pairs:
+            started = time.perf_counter()
+            a_star_solve(maze, "manhattan", source=source, destination=destination)
+            a_star_seconds.append(time.perf_counter() - started)
+            optimal.append(bfs_solve(maze, sources=source, destinations=destination))
+
+        for cluster_size in cluster_sizes:
+            started = time.perf_counter()
+            index = HierarchicalIndex(maze, cluster_size)
+            build = time.perf_counter() - started
+
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, "index.npz")
+                started = time.perf_counter()
+                index.save(path)
+                save = time.perf_counter() - started
+                size = os.path.getsize(path)
+                started = time.perf_counter()
+                HierarchicalIndex.load(path, maze)
+                load = time.perf_counter() - started
+
+            seconds, expanded, mismatches, excess = [], [], 0, []
+            for (source, destination), reference in zip(pairs, optimal):
+                started = time.perf_counter()
+                result = index.query(source, destination)
+                seconds.append(time.perf_counter() - started)
+                expanded.append(result.expanded)
+                mismatches += result.found != reference.found
+                if result.found and reference.found:
+                    excess.append(result.path_length - reference.path_length)
+
+            rows.append({
+                "probability": probabillity,
+                "cluster_size": cluster_size,
+                "build_seconds": build,
+                "save_seconds": save,
+                "load_seconds": load,
+                "file_bytes": size,
+                "entrances": len(index.slots),
+                "seconds": np.mean(seconds),
+                "expanded": np.mean(expanded),
+                "a_star_seconds": np.mean(a_star_seconds),
+                "mismatches": mismatches,
+                "excess": np.mean(excess) if len(excess) != 0 else float("nan"),
+            })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hierarchical path-finding (HPA*) queries vs cell-level A*")
+    parser.add_argument("--dimension", type=int, default=1000, help="Size of the mazes")
+    parser.add_argument("--probabilities", type=float, nargs="+", default=[0.1, 0.2, 0.3],
+                        help="Wall probabilities to sweep")
+    parser.add_argument("--cluster-sizes", type=int, nargs="+", default=[16, 32, 64], help="Cluster sides")
+    parser.add_argument("--queries", type=int, default=20, help="Number of random queries per maze")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the mazes and queries")
+    args = parser.parse_args()
+
+    print(f"{'p':>4} {'cluster':>7} {'build-s':>8} {'load-s':>7} {'MB':>6} {'entrances':>9} {'ms':>8} "
+          f"{'expanded':>9} {'a*-ms':>8} {'speedup':>8} {'mismatches':>10} {'excess':>7}")
+    for row in hierarchical_benchmark(args.dimension, args.probabilities, args.cluster_sizes, args.queries, args.seed):
+        print(f"{row['probability']:>4.1f} {row['cluster_size']:>7} {row['build_seconds']:>8.2f} "
+              f"{row['load_seconds']:>7.2f} {row['file_bytes'] / 2**20:>6.1f} {row['entrances']:>9} "
+              f"{row['seconds'] * 1e3:>8.2f} {row['expanded']:>9.0f} {row['a_star_seconds'] * 1e3:>8.2f} "
+              f"{row['a_star_seconds'] / row['seconds']:>8.1f} {row['mismatches']:>10} {row['excess']:>7.2f}")
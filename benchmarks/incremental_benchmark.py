@@ -0,0 +1,100 @@
+from generator.maze_generator import maze_batch_generator
+from search_algorithms.bread_first_search import bfs_solve
+from search_algorithms.a_star_search import a_star_solve
+from search_algorithms.incremental_search import IncrementalPlanner
+import argparse
+import time
+import numpy as np
+
+
+def pick_edits(rng, maze, result, count, on_path):
+    """
+    Cells to toggle: a wall dropped on the current path (the costly case, the path has to be repaired),
+    or a random cell of the maze. The corners are left alone.
+    """
+
+    rows, cols = maze.shape
+    if on_path and result.found and result.path_length > 2:
+        cells = rng.choice(result.path[1:-1], size=min(count, result.path_length - 2), replace=False)
+        return np.column_stack(np.divmod(cells, cols))
+    nodes = np.column_stack((rng.integers(0, rows, count), rng.integers(0, cols, count)))
+    return nodes[[tuple(node) not in ((0, 0), (rows - 1, cols - 1)) for node in nodes]]
+
+
+def incremental_benchmark(dimension=300, probabilities=(0.1, 0.2, 0.3), edits=50, batch=1, seed=0):
+    """
+    Compare repairing the path with IncrementalPlanner against solving again with A* after every edit.
+
+    Every round toggles `batch` cells, alternating between walls dropped on the current path and random
+    cells, then asks both for the new shortest path.
+
+    Args:
+        dimension (int, optional): Size of the mazes. Defaults to 300.
+        probabilities (sequence of float, optional): Wall probabilities to sweep.
+        edits (int, optional): Number of edit rounds per maze. Defaults to 50.
+        batch (int, optional): Number of cells toggled per round. Defaults to 1.
+        seed (int, optional): Seed of the mazes and edits. Defaults to 0.
+
+    Returns:
+        list of dict: One row per probability with the initial solve time, the mean expanded nodes and
+                      seconds per round of both, and the number of rounds where the path lengths differ.
+    """
+
+    rng = np.random.default_rng(seed)
+    rows = []
+    for probabillity in probabilities:
+        # The first solvable maze of the batch
+        mazes = maze_batch_generator(20, dimension, probabillity, seed)
+        maze = next((maze for maze in mazes if bfs_solve(maze).found), mazes[0]).copy()
+
+        started = time.perf_counter()
+        planner = IncrementalPlanner(maze)
+        result = planner.solve()
+        initial = time.perf_counter() - started
+
+        expanded, seconds, mismatches = [[], []], [[], []], 0
+        for round in range(edits):
+            nodes = pick_edits(rng, maze, result, batch, round % 2 == 0)
+            planner.toggle(nodes)
+            for i, j in nodes:
+                maze[i, j] = 1 - maze[i, j]
+
+            started = time.perf_counter()
+            result = planner.solve()
+            seconds[0].append(time.perf_counter() - started)
+            expanded[0].append(result.expanded)
+
+            started = time.perf_counter()
+            full = a_star_solve(maze, "manhattan")
+            seconds[1].append(time.perf_counter() - started)
+            expanded[1].append(full.expanded)
+            mismatches += result.path_length != full.path_length
+
+        rows.append({
+            "probability": probabillity,
+            "initial_seconds": initial,
+            "expanded": np.mean(expanded[0]),
+            "seconds": np.mean(seconds[0]),
+            "a_star_expanded": np.mean(expanded[1]),
+            "a_star_seconds": np.mean(seconds[1]),
+            "mismatches": mismatches,
+        })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Incremental replanning (LPA*) vs solving again with A* after wall edits")
+    parser.add_argument("--dimension", type=int, default=300, help="Size of the mazes")
+    parser.add_argument("--probabilities", type=float, nargs="+", default=[0.1, 0.2, 0.3],
+                        help="Wall probabilities to sweep")
+    parser.add_argument("--edits", type=int, default=50, help="Number of edit rounds per maze")
+    parser.add_argument("--batch", type=int, default=1, help="Number of cells toggled per round")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the mazes and edits")
+    args = parser.parse_args()
+
+    print(f"{'p':>4} {'init-ms':>8} {'expanded':>9} {'ms':>8} {'a*-expanded':>12} {'a*-ms':>8} {'speedup':>8} "
+          f"{'mismatches':>10}")
+    for row in incremental_benchmark(args.dimension, args.probabilities, args.edits, args.batch, args.seed):
+        print(f"{row['probability']:>4.1f} {row['initial_seconds'] * 1e3:>8.1f} {row['expanded']:>9.0f} "
+              f"{row['seconds'] * 1e3:>8.2f} {row['a_star_expanded']:>12.0f} {row['a_star_seconds'] * 1e3:>8.2f} "
+              f"{row['a_star_seconds'] / row['seconds']:>8.1f} {row['mismatches']:>10}")
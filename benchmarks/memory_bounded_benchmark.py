@@ -0,0 +1,104 @@
+from generator.maze_generator import maze_batch_generator
+from search_algorithms.bread_first_search import bfs_solve
+from search_algorithms.a_star_search import a_star_solve
+from search_algorithms.memory_bounded_search import ida_star_solve, beam_search_solve
+from search_algorithms.instrumentation import SearchStats
+from functools import partial
+import argparse
+import time
+import numpy as np
+
+
+def configurations(table_sizes, widths, max_expanded):
+    """
+    A* as the reference, IDA* with every transposition table size and beam search with every width.
+    IDA* gives up after max_expanded expansions, as a table too small for the maze makes it exponential.
+
+    Returns:
+        dict: (solver, memory limit) pairs by label.
+    """
+
+    solvers = {"a-star": (partial(a_star_solve, h="manhattan"), None)}
+    for table_size in table_sizes:
+        ida_star = partial(ida_star_solve, table_size=table_size, max_expanded=max_expanded)
+        solvers[f"ida-star/{table_size}"] = (ida_star, table_size)
+    for width in widths:
+        solvers[f"beam-search/{width}"] = (partial(beam_search_solve, width=width), width)
+    return solvers
+
+
+def memory_bounded_benchmark(dimension=100, count=20, probabilities=(0.1, 0.2, 0.3), table_sizes=(1024, 65536),
+                             widths=(4, 16, 64), max_expanded=10**6, seed=0):
+    """
+    Compare the memory ceiling, expansions and path quality of IDA* and beam search against A*.
+
+    Only solvable mazes are used, so the found rate measures what beam search loses by pruning.
+
+    Args:
+        dimension (int, optional): Size of the mazes. Defaults to 100.
+        count (int, optional): Number of solvable mazes per wall probability. Defaults to 20.
+        probabilities (sequence of float, optional): Wall probabilities to sweep.
+        table_sizes (sequence of int, optional): IDA* transposition table sizes.
+        widths (sequence of int, optional): Beam widths.
+        max_expanded (int, optional): Expansions after which IDA* gives up. Defaults to 1000000.
+        seed (int, optional): Seed of the maze batches. Defaults to 0.
+
+    Returns:
+        list of dict: One row per (probability, solver) with the largest number of cells stored at once
+                      (stats.max_frontier, and for A* the cells given a cost), the mean expanded nodes and
+                      seconds per maze, the share of mazes solved and the mean excess of the path length over
+                      the shortest path.
+    """
+
+    rows = []
+    for probabillity in probabilities:
+        # Draw mazes until there are enough solvable ones
+        mazes = maze_batch_generator(4 * count, dimension, probabillity, seed)
+        optimal = [bfs_solve(maze) for maze in mazes]
+        solvable = [index for index, result in enumerate(optimal) if result.found][:count]
+
+        for label, (solver, limit) in configurations(table_sizes, widths, max_expanded).items():
+            stored, expanded, seconds, found, excess = 0, [], [], [], []
+            for index in solvable:
+                stats = SearchStats()
+                started = time.perf_counter()
+                result = solver(mazes[index], stats=stats)
+                seconds.append(time.perf_counter() - started)
+                # A* keeps a cost for every cell it reaches, the others report what they store
+                cells = stats.max_frontier if limit is not None else int(np.count_nonzero(result.visited))
+                stored = max(stored, cells)
+                expanded.append(result.expanded)
+                found.append(result.found)
+                if result.found:
+                    excess.append(result.path_length - optimal[index].path_length)
+            rows.append({
+                "probability": probabillity,
+                "solver": label,
+                "limit": limit,
+                "stored": stored,
+                "expanded": np.mean(expanded),
+                "seconds": np.mean(seconds),
+                "found": np.mean(found),
+                "excess": np.mean(excess) if len(excess) != 0 else float("nan"),
+            })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Memory ceiling vs expansions vs optimality of IDA* and beam search")
+    parser.add_argument("--dimension", type=int, default=100, help="Size of the mazes")
+    parser.add_argument("--count", type=int, default=20, help="Number of solvable mazes per wall probability")
+    parser.add_argument("--probabilities", type=float, nargs="+", default=[0.1, 0.2, 0.3],
+                        help="Wall probabilities to sweep")
+    parser.add_argument("--table-sizes", type=int, nargs="+", default=[1024, 65536],
+                        help="IDA* transposition table sizes")
+    parser.add_argument("--widths", type=int, nargs="+", default=[4, 16, 64], help="Beam widths")
+    parser.add_argument("--max-expanded", type=int, default=10**6, help="Expansions after which IDA* gives up")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the maze batches")
+    args = parser.parse_args()
+
+    print(f"{'p':>4} {'solver':>16} {'stored':>8} {'expanded':>10} {'ms':>8} {'found':>6} {'excess':>7}")
+    for row in memory_bounded_benchmark(args.dimension, args.count, args.probabilities, args.table_sizes,
+                                        args.widths, args.max_expanded, args.seed):
+        print(f"{row['probability']:>4.1f} {row['solver']:>16} {row['stored']:>8} {row['expanded']:>10.0f} "
+              f"{row['seconds'] * 1e3:>8.2f} {row['found']:>6.2f} {row['excess']:>7.2f}")
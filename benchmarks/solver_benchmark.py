@@ -0,0 +1,231 @@
+from generator.maze_generator import maze_batch_generator
+from search_algorithms.solvers import SOLVERS, MEMORY_BOUNDED_SOLVERS, get_solver
+from search_algorithms.heuristics import HEURISTIC_CACHE
+import argparse
+import csv
+import json
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+# Columns of a result file, one row per (dimension, probability, algorithm, maze) run
+FIELDS = ("dimension", "probability", "algorithm", "maze", "found", "path_length", "expanded", "seconds", "peak_bytes")
+
+# Metrics compared between two result files, and the ones where any increase is a regression
+METRICS = ("seconds", "peak_bytes", "expanded", "path_length")
+EXACT_METRICS = ("expanded", "path_length")
+
+# Solvers of the default sweep
+DEFAULT_ALGORITHMS = tuple(name for name in SOLVERS if name not in MEMORY_BOUNDED_SOLVERS)
+
+
+def run_once(solver, maze, memory=True):
+    """
+    Solve one maze, timing the search and, in a second run under tracemalloc, measuring its peak memory.
+
+    tracemalloc slows every allocation down, so the time comes from the untraced run. The heuristic cache
+    is cleared before both runs, so every run pays for its heuristic table: its build time is in the seconds
+    of every maze, not only the first of a group, and the table is in the peak memory.
+
+    Returns:
+        tuple: The SearchResult, the seconds taken and the peak traced bytes (-1 if memory is False).
+    """
+
+    HEURISTIC_CACHE.clear()
+    started = time.perf_counter()
+    result = solver(maze)
+    seconds = time.perf_counter() - started
+
+    peak_bytes = -1
+    if memory:
+        HEURISTIC_CACHE.clear()
+        tracemalloc.start()
+        try:
+            solver(maze)
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result, seconds, peak_bytes
+
+
+def run_benchmark(dimensions=(100, 300, 1000), probabilities=(0.1, 0.2, 0.3), algorithms=DEFAULT_ALGORITHMS,
+                  count=3, seed=0, memory=True, progress=None):
+    """
+    Sweep maze size, wall probability and algorithm over seeded mazes.
+
+    The same mazes are solved by every algorithm: the batch of a (dimension, probability) pair is drawn
+    from maze_batch_generator with the given seed.
+
+    Args:
+        dimensions (sequence of int, optional): Maze sizes to sweep.
+        probabilities (sequence of float, optional): Wall probabilities to sweep.
+        algorithms (sequence of str, optional): Names from search_algorithms.solvers.SOLVERS. Defaults to all
+                                                 but the memory-bounded ones.
+        count (int, optional): Number of mazes per (dimension, probability). Defaults to 3.
+        seed (int, optional): Seed of the maze batches. Defaults to 0.
+        memory (bool, optional): If True, also measure the peak memory of every run. Defaults to True.
+        progress (callable, optional): Called with every row as soon as it is measured.
+
+    Returns:
+        list of dict: One row per run, with the keys of FIELDS.
+    """
+
+    solvers = [(name, get_solver(name)) for name in algorithms]
+    rows = []
+    for dimension in dimensions:
+        for probabillity in probabilities:
+            mazes = maze_batch_generator(count, dimension, probabillity, seed)
+            for name, solver in solvers:
+                for index, maze in enumerate(mazes):
+                    result, seconds, peak_bytes = run_once(solver, maze, memory)
+                    row = {
+                        "dimension": dimension,
+                        "probability": probabillity,
+                        "algorithm": name,
+                        "maze": index,
+                        "found": bool(result.found),
+                        "path_length": result.path_length,
+                        "expanded": result.expanded,
+                        "seconds": seconds,
+                        "peak_bytes": peak_bytes,
+                    }
+                    rows.append(row)
+                    if progress is not None:
+                        progress(row)
+    return rows
+
+
+def write_results(rows, path):
+    """
+    Write benchmark rows to a .csv or .json file, chosen by the file extension.
+    """
+
+    with open(path, "w", newline="") as file:
+        if path.endswith(".json"):
+            json.dump(rows, file, indent=1)
+        else:
+            writer = csv.DictWriter(file, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+def read_results(path):
+    """
+    Read benchmark rows written by write_results, converting the CSV columns back to numbers.
+    """
+
+    with open(path, newline="") as file:
+        if path.endswith(".json"):
+            return json.load(file)
+        rows = list(csv.DictReader(file))
+
+    for row in rows:
+        for field in ("dimension", "maze", "path_length", "expanded", "peak_bytes"):
+            row[field] = int(row[field])
+        for field in ("probability", "seconds"):
+            row[field] = float(row[field])
+        row["found"] = row["found"] == "True"
+    return rows
+
+
+def summarize(rows):
+    """
+    Group runs by (dimension, probability, algorithm).
+
+    Returns:
+        dict: Maps every group to the median of each of METRICS over its runs.
+    """
+
+    groups = {}
+    for row in rows:
+        key = (int(row["dimension"]), float(row["probability"]), row["algorithm"])
+        groups.setdefault(key, []).append(row)
+    return {key: {metric: float(np.median([row[metric] for row in runs])) for metric in METRICS}
+            for key, runs in groups.items()}
+
+
+def compare_results(baseline, current, tolerance=0.1):
+    """
+    Flag the groups where the current results are worse than the baseline.
+
+    Time and memory are noisy, so they only count as regressions when the median grows by more than
+    `tolerance`. Expanded nodes and path length are deterministic for seeded mazes, so any increase counts.
+    Groups missing from either side are ignored.
+
+    Args:
+        baseline (list of dict): Rows of the reference run.
+        current (list of dict): Rows of the run to check.
+        tolerance (float, optional): Allowed relative growth of seconds and peak_bytes. Defaults to 0.1.
+
+    Returns:
+        list of dict: One entry per regression with the group, the metric, both medians and their ratio.
+    """
+
+    baseline, current = summarize(baseline), summarize(current)
+    regressions = []
+    for key in sorted(baseline.keys() & current.keys()):
+        for metric in METRICS:
+            before, after = baseline[key][metric], current[key][metric]
+            # Runs measured without memory report -1
+            if before < 0 or after < 0:
+                continue
+            limit = before if metric in EXACT_METRICS else before * (1 + tolerance)
+            if after > limit:
+                dimension, probabillity, algorithm = key
+                regressions.append({
+                    "dimension": dimension,
+                    "probability": probabillity,
+                    "algorithm": algorithm,
+                    "metric": metric,
+                    "baseline": before,
+                    "current": after,
+                    "ratio": after / before if before != 0 else float("inf"),
+                })
+    return regressions
+
+
+def print_row(row):
+    print(f"{row['dimension']:>6} {row['probability']:>4.2f} {row['algorithm']:>20} {row['maze']:>4} "
+          f"{row['found']:>6} {row['path_length']:>8} {row['expanded']:>10} {row['seconds'] * 1e3:>10.2f} "
+          f"{row['peak_bytes'] / 2**20:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Solver benchmark across maze size, wall density and algorithm")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the benchmark sweep and write the results")
+    run.add_argument("--dimensions", type=int, nargs="+", default=[100, 300, 1000], help="Maze sizes to sweep")
+    run.add_argument("--probabilities", type=float, nargs="+", default=[0.1, 0.2, 0.3],
+                     help="Wall probabilities to sweep")
+    run.add_argument("--algorithms", nargs="+", default=list(DEFAULT_ALGORITHMS), choices=list(SOLVERS),
+                     help="Solvers to run")
+    run.add_argument("--count", type=int, default=3, help="Number of mazes per dimension and probability")
+    run.add_argument("--seed", type=int, default=0, help="Seed of the maze batches")
+    run.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc run that measures peak memory")
+    run.add_argument("--output", default=None, help="Write the results to this .csv or .json file")
+
+    compare = commands.add_parser("compare", help="Flag regressions between two result files")
+    compare.add_argument("baseline", help="Result file of the reference run")
+    compare.add_argument("current", help="Result file of the run to check")
+    compare.add_argument("--tolerance", type=float, default=0.1,
+                         help="Allowed relative growth of time and memory before it counts as a regression")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        print(f"{'n':>6} {'p':>4} {'algorithm':>20} {'maze':>4} {'found':>6} {'length':>8} {'expanded':>10} "
+              f"{'ms':>10} {'peak MiB':>10}")
+        rows = run_benchmark(args.dimensions, args.probabilities, args.algorithms, args.count, args.seed,
+                             not args.no_memory, print_row)
+        if args.output is not None:
+            write_results(rows, args.output)
+    else:
+        regressions = compare_results(read_results(args.baseline), read_results(args.current), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION n={regression['dimension']} p={regression['probability']} "
+                  f"{regression['algorithm']} {regression['metric']}: "
+                  f"{regression['baseline']:.6g} -> {regression['current']:.6g} ({regression['ratio']:.2f}x)")
+        print(f"{len(regressions)} regressions")
+        # A non-zero exit status lets scripts fail on regressions
+        sys.exit(1 if len(regressions) != 0 else 0)
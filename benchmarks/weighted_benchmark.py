@@ -0,0 +1,67 @@
+from generator.maze_generator import maze_generator
+from search_algorithms.weighted_search import dijkstra_solve, cost_a_star_solve, QUEUES
+import argparse
+import time
+import numpy as np
+
+
+def weighted_benchmark(dimension=300, count=5, probabilities=(0.1, 0.3), max_costs=(1, 9, 50), seed=0):
+    """
+    Compare the bucket queue against heapq for Dijkstra and cost-aware A* on terrain cost grids.
+
+    Args:
+        dimension (int, optional): Size of the mazes. Defaults to 300.
+        count (int, optional): Number of mazes per (probability, max cost). Defaults to 5.
+        probabilities (sequence of float, optional): Wall probabilities to sweep.
+        max_costs (sequence of int, optional): Largest cell costs to sweep, 1 for unit costs.
+        seed (int, optional): Seed of the first maze. Defaults to 0.
+
+    Returns:
+        list of dict: One row per (probability, max cost, solver, queue) with the mean expanded cells and
+                      seconds per maze, and the number of mazes whose path cost differs from Dijkstra on heapq.
+    """
+
+    solvers = {"dijkstra": dijkstra_solve, "a-star-cost": cost_a_star_solve}
+    rows = []
+    for probabillity in probabilities:
+        for max_cost in max_costs:
+            problems = [maze_generator(dimension, probabillity, seed + k, max_cost=max_cost) for k in range(count)]
+            reference = [dijkstra_solve(maze, costs, queue="heap").cost for maze, costs in problems]
+            for name, solver in solvers.items():
+                for queue in QUEUES:
+                    expanded, seconds, mismatches = [], [], 0
+                    for (maze, costs), cost in zip(problems, reference):
+                        started = time.perf_counter()
+                        result = solver(maze, costs, queue=queue)
+                        seconds.append(time.perf_counter() - started)
+                        expanded.append(result.expanded)
+                        mismatches += result.cost != cost
+                    rows.append({
+                        "probability": probabillity,
+                        "max_cost": max_cost,
+                        "solver": name,
+                        "queue": queue,
+                        "expanded": np.mean(expanded),
+                        "seconds": np.mean(seconds),
+                        "mismatches": mismatches,
+                    })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bucket queue vs heapq for Dijkstra and A* on cost grids")
+    parser.add_argument("--dimension", type=int, default=300, help="Size of the mazes")
+    parser.add_argument("--count", type=int, default=5, help="Number of mazes per probability and max cost")
+    parser.add_argument("--probabilities", type=float, nargs="+", default=[0.1, 0.3], help="Wall probabilities to sweep")
+    parser.add_argument("--max-costs", type=int, nargs="+", default=[1, 9, 50], help="Largest cell costs to sweep")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the first maze")
+    args = parser.parse_args()
+
+    rows = weighted_benchmark(args.dimension, args.count, args.probabilities, args.max_costs, args.seed)
+    heap_seconds = {(row["probability"], row["max_cost"], row["solver"]): row["seconds"]
+                    for row in rows if row["queue"] == "heap"}
+    print(f"{'p':>4} {'cost':>5} {'solver':>12} {'queue':>7} {'expanded':>9} {'ms':>8} {'vs-heap':>8} {'mismatches':>10}")
+    for row in rows:
+        speedup = heap_seconds[(row["probability"], row["max_cost"], row["solver"])] / row["seconds"]
+        print(f"{row['probability']:>4.1f} {row['max_cost']:>5} {row['solver']:>12} {row['queue']:>7} "
+              f"{row['expanded']:>9.0f} {row['seconds'] * 1e3:>8.2f} {speedup:>8.2f} {row['mismatches']:>10}")
@@ -1,4 +1,4 @@
-import random
+from util.connected_components import label_components
 import numpy as np
 
 """
@@ -7,22 +7,121 @@ Generates a square maze of given dimension with walls placed based on the given
 Parameters:
 dimension (int): The size of the maze (dimension x dimension).
 probabillity (float): The probability of placing a wall in each cell (0 <= probability <= 1).
+seed (int | numpy.random.Generator, optional): Seed or generator used for the wall draw, so runs are reproducible.
+max_cost (int, optional): If given, also draw a terrain cost grid of integers from 1 to max_cost, for the
+                          weighted solvers in search_algorithms.weighted_search. The walls are the same as without it.
 
 Returns:
-numpy.ndarray: A 2D numpy array representing the generated maze, where 0 represents an empty cell and 1 represents a wall.
+numpy.ndarray: A 2D uint8 array representing the generated maze, where 0 represents an empty cell and 1 represents a wall.
+tuple: The maze and the (dimension, dimension) uint8 cost grid, when max_cost is given.
 """
-def maze_generator(dimension, probabillity):
+def maze_generator(dimension, probabillity, seed=None, max_cost=None):
 
-    # Initialize the maze with all empty cells
-    maze = np.zeros((dimension, dimension), dtype = int)
+    # Draw every cell of the maze at once instead of looping cell by cell.
+    # The solvers never write into the maze, so it stays the one byte per cell uint8 array of the draw.
+    rng = np.random.default_rng(seed)
+    maze = draw_walls(rng, (dimension, dimension), probabillity)
+    if max_cost is not None:
+        return maze, draw_costs(rng, (dimension, dimension), max_cost)
+    return maze
 
-    # Loop through each cell in the maze, and set it to a wall with probabillity value.
-    for i in range(dimension):
-        for j in range(dimension):
-            if random.random() <= probabillity:
-                maze[i][j] = 1
 
-    # Once the maze is generated, set the start and end points to 0    
-    maze[0][0] = 0
-    maze[dimension - 1][dimension - 1] = 0
-    return maze
\ No newline at end of file
+def maze_batch_generator(count, dimension, probabillity, seed=None, solvable=False, max_attempts=100):
+    """
+    Generate a stacked batch of square mazes in one vectorized draw.
+
+    Args:
+        count (int): Number of mazes in the batch.
+        dimension (int): The size of each maze (dimension x dimension).
+        probabillity (float): The probability of placing a wall in each cell (0 <= probability <= 1).
+        seed (int | numpy.random.Generator, optional): Seed or generator for the draw. The same seed always
+                                                       yields the same batch.
+        solvable (bool, optional): If True, mazes without a path from (0, 0) to (n-1, n-1) are redrawn until
+                                   every maze in the batch is solvable. Only the unsolvable mazes are resampled.
+        max_attempts (int, optional): Maximum number of resampling rounds in solvable mode. Defaults to 100.
+
+    Returns:
+        numpy.ndarray: A (count, dimension, dimension) uint8 array where 0 is an empty cell and 1 is a wall.
+
+    Raises:
+        ValueError: If solvable mode still has unsolvable mazes after max_attempts rounds.
+    """
+
+    rng = np.random.default_rng(seed)
+    mazes = draw_walls(rng, (count, dimension, dimension), probabillity)
+
+    if solvable:
+        # Indices of the mazes that still need to be redrawn
+        pending = np.flatnonzero(~maze_solvable(mazes))
+        attempts = 0
+        while pending.size != 0:
+            if attempts == max_attempts:
+                raise ValueError(f"{pending.size} mazes still unsolvable after {max_attempts} attempts "
+                                 f"at wall probability {probabillity}")
+            mazes[pending] = draw_walls(rng, (pending.size, dimension, dimension), probabillity)
+            pending = pending[~maze_solvable(mazes[pending])]
+            attempts += 1
+
+    return mazes
+
+
+def draw_walls(rng, shape, probabillity):
+    """
+    Draw the wall cells for one maze or a stack of mazes and clear the start and end points.
+
+    Args:
+        rng (numpy.random.Generator): Generator used for the draw.
+        shape (tuple of int): Either (n, n) for one maze or (count, n, n) for a batch.
+        probabillity (float): The probability of placing a wall in each cell.
+
+    Returns:
+        numpy.ndarray: A uint8 array of the given shape, 1 for walls and 0 for empty cells.
+    """
+
+    # float32 halves the size of the temporary draw compared to the float64 default
+    mazes = (rng.random(shape, dtype=np.float32) < probabillity).view(np.uint8)
+
+    # Once the maze is generated, set the start and end points to 0
+    mazes[..., 0, 0] = 0
+    mazes[..., -1, -1] = 0
+    return mazes
+
+
+def draw_costs(rng, shape, max_cost):
+    """
+    Draw a terrain cost grid: the integer cost of stepping into every cell, uniform from 1 to max_cost.
+
+    Args:
+        rng (numpy.random.Generator): Generator used for the draw.
+        shape (tuple of int): Either (n, n) for one maze or (count, n, n) for a batch.
+        max_cost (int): Largest cost, from 1 to 255.
+
+    Returns:
+        numpy.ndarray: A uint8 array of the given shape.
+
+    Raises:
+        ValueError: If max_cost is outside 1 to 255.
+    """
+
+    if not 1 <= max_cost <= 255:
+        raise ValueError(f"max_cost must be between 1 and 255, got {max_cost}")
+    return rng.integers(1, max_cost + 1, size=shape, dtype=np.uint8)
+
+
+def maze_solvable(mazes):
+    """
+    Check whether the bottom-right corner is reachable from the top-left corner.
+
+    The open cells of every maze in the stack are labelled by connected component in one vectorized
+    pass, and a maze is solvable when both corners carry the same label.
+
+    Args:
+        mazes (numpy.ndarray): One (n, n) maze or a (count, n, n) stack, where 1 represents a wall.
+
+    Returns:
+        bool | numpy.ndarray: True for each maze that has a path, as a scalar for a single maze.
+    """
+
+    labels = label_components(mazes)
+    solvable = (labels[..., 0, 0] != -1) & (labels[..., 0, 0] == labels[..., -1, -1])
+    return bool(solvable) if mazes.ndim == 2 else solvable
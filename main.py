@@ -1,20 +1,29 @@
-from generator.maze_generator import maze_generator
+from generator.maze_generator import maze_generator, maze_batch_generator
 from util.maze_plotter import maze_plotter
 from search_algorithms.bread_first_search import breadth_first_search
 from search_algorithms.depth_first_search import depth_first_search
 from search_algorithms.a_star_search import a_star_search
+from search_algorithms.jump_point_search import jump_point_search
+from util.batch_solver import batch_solve, ALGORITHMS
+from util.solve_pipeline import generate_mazes, solvable_mazes, run_pipeline
+from util.solve_server import serve
+from util.maze_renderer import save_result
+from util.solver_race import race, CONDITIONS
+from search_algorithms.solvers import get_solver
 import argparse
+import os
 
 
 # from search_algorithms.a_star import a_star_search
 
-def main(search_algorithm):
-    maze = maze_generator(100, 0.2)
+def main(search_algorithm, seed=None):
+    maze = maze_generator(100, 0.2, seed)
 
     if search_algorithm == "all":
         breadth_first_search(maze)
         depth_first_search(maze)
         a_star_search(maze)
+        jump_point_search(maze)
 
     if search_algorithm == "bfs":
         path = breadth_first_search(maze)
@@ -22,11 +31,87 @@ def main(search_algorithm):
         path = depth_first_search(maze)
     elif search_algorithm == "a-star":
         path = a_star_search(maze)
+    elif search_algorithm == "jps":
+        path = jump_point_search(maze)
+
+def render_main(search_algorithm, directory, scale=4, seed=None):
+    maze = maze_generator(100, 0.2, seed)
+    algorithms = ALGORITHMS if search_algorithm == "all" else (search_algorithm,)
+
+    # Solve without output and write the images directly, without matplotlib
+    os.makedirs(directory, exist_ok=True)
+    for name in algorithms:
+        result = get_solver(name)(maze)
+        path = save_result(os.path.join(directory, f"{name}-maze.png"), maze, result, scale)
+        print(f"{name}: path length {result.path_length}, written to {path}")
+
+def race_main(search_algorithm, until, seed=None):
+    maze = maze_generator(100, 0.2, seed)
+    algorithms = ALGORITHMS if search_algorithm == "all" else (search_algorithm,)
+    outcome = race(maze, algorithms, until)
+
+    # Print one line per solver, in the order they finished
+    for name, result in outcome.results.items():
+        marker = " (winner)" if name == outcome.winner else ""
+        print(f"{name}: path length {result.path_length}, expanded {result.expanded}, "
+              f"{outcome.seconds[name] * 1e3:.1f} ms{marker}")
+    for name, error in outcome.errors.items():
+        print(f"{name}: failed, {error}")
+    for name in outcome.cancelled:
+        print(f"{name}: cancelled")
+
+def batch_main(search_algorithm, count, workers=None, seed=None, skip_unsolvable=False):
+    mazes = maze_batch_generator(count, 100, 0.2, seed)
+    algorithms = ALGORITHMS if search_algorithm == "all" else (search_algorithm,)
+    results = batch_solve(mazes, algorithms, workers=workers, skip_unsolvable=skip_unsolvable)
+
+    # Print one summary line per algorithm
+    for name in algorithms:
+        rows = results[results["algorithm"] == ALGORITHMS.index(name)]
+        print(f"{name}: {rows['found'].sum()}/{len(rows)} solved, "
+              f"mean expanded {rows['expanded'].mean():.1f}, total time {rows['seconds'].sum():.3f}s")
+
+def stream_main(search_algorithm, count, workers=None, seed=None, skip_unsolvable=False):
+    mazes = generate_mazes(count, 100, 0.2, seed)
+    if skip_unsolvable:
+        mazes = solvable_mazes(mazes)
+    algorithms = ALGORITHMS if search_algorithm == "all" else (search_algorithm,)
+    summaries = run_pipeline(mazes, algorithms, workers=workers)
+
+    # Print one summary line per algorithm
+    for summary in summaries.values():
+        stats = summary.as_dict()
+        length, expanded = stats["path_length"], stats["expanded"]
+        print(f"{summary.algorithm}: {summary.solved}/{summary.mazes} solved, "
+              f"path length mean {length['mean']:.1f} p50 {length['p50']} p99 {length['p99']}, "
+              f"expanded mean {expanded['mean']:.1f} p99 {expanded['p99']}")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Maze Search Algorithm")
-    parser.add_argument("--algorithm", required=True, choices=["bfs", "dfs", "a-star", "all"], help="Search algorithm to use")
+    parser.add_argument("--algorithm", required=True, choices=["bfs", "dfs", "a-star", "jps", "all"], help="Search algorithm to use")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the maze generator, for reproducible runs")
+    parser.add_argument("--batch", type=int, default=None, help="Solve this many mazes over a process pool instead of one")
+    parser.add_argument("--stream", type=int, default=None, help="Generate, solve and summarize this many mazes as a stream, in constant memory")
+    parser.add_argument("--serve", default=None, metavar="SOCKET", help="Serve JSON-line solve requests on this unix socket, or - for stdin/stdout, with the algorithm as the default solver")
+    parser.add_argument("--render", default=None, metavar="DIR", help="Write the solved maze as a PNG to this directory instead of plotting it with matplotlib")
+    parser.add_argument("--scale", type=int, default=4, help="Pixels per cell of the images written by --render")
+    parser.add_argument("--race", default=None, choices=CONDITIONS, help="Run the algorithms at the same time in separate processes and stop at the first result, the first path found, the first optimal path, or when all are done")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes in batch, stream and serve mode")
+    parser.add_argument("--skip-unsolvable", action="store_true", help="In batch mode, answer unsolvable mazes from a connected-component index without searching. In stream mode, drop them before solving")
     args = parser.parse_args()
 
     search_algorithm = args.algorithm
-    main(search_algorithm)
\ No newline at end of file
+    if args.serve is not None:
+        if search_algorithm == "all":
+            parser.error("--serve needs a single --algorithm, the default of requests that name none")
+        serve(args.serve, args.workers, default_algorithm=search_algorithm)
+    elif args.stream is not None:
+        stream_main(search_algorithm, args.stream, args.workers, args.seed, args.skip_unsolvable)
+    elif args.batch is not None:
+        batch_main(search_algorithm, args.batch, args.workers, args.seed, args.skip_unsolvable)
+    elif args.race is not None:
+        race_main(search_algorithm, args.race, args.seed)
+    elif args.render is not None:
+        render_main(search_algorithm, args.render, args.scale, args.seed)
+    else:
+        main(search_algorithm, args.seed)
\ No newline at end of file
@@ -1,61 +1,11 @@
-from util.maze_plotter import maze_plotter
-from util.traversable_neighbors import traversable_neighbors
-import math
+from search_algorithms.search_core import as_search_grid, fast_view, unreachable_result, UNREACHED
+from search_algorithms.heuristics import heuristic_table, grid_heuristic
+import itertools
 import numpy as np
 import heapq
 
-
-def a_star_path(a_star_maze, cur_node, a_star_parent):
-    """
-    Trace the path from the goal node to the start node using the A* search algorithm and mark the path in the maze.
-
-    Args:
-        a_star_maze (numpy.ndarray): The maze represented as a 2D numpy array where each cell can be a wall, open space, or part of the path.
-        cur_node (tuple): The current node (goal node) represented as a tuple of (row, column).
-        a_star_parent (list of list of tuples): A 2D list where each element is a tuple representing the parent node of the corresponding cell in the maze.
-
-    Returns:
-        None: This function modifies the maze in place and does not return any value.
-
-    Side Effects:
-        - Modifies the input maze to mark the path from the start node to the goal node with -2.
-        - Prints the length of the path.
-        - Calls the maze_plotter function to visualize the maze with the path.
-
-    Example:
-        a_star_path(maze, (4, 4), parent_nodes)
-    """
-
-    # Mark the goal node in the maze with -2
-    a_star_maze[len(a_star_maze)-1, len(a_star_maze)-1] = -2
-
-    # Initialize the path length count (including the start and goal nodes)
-    path_length = 2
-
-    # Set the temporary node to the current node (goal node)
-    temp_node = cur_node
-
-     # Trace back from the goal node to the start node
-    while temp_node != (0,0):
-
-        # Mark the current node in the maze with -2
-        a_star_maze[temp_node] = -2
-
-        # Get the row and column of the current node
-        (i,j) = temp_node
-
-        # Move to the parent node
-        temp_node = a_star_parent[i][j]
-
-        # Increment the path length
-        path_length += 1
-
-    # Mark the start node in the maze with -2    
-    a_star_maze[0,0] = -2
-
-    # Visualize the maze with the path
-    maze_plotter(a_star_maze, "a-star", path_length)
-    return
+# Orders accepted by a_star_solve for cells with equal f
+TIE_BREAKS = ("high-g", "low-g", "fifo")
 
 
 def euclidean_distance(a_star_maze):
@@ -67,24 +17,15 @@ def euclidean_distance(a_star_maze):
     from a given cell to the goal.
 
     Args:
-        a_star_maze (list of list of int): A 2D list representing the maze where each element is a cell.
+        a_star_maze (numpy.ndarray): A 2D array representing the maze where each element is a cell.
 
     Returns:
         np.ndarray: A 2D numpy array where each element represents the Euclidean distance from the corresponding cell
                     in the maze to the bottom-right corner of the maze.
     """
 
-    # Initialize a 2D numpy array with zeros to store the Euclidean distances
-    euclid_heuristic = np.zeros((len(a_star_maze), len(a_star_maze)))
-
-    # Coordinates of the bottom-right corner of the maze
-    (x, y) = (len(a_star_maze)-1, len(a_star_maze)-1)
-
-    # Calculate the Euclidean distance for each cell in the maze
-    for i in range(len(a_star_maze)):
-        for j in range(len(a_star_maze)):
-            euclid_heuristic[i,j] = math.sqrt(math.pow((x - i), 2)+ math.pow((y-j),2))
-    return euclid_heuristic
+    (rows, cols) = np.shape(a_star_maze)
+    return heuristic_table((rows, cols), (rows-1, cols-1), "euclid")
 
 
 def manhattan_distance(a_star_maze):
@@ -97,104 +38,157 @@ def manhattan_distance(a_star_maze):
     bottom-right corner of the maze.
 
     Parameters:
-    a_star_maze (list of list of int): The maze represented as a 2D list.
+    a_star_maze (numpy.ndarray): The maze represented as a 2D array.
 
     Returns:
     numpy.ndarray: A 2D array where each element is the Manhattan distance 
     from that point to the bottom-right corner of the maze.
     """
 
-    # Initialize a 2D numpy array with zeros to store the Manhattan distances
-    manhattan_heuristic = np.zeros((len(a_star_maze), len(a_star_maze)), dtype = int)
+    (rows, cols) = np.shape(a_star_maze)
+    return heuristic_table((rows, cols), (rows-1, cols-1), "manhattan")
 
-    # Coordinates of the bottom-right corner of the maze
-    (x, y) = (len(a_star_maze)-1, len(a_star_maze)-1)
 
-    # Calculate the Manhattan distance for each cell in the maze
-    for i in range(len(a_star_maze)):
-        for j in range(len(a_star_maze)):
-            manhattan_heuristic[i,j] = abs(x-i)+abs(y-j)
-    return manhattan_heuristic
+def a_star_solve(a_star_maze, h="euclid", lazy=None, components=None, source=None, destination=None,
+                 tie_break="high-g", stats=None):
+    """
+    Perform A* search algorithm on a given maze, without any output.
 
+    Every reached cell keeps its best known cost g. A neighbor is pushed with f = g + 1 + h whenever
+    this improves its g, and entries left behind by such improvements are skipped when popped, so
+    the path is optimal for the (consistent) heuristics in search_algorithms.heuristics.
 
-def a_star_search(a_star_maze, h="euclid", display=True):
-    """
-    Perform A* search algorithm on a given maze.
     Args:
-        a_star_maze (list of list of int): The maze to be solved, represented as a 2D list.
-        h (str, optional): The heuristic to be used for the search. 
-                           "euclid" for Euclidean distance, "manhattan" for Manhattan distance. 
-                           Defaults to "euclid".
-        display (bool, optional): If True, display the result of the search. Defaults to True.
+        a_star_maze (numpy.ndarray): The maze to be solved, represented as a 2D array where 1 is a wall.
+                                     The maze is not modified.
+        h (str, optional): The heuristic to be used for the search, one of "euclid", "manhattan",
+                           "octile" or "chebyshev". Defaults to "euclid".
+        lazy (bool, optional): True to compute the heuristic on demand instead of using a cached table.
+                               By default the table is used whenever it fits in the heuristic cache.
+        components (ComponentIndex, optional): Connected-component index of the maze. When given and the
+                                               destination is in another component, no search is run.
+        source (tuple of int, optional): The (row, column) start node, the top-left corner by default.
+        destination (tuple of int, optional): The (row, column) goal node, the bottom-right corner by default.
+        tie_break (str, optional): Order of cells with equal f, one of TIE_BREAKS. "high-g" prefers the cell
+                                   furthest from the source, which dives towards the goal and expands the
+                                   fewest cells. "low-g" prefers the closest one, "fifo" the first pushed.
+                                   Defaults to "high-g".
+        stats (SearchStats, optional): Counters and phase timers the search reports into. Nothing is
+                                       counted when it is None.
     Returns:
-        int: 1 if a path is found, 0 otherwise.
+        SearchResult: The path, its length, the number of expanded nodes and the mask of reached cells.
     """
 
-    # Create a copy of the maze to avoid modifying the original input
-    a_star_maze=a_star_maze.copy()
-    source, destination = (0,0), (len(a_star_maze)-1, len(a_star_maze)-1)
-    
-    # Check if the heuristic is Euclidean or Manhattan
-    if h=="euclid":
-        heuristic = euclidean_distance(a_star_maze)
-    else:
-        heuristic = manhattan_distance(a_star_maze)
-
-    # Initialize the source node with a value of -1
-    a_star_maze[source] = -1
-
-    # Initialize the parent list to store the parent-child relationships
-    a_star_parent = [[None for _ in range(len(a_star_maze))] for _ in range(len(a_star_maze))]
+    if tie_break not in TIE_BREAKS:
+        raise ValueError(f"unknown tie_break {tie_break!r}, expected one of {TIE_BREAKS}")
+
+    # The component index answers unreachable queries without searching
+    unreachable = unreachable_result("a-star", a_star_maze, components, source, destination)
+    if unreachable is not None:
+        return unreachable
+
+    # Counters and phase timers are only touched when stats are collected
+    counting = stats is not None
+    if counting:
+        stats.start()
+
+    grid = as_search_grid(a_star_maze)
+    source, destination = grid.endpoints(source, destination)
+    if counting:
+        stats.lap("setup")
+
+    # Heuristic values indexed by the same flat cell index, shared with earlier searches of the same size
+    heuristic = grid_heuristic(grid, grid.node(destination), h, lazy)
+    if counting:
+        stats.lap("heuristic")
+
+    # Flat parent array, best known costs and the bitmap of expanded cells.
+    # The memoryviews are used in the loop, they are much faster to index than the arrays.
+    a_star_parent, a_star_closed = grid.new_parents(), grid.new_visited()
+    a_star_cost = np.full(grid.size, UNREACHED, dtype=np.int32)
+    parents, closed, g_costs = memoryview(a_star_parent), fast_view(a_star_closed), memoryview(a_star_cost)
+    walls, offsets = grid.cells, grid.offsets
+
+    # Heap entries are (f, tie, g, node): the tie value orders cells with equal f. It is -g or g,
+    # or for "fifo" (order 0) the number of earlier pushes.
+    order = {"high-g": -1, "low-g": 1, "fifo": 0}[tie_break]
+    pushes = itertools.count(1)
 
     # Initialize the A* priority queue with the source node
-    a_star_p_queue = []
-    heapq.heappush(a_star_p_queue, (heuristic[source],0,source))
+    g_costs[source] = 0
+    a_star_p_queue = [(heuristic[source], 0, 0, source)]
     path_found = 0
 
+    # Number of nodes popped from the priority queue and expanded, and with stats, all pops and the largest heap seen
+    expanded, pops, max_frontier = 0, 0, 0
+    if counting:
+        stats.lap("setup")
+
     # Continue A* search until the priority queue is empty or the path is found
-    while len(a_star_p_queue) != 0 and path_found == 0:
+    while len(a_star_p_queue) != 0:
 
-        # Pop the node with the lowest cost from the priority queue
-        cur_heuristic, cur_cost, cur_node = heapq.heappop(a_star_p_queue)
+        if counting:
+            pops += 1
+            max_frontier = max(max_frontier, len(a_star_p_queue))
 
-        # Mark the current node as visited (-2)
-        a_star_maze[cur_node] = -2
+        # Pop the node with the lowest f from the priority queue
+        _, _, cur_cost, cur_node = heapq.heappop(a_star_p_queue)
 
-        # Check if the current node is the destination
-        if(cur_node == destination):
+        # Skip entries superseded by a cheaper push of the same cell
+        if closed[cur_node] or cur_cost != g_costs[cur_node]:
+            continue
+        closed[cur_node] = 1
+        expanded += 1
 
+        # Check if the current node is the destination
+        if cur_node == destination:
             # Set the path_found flag to True
             path_found = 1
-            a_star_maze[cur_node] = -1
-            a_star_maze[destination] = -2
-
-            # If the display flag is True, print the path and visualize the maze
-            if display:
-                print("Path Found!!!!")
-                a_star_path(a_star_maze, cur_node, a_star_parent)
-            return 1
-        
-        # Get all valid neighbors that can be traversed
-        neighbors = traversable_neighbors(a_star_maze, cur_node)
-
-        # Iterate through the neighbors to continue the A* search
-        if len(neighbors) != 0:
-            # Iterate through the neighbors
-            for node in neighbors:
-                (i,j) = node
-                # Check if the neighbor hasn't been visited
-                if a_star_parent[i][j] == None:
-                    # Mark the parent of the neighbor and add it to the priority queue
-                    a_star_parent[i][j] = cur_node
-                    heapq.heappush(a_star_p_queue, ((heuristic[i,j])+cur_cost,cur_cost+1,node))
-
-        # Mark the current node as visited (-1)
-        a_star_maze[cur_node] = -1
-
-    # If the loop completes without finding a path, return 0
-    if(path_found == 0):
-        a_star_maze[source] = -2
-        if display:
-            print("No Path found :(")
-            maze_plotter(a_star_maze, "a-star")
-        return 0
\ No newline at end of file
+            break
+
+        # Iterate through the four neighbors, the wall border of the grid keeps them in bounds
+        next_cost = cur_cost + 1
+        for offset in offsets:
+            node = cur_node + offset
+            # Only open cells whose best known cost improves are (re)pushed
+            if walls[node] or next_cost >= g_costs[node]:
+                continue
+            g_costs[node] = next_cost
+            parents[node] = cur_node
+            tie = order * next_cost if order else next(pushes)
+            heapq.heappush(a_star_p_queue, (heuristic[node] + next_cost, tie, next_cost, node))
+
+    if counting:
+        stats.lap("search")
+
+    reached = (a_star_cost != UNREACHED).view(np.uint8)
+    result = grid.make_result("a-star", path_found, parents, reached, source, destination, expanded)
+
+    if counting:
+        stats.lap("reconstruction")
+        # The destination is expanded without looking at its neighbors
+        stats.record(expanded, len(offsets) * (expanded - path_found), pops + len(a_star_p_queue), pops, max_frontier)
+    return result
+
+
+def a_star_search(a_star_maze, h="euclid", display=True):
+    """
+    Solve the maze with A* and optionally plot the explored maze and the path.
+    Args:
+        a_star_maze (numpy.ndarray): The maze to be solved, represented as a 2D array where 1 is a wall.
+        h (str, optional): The heuristic to be used for the search, one of "euclid", "manhattan",
+                           "octile" or "chebyshev". Defaults to "euclid".
+        display (bool, optional): If True, display the result of the search. Defaults to True.
+                                  matplotlib is only imported in that case.
+    Returns:
+        int: 1 if a path is found, 0 otherwise.
+    """
+
+    result = a_star_solve(a_star_maze, h)
+
+    # If the display flag is True, print the path and visualize the maze
+    if display:
+        from util.maze_plotter import plot_result
+        print("Path Found!!!!" if result.found else "No Path found :(")
+        plot_result(a_star_maze, result)
+    return int(result.found)
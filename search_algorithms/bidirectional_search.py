@@ -0,0 +1,204 @@
+from search_algorithms.search_core import as_search_grid, fast_view, unreachable_result, UNREACHED
+from search_algorithms.heuristics import grid_heuristic
+import numpy as np
+import heapq
+
+
+def bidirectional_path(grid, forward_parent, backward_parent, source, destination, forward_cell, backward_cell):
+    """
+    Join the two halves of a bidirectional search into one path from the source to the destination.
+
+    Args:
+        grid (SearchGrid): The grid that was searched.
+        forward_parent (memoryview): Parents of the search started at the source.
+        backward_parent (memoryview): Parents of the search started at the destination.
+        source (int): Flat index of the start cell.
+        destination (int): Flat index of the goal cell.
+        forward_cell (int): Last cell of the forward half.
+        backward_cell (int): First cell of the backward half. It is either next to forward_cell or the same cell,
+                             in which case it is only included once.
+
+    Returns:
+        numpy.ndarray: Flat indices of the path, from the source to the destination.
+    """
+
+    forward = grid.trace_path(forward_parent, source, forward_cell)
+    backward = grid.trace_path(backward_parent, destination, backward_cell)[::-1]
+    if backward_cell == forward_cell:
+        backward = backward[1:]
+    return np.concatenate([forward, backward])
+
+
+def bidirectional_bfs_solve(bfs_maze, components=None, source=None, destination=None):
+    """
+    Breadth-First Search run from both the source (top-left) and the destination (bottom-right) until
+    the two searches meet, which expands far fewer cells than a single BFS on open mazes.
+
+    Each step expands one full level of the smaller frontier. When the frontiers first touch, the rest
+    of that level is still expanded and the shortest of the meeting paths is kept, so the path is a
+    shortest path like the one found by bfs_solve.
+
+    Args:
+        bfs_maze (numpy.ndarray): The maze as a 2D array where 1 represents a wall. It is not modified.
+        components (ComponentIndex, optional): Connected-component index of the maze. When given and the
+                                               destination is in another component, no search is run.
+        source (tuple of int, optional): The (row, column) start node, the top-left corner by default.
+        destination (tuple of int, optional): The (row, column) goal node, the bottom-right corner by default.
+
+    Returns:
+        SearchResult: The path, its length, the number of expanded nodes over both directions and the visited mask.
+    """
+
+    # The component index answers unreachable queries without searching
+    unreachable = unreachable_result("bidirectional-bfs", bfs_maze, components, source, destination)
+    if unreachable is not None:
+        return unreachable
+
+    grid = as_search_grid(bfs_maze)
+    source, destination = grid.endpoints(source, destination)
+
+    # Each reached cell belongs to one side (1 = forward, 2 = backward) and has a depth from that side's start
+    forward_parent, backward_parent = grid.new_parents(), grid.new_parents()
+    side_array, depth_array = np.zeros(grid.size, dtype=np.uint8), np.zeros(grid.size, dtype=np.int32)
+    parents = (memoryview(forward_parent), memoryview(backward_parent))
+    sides, depths = memoryview(side_array), memoryview(depth_array)
+    walls, offsets = grid.cells, grid.offsets
+
+    sides[source], sides[destination] = 1, 2
+    frontiers = ([source], [destination])
+    expanded = 0
+
+    # Best meeting edge as (forward cell, backward cell), and the number of edges of its path
+    meeting, best_length = None, UNREACHED
+    if source == destination:
+        meeting = (source, source)
+
+    while meeting is None and len(frontiers[0]) != 0 and len(frontiers[1]) != 0:
+
+        # Grow the side with the smaller frontier by one full level
+        this = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        this_side, other_side, this_parent = this + 1, 2 - this, parents[this]
+        next_frontier = []
+
+        for cur_node in frontiers[this]:
+            expanded += 1
+            next_depth = depths[cur_node] + 1
+            for offset in offsets:
+                node = cur_node + offset
+                if walls[node]:
+                    continue
+                side = sides[node]
+                if side == 0:
+                    sides[node] = this_side
+                    this_parent[node] = cur_node
+                    depths[node] = next_depth
+                    next_frontier.append(node)
+                elif side == other_side and next_depth + depths[node] < best_length:
+                    # The two searches touch, remember the shortest meeting edge of this level
+                    best_length = next_depth + depths[node]
+                    meeting = (cur_node, node) if this == 0 else (node, cur_node)
+
+        frontiers = (next_frontier, frontiers[1]) if this == 0 else (frontiers[0], next_frontier)
+
+    visited = (side_array != 0).view(np.uint8)
+    if meeting is None:
+        return grid.path_result("bidirectional-bfs", np.zeros(0, dtype=np.int32), visited, expanded)
+    path = bidirectional_path(grid, parents[0], parents[1], source, destination, *meeting)
+    return grid.path_result("bidirectional-bfs", path, visited, expanded)
+
+
+def bidirectional_a_star_solve(a_star_maze, h="euclid", lazy=None, components=None, source=None, destination=None):
+    """
+    A* search run from both the source (top-left) and the destination (bottom-right) at once.
+
+    Both searches use the average potential p(v) = (h_dest(v) - h_source(v)) / 2, the forward search with
+    key g + p and the backward search with key g - p. This keeps the two searches consistent with each other,
+    so they can stop as soon as the smallest forward key plus the smallest backward key reaches the cost of
+    the best joined path found so far, and that path is optimal for the consistent heuristics in
+    search_algorithms.heuristics. Stale heap entries are skipped instead of being removed.
+
+    Args:
+        a_star_maze (numpy.ndarray): The maze as a 2D array where 1 represents a wall. It is not modified.
+        h (str, optional): The heuristic, one of "euclid", "manhattan", "octile" or "chebyshev".
+                           Defaults to "euclid".
+        lazy (bool, optional): True to compute the heuristic on demand instead of using cached tables.
+        components (ComponentIndex, optional): Connected-component index of the maze. When given and the
+                                               destination is in another component, no search is run.
+        source (tuple of int, optional): The (row, column) start node, the top-left corner by default.
+        destination (tuple of int, optional): The (row, column) goal node, the bottom-right corner by default.
+
+    Returns:
+        SearchResult: The path, its length, the number of expanded nodes over both directions and the visited mask.
+    """
+
+    # The component index answers unreachable queries without searching
+    unreachable = unreachable_result("bidirectional-a-star", a_star_maze, components, source, destination)
+    if unreachable is not None:
+        return unreachable
+
+    grid = as_search_grid(a_star_maze)
+    source, destination = grid.endpoints(source, destination)
+
+    # Estimates of the distance to the destination and to the source
+    to_destination = grid_heuristic(grid, grid.node(destination), h, lazy)
+    to_source = grid_heuristic(grid, grid.node(source), h, lazy)
+
+    g_arrays = (np.full(grid.size, UNREACHED, dtype=np.int32), np.full(grid.size, UNREACHED, dtype=np.int32))
+    closed_arrays = (grid.new_visited(), grid.new_visited())
+    parent_arrays = (grid.new_parents(), grid.new_parents())
+    g_costs = tuple(memoryview(g) for g in g_arrays)
+    closed = tuple(fast_view(c) for c in closed_arrays)
+    parents = tuple(memoryview(p) for p in parent_arrays)
+    walls, offsets = grid.cells, grid.offsets
+
+    # Open lists hold (key, -g, node), so ties in key go to the cell furthest from its start
+    g_costs[0][source], g_costs[1][destination] = 0, 0
+    open_lists = ([((to_destination[source] - to_source[source]) / 2, 0, source)],
+                  [((to_source[destination] - to_destination[destination]) / 2, 0, destination)])
+
+    # Cost of the best joined path so far and the cell where the two halves meet
+    best_cost, meeting = (0, source) if source == destination else (UNREACHED, -1)
+    expanded = 0
+
+    while len(open_lists[0]) != 0 and len(open_lists[1]) != 0:
+
+        # No unexpanded cell on either side can lead to a cheaper path
+        if open_lists[0][0][0] + open_lists[1][0][0] >= best_cost:
+            break
+
+        # Expand the side with the smaller open list
+        this = 0 if len(open_lists[0]) <= len(open_lists[1]) else 1
+        this_open, this_g, other_g = open_lists[this], g_costs[this], g_costs[1 - this]
+        this_closed, this_parent = closed[this], parents[this]
+
+        # The forward potential is (h_dest - h_source) / 2 and the backward one its opposite
+        ahead, behind = (to_destination, to_source) if this == 0 else (to_source, to_destination)
+
+        _, neg_cost, cur_node = heapq.heappop(this_open)
+        cur_cost = -neg_cost
+
+        # Skip entries left behind by a later, cheaper push of the same cell
+        if this_closed[cur_node] or cur_cost != this_g[cur_node]:
+            continue
+        this_closed[cur_node] = 1
+        expanded += 1
+
+        next_cost = cur_cost + 1
+        for offset in offsets:
+            node = cur_node + offset
+            if walls[node] or next_cost >= this_g[node]:
+                continue
+            this_g[node] = next_cost
+            this_parent[node] = cur_node
+            heapq.heappush(this_open, (next_cost + (ahead[node] - behind[node]) / 2, -next_cost, node))
+
+            # The other side has reached this cell too, try the joined path
+            if other_g[node] != UNREACHED and next_cost + other_g[node] < best_cost:
+                best_cost = next_cost + other_g[node]
+                meeting = node
+
+    visited = ((g_arrays[0] != UNREACHED) | (g_arrays[1] != UNREACHED)).view(np.uint8)
+    if meeting == -1:
+        return grid.path_result("bidirectional-a-star", np.zeros(0, dtype=np.int32), visited, expanded)
+    path = bidirectional_path(grid, parents[0], parents[1], source, destination, meeting, meeting)
+    return grid.path_result("bidirectional-a-star", path, visited, expanded)
@@ -1,139 +1,215 @@
-import matplotlib.pyplot as plt
-from util.maze_plotter import maze_plotter
-from util.traversable_neighbors import traversable_neighbors
-import numpy as np
+from search_algorithms.search_core import as_search_grid, fast_view, unreachable_result, as_nodes, \
+    gather_flags, scatter_flags
 from collections import deque
+import numpy as np
 
-def bfs_path(bfs_maze, cur_node, bfs_parent):
-    """
-    Traces back and marks the shortest path from the destination node to the source node 
-    in a BFS (Breadth-First Search) explored maze and visualizes the result.
-
-    Parameters:
-    bfs_maze (ndarray): An n x n matrix representing the maze, where different values 
-                        indicate walls, open paths, or visited cells.
-    cur_node (tuple): The coordinates (row, col) of the last node reached before 
-                      finding the destination.
-    bfs_parent (list of list of tuples): A matrix of the same dimensions as bfs_maze 
-                                         that stores the parent (previous node) 
-                                         of each cell in the shortest path.
 
-    Functionality:
-    - Marks the start and destination nodes distinctly.
-    - Traces back from the destination to the source using bfs_parent.
-    - Counts and prints the path length.
-    - Visualizes the marked path.
+def expand_levels(grid, source_cells, targets, bfs_parent, bfs_visited):
+    """
+    Level-synchronous BFS: expand the whole frontier at once with NumPy instead of one cell per loop.
+
+    The neighbors of the frontier are listed frontier cell by frontier cell, each in the left, up, down,
+    right order of `offsets`, which is the order the queue-based loop discovers them in. A new cell keeps
+    only its discovery by the earliest frontier cell next to it, found by looking up the frontier rank of
+    its four neighbors, so it gets the same parent, and the next frontier the same order, as with the queue.
+    When a destination is found the level is cut at the cell that discovered it, so the path, the expanded
+    count and the visited cells all match the queue-based search.
+
+    Args:
+        grid (SearchGrid): The grid to search.
+        source_cells (list of int): Flat indices of the distinct start cells, already marked as visited.
+        targets (set of int): Flat indices of the goal cells.
+        bfs_parent (numpy.ndarray): Parent array, filled in place.
+        bfs_visited (numpy.ndarray | Bitset): Visited flags, filled in place.
 
     Returns:
-    None
+        tuple: The destination reached (-1 if none), the number of expanded cells and the largest level.
     """
 
-    # Mark the destination node with a special identifier (-2) to highlight it in the visualization.
-    bfs_maze[len(bfs_maze)-1, len(bfs_maze)-1] = -2
+    offsets = np.array(grid.offsets, dtype=grid.index_dtype)
+    target_cells = np.array(sorted(targets), dtype=grid.index_dtype)
+    frontier = np.array(source_cells, dtype=grid.index_dtype)
+
+    # Position of every frontier cell in the frontier, and the size of the grid for the other cells
+    rank = np.full(grid.size, grid.size, dtype=grid.index_dtype)
+    expanded, largest = 0, 0
+
+    while len(frontier) != 0:
+        largest = max(largest, len(frontier))
+        rank[frontier] = np.arange(len(frontier), dtype=grid.index_dtype)
+
+        # Neighbors in queue discovery order, keeping the open and unvisited ones and the frontier cell of each
+        candidates = (frontier[:, None] + offsets).reshape(-1)
+        positions = np.flatnonzero((gather_flags(grid.walls, candidates) == 0)
+                                   & (gather_flags(bfs_visited, candidates) == 0))
+        cells, owners = candidates[positions], positions // len(offsets)
+
+        # A cell next to several frontier cells is discovered by the first of them only
+        first = rank[cells + offsets[0]]
+        for offset in offsets[1:]:
+            np.minimum(first, rank[cells + offset], out=first)
+        kept = owners == first
+        cells, owners = cells[kept], owners[kept]
+        rank[frontier] = grid.size
+
+        # Stop right after the frontier cell that discovers the first destination
+        if len(target_cells) == 1:
+            hits = np.flatnonzero(cells == target_cells[0])
+        else:
+            hits = np.flatnonzero(np.isin(cells, target_cells))
+        if len(hits) != 0:
+            cells, owners = cells[:hits[0] + 1], owners[:hits[0] + 1]
+            expanded += int(owners[-1]) + 1
+        else:
+            expanded += len(frontier)
+
+        bfs_parent[cells] = frontier[owners]
+        scatter_flags(bfs_visited, cells)
+        if len(hits) != 0:
+            return int(cells[-1]), expanded, largest
+        frontier = cells
+
+    return -1, expanded, largest
+
+
+def bfs_solve(bfs_maze, components=None, sources=None, destinations=None, stats=None, vectorized=False):
+    """
+    Performs Breadth-First Search (BFS) to find the shortest path from the source
+    (top-left by default) to the destination (bottom-right by default) in a given maze,
+    without any output.
 
-    # Mark the source node with the same identifier to differentiate it in the visualization.
-    bfs_maze[0,0] = -2
+    Parameters:
+    bfs_maze (ndarray): An n x n matrix representing the maze, where 1 represents a wall.
+                        The maze is not modified.
+    components (ComponentIndex, optional): Connected-component index of the maze. When given and the
+                                           destination is in another component, no search is run.
+    sources (tuple | list of tuple, optional): A (row, col) start node or a list of them. The search
+                                               starts from all of them at once.
+    destinations (tuple | list of tuple, optional): A (row, col) goal node or a list of them. The search
+                                                    stops at the first one reached, which is the nearest.
+    stats (SearchStats, optional): Counters and phase timers the search reports into. Nothing is
+                                   counted when it is None. In vectorized mode max_frontier is the largest level.
+    vectorized (bool, optional): If True, expand a whole BFS level per step with NumPy (expand_levels)
+                                 instead of one cell per loop. Same path, expanded count and visited cells,
+                                 much faster on large open mazes. Defaults to False.
 
-    # Initialize path length count (including the source and destination).
-    path_length = 2
-    temp_node = cur_node # Start backtracking from the destination node.
+    Functionality:
+    - Implements BFS using a queue of flat cell indices to explore the shortest path.
+    - Tracks visited cells in a uint8 bitmap and parents in an int32 array to reconstruct the path.
 
-    # Trace the path backward from the destination node to the source node.
-    while temp_node != (0,0):
+    Returns:
+    SearchResult: The path, its length, the number of expanded nodes and the visited mask.
+    """
 
-        # Mark the current node as part of the shortest path.
-        bfs_maze[temp_node] = -2
-        (i,j) = temp_node
+    # The component index answers unreachable queries without searching
+    unreachable = unreachable_result("bfs", bfs_maze, components, sources, destinations)
+    if unreachable is not None:
+        return unreachable
+
+    # Counters and phase timers are only touched when stats are collected
+    counting = stats is not None
+    if counting:
+        stats.start()
+
+    grid = as_search_grid(bfs_maze)
+
+    # Define the sources (starting points) and destinations (goals).
+    source_nodes = as_nodes((0,0) if sources is None else sources)
+    destination_nodes = as_nodes((grid.rows-1, grid.cols-1) if destinations is None else destinations)
+    source_cells = list(dict.fromkeys(grid.endpoints(node, node)[0] for node in source_nodes))
+    targets = {grid.endpoints(node, node)[0] for node in destination_nodes}
+
+    # Flat parent array for reconstructing the path, and the visited bitmap.
+    # The memoryviews are used in the loop, they are much faster to index than the arrays.
+    bfs_parent, bfs_visited = grid.new_parents(), grid.new_visited()
+    parents, visited = memoryview(bfs_parent), fast_view(bfs_visited)
+    walls, offsets = grid.cells, grid.offsets
+
+    # Initialize the BFS queue with the source nodes and mark them as visited.
+    bfs_queue = deque(source_cells)
+    for source in source_cells:
+        visited[source] = 1
+
+    # The destination reached, if any. A source may already be one of the destinations.
+    destination = next((source for source in source_cells if source in targets), -1)
+    pathFound = int(destination != -1)
+
+    # Number of nodes taken off the queue and expanded, and the largest queue seen.
+    expanded, max_frontier = 0, 0
+    if counting:
+        stats.lap("setup")
+
+    # The vectorized mode does the whole search at once, leaving the queue below empty
+    if vectorized and pathFound == 0:
+        destination, expanded, max_frontier = expand_levels(grid, source_cells, targets, bfs_parent, bfs_visited)
+        pathFound = int(destination != -1)
+        bfs_queue.clear()
 
-        # Move to the parent node of the current node.
-        temp_node = bfs_parent[i][j]
+    """
+    Continue BFS until:
+    1. The queue becomes empty, meaning all possible nodes have been explored
+       without reaching the destination.
+    2. A path to the destination is found, breaking the loop early.
+    """
+    while len(bfs_queue) != 0 and pathFound == 0:
 
-        # Increment path length count.
-        path_length += 1
+        if counting and len(bfs_queue) > max_frontier:
+            max_frontier = len(bfs_queue)
 
-    # Visualize the marked path using maze_plotter.
-    maze_plotter(bfs_maze, "bfs", path_length+1)
-    return
+        # Dequeue the first node in FIFO order (BFS characteristic).
+        cur_node = bfs_queue.popleft()
+        expanded += 1
+
+        # Check the four neighbors, the wall border of the grid keeps them in bounds.
+        for offset in offsets:
+            node = cur_node + offset
+            if walls[node] or visited[node]:
+                continue
+
+            # Mark its parent and visit it.
+            parents[node] = cur_node
+            visited[node] = 1
+            if node in targets:
+                # If a destination is found, set the flag and exit.
+                destination = node
+                pathFound = 1
+                break
+            bfs_queue.append(node)
+
+    if counting:
+        stats.lap("search")
+
+    # Sources have no parent, so the path is traced back to whichever source it started from
+    result = grid.make_result("bfs", pathFound, parents, bfs_visited, None, destination, expanded)
+
+    if counting:
+        stats.lap("reconstruction")
+        # Every pop expanded a node, which checks all four neighbors unless it found the destination.
+        # Every visited cell was queued, except a destination found as a neighbor.
+        pushes = int(np.count_nonzero(np.asarray(bfs_visited))) - int(pathFound == 1 and parents[destination] != -1)
+        stats.record(expanded, grid.neighbor_checks(expanded, parents, destination), pushes, expanded, max_frontier)
+    return result
 
 
 def breadth_first_search(bfs_maze,display=True):
     """
-    Performs Breadth-First Search (BFS) to find the shortest path from the source 
-    (top-left) to the destination (bottom-right) in a given maze.
+    Solves the maze with BFS and optionally plots the explored maze and the path.
 
     Parameters:
-    bfs_maze (ndarray): An n x n matrix representing the maze, where different values 
-                        indicate walls, open paths, or visited cells.
+    bfs_maze (ndarray): An n x n matrix representing the maze, where 1 represents a wall.
     display (bool): If True, visualizes the search process and the path (default: True).
-
-    Functionality:
-    - Implements BFS using a queue to explore the shortest path.
-    - Tracks visited nodes and stores parent-child relationships to reconstruct the path.
-    - If a path is found, it optionally visualizes the result.
-    - If no path is found, it displays the explored maze.
+                    matplotlib is only imported in that case.
 
     Returns:
     int: 1 if a path is found, 0 if no path exists.
     """
 
-    # Define the source (starting point) and destination (goal).
-    source, destination = (0,0), (len(bfs_maze)-1, len(bfs_maze)-1)
-
-    # Create a copy of the maze to avoid modifying the original.
-    bfs_maze=bfs_maze.copy()
-
-    # Initialize the BFS queue with the source node.
-    bfs_queue = deque([source])
-
-    # Mark the source node as visited (-1).
-    bfs_maze[source] = -1
-
-    # Flag to track if a path to destination is found.
-    pathFound = 0
-
-    # Matrix to store parent nodes for reconstructing the path.
-    bfs_parent = [[None for _ in range(len(bfs_maze))] for _ in range(len(bfs_maze))]
+    result = bfs_solve(bfs_maze)
 
-    """
-    Continue BFS until:
-    1. The queue becomes empty, meaning all possible nodes have been explored 
-       without reaching the destination.
-    2. A path to the destination is found, breaking the loop early.
-    """
-    while len(bfs_queue) != 0 and pathFound == 0:
-
-        # Dequeue the first node in FIFO order (BFS characteristic).
-        cur_node = bfs_queue.popleft()
-        bfs_maze[cur_node] = -2 # Temporarily mark as processing.
-
-        # Get all valid neighbors that can be traversed.
-        neighbors = traversable_neighbors(bfs_maze, cur_node)
-
-        # Iterate through the neighbors to continue the BFS.
-        if len(neighbors) != 0:
-            for node in neighbors:
-                (i,j) = node
-                if node == destination:
-                    # If the destination is found, set the flag and exit.
-                    pathFound = 1
-                    if display:
-                        # If visualization is enabled, plot the discovered path.
-                        bfs_path(bfs_maze, cur_node, bfs_parent)
-                        break
-                    return 1
-                
-                 # If the neighbor hasn't been visited, mark its parent and add to queue.
-                if bfs_parent[i][j] == None:
-                    bfs_parent[i][j] = cur_node
-                    bfs_queue.append(node)
-
-        # Mark the current node as visited (-1).
-        bfs_maze[cur_node] = -1
-
-    # If the loop completes without finding a path, return failure.
-    if pathFound == 0:
-        if display:
-            # If visualization is enabled, display the explored maze.
+    if display:
+        from util.maze_plotter import plot_result
+        if not result.found:
             print("No Path Found :(")
-            maze_plotter(bfs_maze, "bfs", 0)
-        return 0
\ No newline at end of file
+        # Plot the discovered path, or the explored maze if there is none.
+        plot_result(bfs_maze, result)
+    return int(result.found)
@@ -1,73 +1,64 @@
-from util.maze_plotter import maze_plotter
-from util.traversable_neighbors import traversable_neighbors
+from search_algorithms.search_core import as_search_grid, fast_view, unreachable_result
 
 
-def dfs_path_printer(dfs_maze, dfs_path):
+def dfs_solve(dfs_maze, components=None, source=None, destination=None, stats=None):
     """
-    Marks the path from the source node to the destination node in a DFS (Depth-First Search) explored maze.
+    Implements the Depth First Search (DFS) approach to solve a given maze, without any output.
 
     Parameters:
-    dfs_maze : list of lists (2D matrix)
-        An nxn matrix representing the maze, where different values indicate walls, open paths, or visited cells.
-
-    dfs_path : list of tuples
-        A list of coordinates (row, col) representing the path taken by DFS.
-
-    Functionality:
-    - Marks the start and destination nodes distinctly.
-    - Marks the path taken by DFS in the maze.
-
-    Returns:
-    None
-    """
-
-    for node in dfs_path:
-        # Mark the current node as part of the path
-        dfs_maze[node] = -2
+    dfs_maze : ndarray (2D matrix)
+        An nxn matrix representing the randomly generated maze, where open paths are represented by 0
+        and walls are represented by 1. The maze is not modified.
 
-    # Mark the destination node with a special identifier (-2) to highlight it in the visualization.
-    dfs_maze[len(dfs_maze) - 1][len(dfs_maze) - 1] = -2
+    components : ComponentIndex, optional (default=None)
+        Connected-component index of the maze. When given and the destination is in another component,
+        no search is run.
 
-    # Mark the source node with the same identifier to differentiate it in the visualization.
-    dfs_maze[0][0] = -2
+    source : tuple, optional (default=None)
+        The (row, col) start node, the top-left corner by default.
 
-    maze_plotter(dfs_maze, "dfs", len(dfs_path))
-    return
+    destination : tuple, optional (default=None)
+        The (row, col) goal node, the bottom-right corner by default.
 
+    stats : SearchStats, optional (default=None)
+        Counters and phase timers the search reports into. Nothing is counted when it is None.
 
-def depth_first_search(dfs_maze, display=True):
+    Returns:
+    SearchResult : The path, its length, the number of expanded nodes and the visited mask.
     """
-    Implements the Depth First Search (DFS) approach to solve a given maze.
 
-    Parameters:
-    dfs_maze : list of lists (2D matrix)
-        An nxn matrix representing the randomly generated maze, where open paths are represented by 0
-        and walls are represented by 1.
+    # The component index answers unreachable queries without searching
+    unreachable = unreachable_result("dfs", dfs_maze, components, source, destination)
+    if unreachable is not None:
+        return unreachable
 
-    display : bool, optional (default=True)
-        A control parameter to display the output maze plot with the path, if True. If False, no plot will be displayed.
-    
-    Returns:
-    int : 1 if a path from source to destination is found, 0 otherwise.
-    """
+    # Counters and phase timers are only touched when stats are collected
+    counting = stats is not None
+    if counting:
+        stats.start()
 
-    # Create a copy of the maze to avoid modifying the original input
-    dfs_maze = dfs_maze.copy()
+    grid = as_search_grid(dfs_maze)
 
     # Define the source (starting point) and destination (goal).
-    source, destination = (0, 0), (len(dfs_maze) - 1, len(dfs_maze) - 1)
+    source, destination = grid.endpoints(source, destination)
 
-    # Mark the source node with the same identifier to differentiate it in the visualization.
-    dfs_maze[source] = -1
+    # Flat parent array, the parent of a cell is the last node that pushed it on the stack.
+    # The memoryviews are used in the loop, they are much faster to index than the arrays.
+    dfs_parent, dfs_visited = grid.new_parents(), grid.new_visited()
+    parents, visited = memoryview(dfs_parent), fast_view(dfs_visited)
+    walls, offsets = grid.cells, grid.offsets
 
     # Initialize the DFS stack with the source node
     dfs_stack = [source]
 
-    # Initialize an empty list to store the path taken by DFS
-    dfs_path = []
-
     # Flag variable to track if the path is found (0 = not found, 1 = found)
-    pathFound = 0
+    # The search is already done when it starts on the destination
+    pathFound = int(source == destination)
+
+    # Number of nodes popped from the stack and expanded, and with stats, all pops and the largest stack seen
+    expanded, pops, max_frontier = 0, 0, 0
+    if counting:
+        stats.lap("setup")
 
     """
     Continue searching until:
@@ -75,50 +66,71 @@ def depth_first_search(dfs_maze, display=True):
     2. The pathFound flag is set to True, meaning a path has been found from the source to the destination.
     """
     while len(dfs_stack) != 0 and pathFound == 0:
-        # Pop the last visited node from the DFS stack (LIFO order)
+        if counting:
+            pops += 1
+            max_frontier = max(max_frontier, len(dfs_stack))
+
+        # Pop the last pushed node from the DFS stack (LIFO order)
         cur_node = dfs_stack.pop()
 
-        # Append the current node to the path list
-        dfs_path.append(cur_node)
-
-        # Mark the current node as visited by setting its value to -2 (different from visited cells)
-        dfs_maze[cur_node] = -2
-
-        # Get all the traversable neighbors of the current node
-        neighbors = traversable_neighbors(dfs_maze, cur_node)
-
-        # If no neighbors are found, it indicates a dead-end, so pop the node from the path
-        if len(neighbors) == 0:
-            dfs_path.pop()
-        else:
-            # Iterate over all neighbors
-            for node in neighbors:
-                # Check if any neighbor is the destination node
-                if node == destination:
-                    #If the nrighbor is the destination the set pathFound to True and
-                    #return the path.
-                    dfs_maze[destination] = -2
-
-                    # Set pathFound to 1 to signify that a path was found
-                    pathFound = 1
-                    if display:
-                        #If the display parameter is set to true the plot the path
-                        dfs_path_printer(dfs_maze, dfs_path)
-                    return 1
-                
-                # Append the neighbor node to the DFS stack for further exploration
-                dfs_stack.append(node)
-
-        # Mark the current node as visited by setting its value to -1
-        # This prevents revisiting the node in the future
-        dfs_maze[cur_node] = -1
-
-    # If the DFS stack is empty and no path was found, return 0
-    if pathFound == 0:
-        if display:
-            # If display is True, plot the maze showing all visited nodes
+        # A node can be pushed by several neighbors before it is expanded, skip the extra copies
+        if visited[cur_node]:
+            continue
+        visited[cur_node] = 1
+        expanded += 1
+
+        # Iterate over the four neighbors, the wall border of the grid keeps them in bounds
+        for offset in offsets:
+            node = cur_node + offset
+            if walls[node] or visited[node]:
+                continue
+
+            parents[node] = cur_node
+
+            # Check if the neighbor is the destination node
+            if node == destination:
+                visited[node] = 1
+                # Set pathFound to 1 to signify that a path was found
+                pathFound = 1
+                break
+
+            # Append the neighbor node to the DFS stack for further exploration
+            dfs_stack.append(node)
+
+    if counting:
+        stats.lap("search")
+
+    result = grid.make_result("dfs", pathFound, parents, dfs_visited, source, destination, expanded)
+
+    if counting:
+        stats.lap("reconstruction")
+        stats.record(expanded, grid.neighbor_checks(expanded, parents, destination if pathFound else -1),
+                     pops + len(dfs_stack), pops, max_frontier)
+    return result
+
+
+def depth_first_search(dfs_maze, display=True):
+    """
+    Solves the maze with DFS and optionally plots the explored maze and the path.
+
+    Parameters:
+    dfs_maze : ndarray (2D matrix)
+        An nxn matrix representing the maze, where walls are represented by 1.
+
+    display : bool, optional (default=True)
+        A control parameter to display the output maze plot with the path, if True. If False, no plot will be displayed
+        and matplotlib is never imported.
+
+    Returns:
+    int : 1 if a path from source to destination is found, 0 otherwise.
+    """
+
+    result = dfs_solve(dfs_maze)
+
+    if display:
+        from util.maze_plotter import plot_result
+        if not result.found:
             print("No path found :(")
-            maze_plotter(dfs_maze, "dfs")
-        
-        # Return 0 indicating that no path was found
-        return 0
\ No newline at end of file
+        # Plot the path, or the maze showing all visited nodes if there is none
+        plot_result(dfs_maze, result)
+    return int(result.found)
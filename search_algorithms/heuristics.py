@@ -0,0 +1,166 @@
+from collections import OrderedDict
+import math
+import numpy as np
+
+# Heuristics accepted by heuristic_table and the A* solvers
+HEURISTICS = ("euclid", "manhattan", "octile", "chebyshev")
+
+
+def heuristic_table(shape, goal, h="euclid", pad=0):
+    """
+    Build the table of heuristic distances from every cell of a grid to the goal in one broadcast.
+
+    Args:
+        shape (tuple of int): (rows, cols) of the maze.
+        goal (tuple of int): The (row, column) goal node.
+        h (str, optional): One of HEURISTICS. Defaults to "euclid".
+        pad (int, optional): Number of extra cells on every side of the table, so it lines up with a
+                             padded grid. Defaults to 0.
+
+    Returns:
+        numpy.ndarray: A (rows + 2 * pad, cols + 2 * pad) table, float64 for "euclid" and "octile",
+                       int32 for "manhattan" and "chebyshev".
+
+    Raises:
+        ValueError: If h is not one of HEURISTICS.
+    """
+
+    rows, cols = shape
+    # Absolute row and column offsets to the goal, as a column and a row vector
+    di = np.abs(np.arange(-pad, rows + pad, dtype=np.int32) - goal[0])[:, None]
+    dj = np.abs(np.arange(-pad, cols + pad, dtype=np.int32) - goal[1])[None, :]
+
+    if h == "euclid":
+        return np.hypot(di, dj)
+    elif h == "manhattan":
+        return di + dj
+    elif h == "octile":
+        return np.maximum(di, dj) + (math.sqrt(2) - 1) * np.minimum(di, dj)
+    elif h == "chebyshev":
+        return np.maximum(di, dj)
+    raise ValueError(f"unknown heuristic {h!r}, expected one of {HEURISTICS}")
+
+
+def heuristic_value(h, di, dj):
+    """
+    Heuristic distance for absolute row and column offsets di and dj, computed in plain Python.
+    """
+    if h == "euclid":
+        return math.sqrt(di * di + dj * dj)
+    elif h == "manhattan":
+        return di + dj
+    elif h == "octile":
+        return max(di, dj) + (math.sqrt(2) - 1) * min(di, dj)
+    return max(di, dj)
+
+
+def table_nbytes(shape, h="euclid", pad=0):
+    """
+    Number of bytes a heuristic table of the given shape would take, without building it.
+    """
+    itemsize = 8 if h in ("euclid", "octile") else 4
+    return (shape[0] + 2 * pad) * (shape[1] + 2 * pad) * itemsize
+
+
+class LazyHeuristic:
+    """
+    Heuristic indexed by flat cell index like a table, but computed on demand.
+
+    Used for grids where a full table does not fit in memory. It costs a divmod and a few
+    arithmetic operations per lookup instead of one memory read.
+    """
+
+    def __init__(self, goal, h="euclid", width=None, pad=0):
+        """
+        Args:
+            goal (tuple of int): The (row, column) goal node.
+            h (str, optional): One of HEURISTICS. Defaults to "euclid".
+            width (int): Row stride of the flat index, i.e. cols + 2 * pad.
+            pad (int, optional): Padding of the grid the indices refer to. Defaults to 0.
+        """
+        if h not in HEURISTICS:
+            raise ValueError(f"unknown heuristic {h!r}, expected one of {HEURISTICS}")
+        self.h = h
+        self.width = width
+        # Goal position in the coordinates of the padded grid
+        self.goal_row, self.goal_col = goal[0] + pad, goal[1] + pad
+
+    def __getitem__(self, index):
+        i, j = divmod(index, self.width)
+        return heuristic_value(self.h, abs(i - self.goal_row), abs(j - self.goal_col))
+
+
+class HeuristicCache:
+    """
+    LRU cache of heuristic tables keyed by (shape, goal, heuristic, pad) and bounded by bytes.
+
+    Repeated A* calls on mazes of the same size and goal reuse the same table. Cached tables are
+    read-only since they are shared between searches.
+    """
+
+    def __init__(self, max_bytes=256 * 2**20):
+        """
+        Args:
+            max_bytes (int, optional): Maximum total size of the cached tables. Defaults to 256 MiB.
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.tables = OrderedDict()
+
+    def get(self, shape, goal, h="euclid", pad=0):
+        """
+        Return the heuristic table for the key, building and caching it on a miss.
+
+        Tables larger than max_bytes are built but not cached. The least recently used tables are
+        evicted until the new one fits.
+        """
+
+        key = (tuple(shape), tuple(goal), h, pad)
+        table = self.tables.get(key)
+        if table is not None:
+            self.tables.move_to_end(key)
+            return table
+
+        table = heuristic_table(shape, goal, h, pad)
+        table.setflags(write=False)
+        if table.nbytes <= self.max_bytes:
+            while self.nbytes + table.nbytes > self.max_bytes:
+                _, evicted = self.tables.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+            self.tables[key] = table
+            self.nbytes += table.nbytes
+        return table
+
+    def clear(self):
+        """
+        Drop every cached table.
+        """
+        self.tables.clear()
+        self.nbytes = 0
+
+
+# Cache shared by the A* solvers
+HEURISTIC_CACHE = HeuristicCache()
+
+
+def grid_heuristic(grid, goal, h="euclid", lazy=None, cache=HEURISTIC_CACHE):
+    """
+    Heuristic for a search on a SearchGrid, indexable by the grid's flat cell index.
+
+    Args:
+        grid (SearchGrid): The grid being searched.
+        goal (tuple of int): The (row, column) goal node.
+        h (str, optional): One of HEURISTICS. Defaults to "euclid".
+        lazy (bool, optional): True to compute values on demand, False to use a cached table. By default
+                               the table is used when it fits in the cache, and lazy mode otherwise.
+        cache (HeuristicCache, optional): Cache to take the table from. Defaults to HEURISTIC_CACHE.
+
+    Returns:
+        memoryview | LazyHeuristic: Heuristic values indexed by flat index of the padded grid.
+    """
+
+    if lazy is None:
+        lazy = table_nbytes((grid.rows, grid.cols), h, pad=1) > cache.max_bytes
+    if lazy:
+        return LazyHeuristic(goal, h, grid.width, pad=1)
+    return memoryview(cache.get((grid.rows, grid.cols), goal, h, pad=1).reshape(-1))
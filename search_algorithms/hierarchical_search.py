@@ -0,0 +1,528 @@
+from search_algorithms.search_core import SearchGrid, as_search_grid, unreachable_result
+from search_algorithms.bread_first_search import bfs_solve
+import heapq
+import numpy as np
+
+# Version of the files written by HierarchicalIndex.save
+INDEX_VERSION = 1
+
+
+def cluster_distances(grid, cluster_size, sources, dtype=np.int32):
+    """
+    Breadth-first distances from several sources at once, each search confined to the cluster of its source.
+
+    The whole frontier of every source is expanded per step with NumPy, as in expand_levels. No step crosses
+    the border of the square clusters of the grid, so the searches of different clusters never meet and one
+    pass measures one source per cluster.
+
+    Args:
+        grid (SearchGrid): The grid to search.
+        cluster_size (int): Side of the clusters, which start at the top-left corner of the maze.
+        sources (numpy.ndarray): Flat indices of the start cells, at most one per cluster.
+        dtype (numpy.dtype, optional): Type of the distance array, int16 halves it when clusters are small.
+
+    Returns:
+        numpy.ndarray: Flat distance array of the padded grid, -1 for cells no source reaches.
+    """
+
+    distances = np.full(grid.size, -1, dtype=dtype)
+    offsets = np.array(grid.offsets, dtype=grid.index_dtype)
+    frontier = np.asarray(sources, dtype=grid.index_dtype)
+    distances[frontier] = 0
+
+    # Scratch position of every new cell in the list of new cells. Only entries just written are read, so
+    # it needs no initialization.
+    position = np.empty(grid.size, dtype=grid.index_dtype)
+    level = 0
+    while len(frontier) != 0:
+        level += 1
+        candidates = (frontier[:, None] + offsets).reshape(-1)
+
+        # Steps in the left, up, down, right order of offsets, except out of the cluster
+        rows, cols = np.divmod(frontier, grid.width)
+        rows, cols = (rows - 1) % cluster_size, (cols - 1) % cluster_size
+        inside = np.column_stack((cols != 0, rows != 0, rows != cluster_size - 1, cols != cluster_size - 1))
+        keep = inside.reshape(-1) & (grid.walls[candidates] == 0) & (distances[candidates] == -1)
+        cells = candidates[keep]
+
+        # A cell next to several frontier cells is listed once per neighbor, keep one of its positions
+        numbers = np.arange(len(cells), dtype=grid.index_dtype)
+        position[cells] = numbers
+        frontier = cells[position[cells] == numbers]
+        distances[frontier] = level
+    return distances
+
+
+class HierarchicalIndex:
+    """
+    Hierarchical path-finding A* (HPA*) index of a maze, for many queries on very large grids.
+
+    The maze is cut into square clusters. Along every border between two clusters, each run of open cells
+    facing open cells across the border gets one entrance pair in its middle. The distances between the
+    entrances of a cluster, staying inside it, are measured once and cached. A query then runs A* on the
+    small graph of entrances, joined to the start and the goal through their own clusters, and refines each
+    step of the abstract path to cells with a BFS inside one cluster.
+
+    Paths are near-optimal: the route through an entrance in the middle of a run can be a few steps longer
+    than the shortest path. Every path that exists is found, since any route between two clusters crosses
+    one of the runs and the cells of a run are connected along the border.
+
+    Wall changes only invalidate the clusters they touch: their borders are scanned again and the distances
+    of these clusters and their neighbors measured again at the next query. The index can be saved to disk
+    and loaded back instead of being built again.
+
+    Example:
+        index = HierarchicalIndex(maze, cluster_size=32)
+        result = index.query((0, 0), (9999, 9999))
+        index.save("maze-index.npz")
+    """
+
+    def __init__(self, maze, cluster_size=32, build=True):
+        """
+        Args:
+            maze (numpy.ndarray | SearchGrid | MazeFile): The maze as a 2D array where 1 represents a wall,
+                                                          or a grid over it. It is copied, later edits
+                                                          go through set_wall and toggle.
+            cluster_size (int, optional): Side of the square clusters, in cells. Defaults to 32.
+            build (bool, optional): If False, leave the index empty, as load does before filling it.
+        """
+
+        # Grids passed in (SearchGrid, PackedSearchGrid, or a MazeFile's) get a writable uint8 copy of their
+        # padded walls, an array is padded into a new grid
+        grid = as_search_grid(maze)
+        if isinstance(maze, SearchGrid) or hasattr(maze, "search_grid"):
+            grid = SearchGrid.from_padded(np.array(grid.walls, dtype=np.uint8), grid.rows, grid.cols)
+        self.grid = grid
+        self.cluster_size = cluster_size
+        self.cluster_rows = -(-self.grid.rows // cluster_size)
+        self.cluster_cols = -(-self.grid.cols // cluster_size)
+        # Distances inside a cluster are below its cell count
+        self.dtype = np.dtype(np.int16 if cluster_size ** 2 < np.iinfo(np.int16).max else np.int32)
+
+        # Entrance pairs by border, as (lower cluster id, higher cluster id) -> list of (cell, cell across)
+        self.transitions = {}
+        # Cells across the border from every entrance cell
+        self.partners = {}
+        # Entrance cells of every cluster, their (cluster, position in it), and the distance matrix between them
+        self.entrances = {}
+        self.slots = {}
+        self.distances = {}
+        # Clusters whose walls changed since their distances were measured
+        self.dirty = set()
+
+        if build:
+            self.build()
+
+    def cluster_of(self, cells):
+        """
+        Cluster ids of an array of flat indices of the padded grid.
+        """
+        rows, cols = np.divmod(cells, self.grid.width)
+        return (rows - 1) // self.cluster_size * self.cluster_cols + (cols - 1) // self.cluster_size
+
+    def cluster_bounds(self, cluster):
+        """
+        Maze rows and columns (first row, end row, first column, end column) covered by a cluster.
+        """
+        i, j = divmod(cluster, self.cluster_cols)
+        size = self.cluster_size
+        return i * size, min((i + 1) * size, self.grid.rows), j * size, min((j + 1) * size, self.grid.cols)
+
+    def neighbor_clusters(self, cluster):
+        """
+        Ids of the clusters sharing a border with a cluster.
+        """
+        i, j = divmod(cluster, self.cluster_cols)
+        return [(i + di) * self.cluster_cols + j + dj for di, dj in ((-1, 0), (0, -1), (0, 1), (1, 0))
+                if 0 <= i + di < self.cluster_rows and 0 <= j + dj < self.cluster_cols]
+
+    def scan_border(self, first, second):
+        """
+        Entrance pairs on the border between two neighboring clusters, one in the middle of each run of open
+        cells facing open cells across the border.
+
+        Args:
+            first (int): Id of the top or left cluster.
+            second (int): Id of the bottom or right cluster.
+
+        Returns:
+            list of tuple: (cell in first, cell in second) flat index pairs.
+        """
+
+        top, bottom, left, right = self.cluster_bounds(first)
+        grid, walls = self.grid, self.grid.walls
+        # The cluster below is cluster_cols ids further, which is also first + 1 when there is one column
+        if second - first == self.cluster_cols:
+            # Horizontal border: the last row of the first cluster against the first of the second
+            cols = np.arange(left, right)
+            inside = bottom * grid.width + cols + 1
+            across = inside + grid.width
+        else:
+            # Vertical border: the last column of the first cluster against the first of the second
+            rows = np.arange(top, bottom)
+            inside = (rows + 1) * grid.width + right
+            across = inside + 1
+
+        # Runs of consecutive open pairs, from their first to their last position
+        open_pairs = np.concatenate(([False], (walls[inside] == 0) & (walls[across] == 0), [False]))
+        changes = np.flatnonzero(open_pairs[1:] != open_pairs[:-1])
+        middles = (changes[0::2] + changes[1::2] - 1) // 2
+        return [(int(inside[k]), int(across[k])) for k in middles]
+
+    def borders(self):
+        """
+        Every (top or left cluster, bottom or right cluster) pair of neighboring clusters.
+        """
+        for cluster in range(self.cluster_rows * self.cluster_cols):
+            i, j = divmod(cluster, self.cluster_cols)
+            if j + 1 < self.cluster_cols:
+                yield cluster, cluster + 1
+            if i + 1 < self.cluster_rows:
+                yield cluster, cluster + self.cluster_cols
+
+    def set_transitions(self, border, pairs):
+        """
+        Replace the entrance pairs of a border, keeping the partner links in step.
+        """
+
+        for a, b in self.transitions.pop(border, []):
+            for cell, other in ((a, b), (b, a)):
+                self.partners[cell].remove(other)
+                if len(self.partners[cell]) == 0:
+                    del self.partners[cell]
+        if len(pairs) != 0:
+            self.transitions[border] = pairs
+        for a, b in pairs:
+            self.partners.setdefault(a, []).append(b)
+            self.partners.setdefault(b, []).append(a)
+
+    def cluster_entrances(self, cluster):
+        """
+        Sorted entrance cells of a cluster, from the transitions of its borders.
+        """
+
+        cells = set()
+        for neighbor in self.neighbor_clusters(cluster):
+            border = (min(cluster, neighbor), max(cluster, neighbor))
+            for a, b in self.transitions.get(border, []):
+                cells.add(a if cluster == border[0] else b)
+        return np.array(sorted(cells), dtype=self.grid.index_dtype)
+
+    def set_entrances(self, cluster, cells, distances):
+        """
+        Store the entrances of a cluster and the distance matrix between them.
+        """
+
+        for cell in self.entrances.pop(cluster, []):
+            self.slots.pop(int(cell), None)
+        if len(cells) == 0:
+            self.distances.pop(cluster, None)
+            return
+        self.entrances[cluster] = cells
+        self.distances[cluster] = distances
+        for slot, cell in enumerate(cells):
+            self.slots[int(cell)] = (cluster, slot)
+
+    def measure(self, clusters):
+        """
+        Measure the entrance distance matrices of the given clusters, one entrance of every cluster per pass.
+        """
+
+        cells = {cluster: self.cluster_entrances(cluster) for cluster in clusters}
+        matrices = {cluster: np.full((len(c), len(c)), -1, dtype=self.dtype) for cluster, c in cells.items()}
+        passes = max((len(c) for c in cells.values()), default=0)
+        for k in range(passes):
+            sources = np.array([c[k] for c in cells.values() if len(c) > k], dtype=self.grid.index_dtype)
+            field = cluster_distances(self.grid, self.cluster_size, sources, self.dtype)
+            for cluster, c in cells.items():
+                if len(c) > k:
+                    matrices[cluster][k] = field[c]
+        for cluster in clusters:
+            self.set_entrances(cluster, cells[cluster], matrices[cluster])
+
+    def measure_cluster(self, cluster):
+        """
+        Measure the entrance distance matrix of one cluster on a grid of the cluster alone, much cheaper than
+        a pass over the whole maze when only a few clusters changed.
+        """
+
+        cells = self.cluster_entrances(cluster)
+        local, (top, left) = self.local_grid(cluster)
+        rows, cols = np.divmod(cells, self.grid.width)
+        local_cells = (rows - top) * local.width + cols - left
+        matrix = np.array([cluster_distances(local, self.cluster_size, [cell])[local_cells] for cell in local_cells],
+                          dtype=self.dtype).reshape(len(cells), len(cells))
+        self.set_entrances(cluster, cells, matrix)
+
+    def build(self):
+        """
+        Scan every border and measure every cluster.
+        """
+
+        for border in self.borders():
+            self.set_transitions(border, self.scan_border(*border))
+        self.measure(range(self.cluster_rows * self.cluster_cols))
+        self.dirty.clear()
+
+    def set_wall(self, node, wall=True):
+        """
+        Add or remove the wall at a (row, column) node. The affected clusters are updated at the next query.
+
+        Raises:
+            ValueError: If the node lies outside the maze.
+        """
+
+        cell = self.grid.endpoints(node, node)[0]
+        if self.grid.cells[cell] != int(wall):
+            self.grid.cells[cell] = int(wall)
+            self.dirty.add(int(self.cluster_of(cell)))
+
+    def toggle(self, nodes):
+        """
+        Flip the wall state of one (row, column) node or a list of them.
+        """
+
+        for node in np.reshape(nodes, (-1, 2)):
+            node = (int(node[0]), int(node[1]))
+            self.set_wall(node, not self.grid.cells[self.grid.index(node)])
+
+    def refresh(self):
+        """
+        Scan the borders of the clusters with changed walls again, and measure them and their neighbors,
+        whose entrances on the shared borders may have moved. Called by query.
+
+        Returns:
+            int: The number of clusters measured again.
+        """
+
+        if len(self.dirty) == 0:
+            return 0
+        stale = set()
+        for cluster in self.dirty:
+            stale.add(cluster)
+            for neighbor in self.neighbor_clusters(cluster):
+                border = (min(cluster, neighbor), max(cluster, neighbor))
+                self.set_transitions(border, self.scan_border(*border))
+                stale.add(neighbor)
+        for cluster in stale:
+            self.measure_cluster(cluster)
+        self.dirty.clear()
+        return len(stale)
+
+    def local_grid(self, cluster):
+        """
+        SearchGrid of one cluster alone, with the offset of its first cell in the maze.
+        """
+        top, bottom, left, right = self.cluster_bounds(cluster)
+        return SearchGrid(self.grid.unpad(self.grid.walls)[top:bottom, left:right]), (top, left)
+
+    def local_distances(self, cell):
+        """
+        Distances inside its cluster from a cell to the entrances of the cluster.
+
+        Returns:
+            dict: Entrance cell -> distance, for the entrances the cell reaches.
+        """
+
+        cluster = int(self.cluster_of(cell))
+        local, (top, left) = self.local_grid(cluster)
+        row, col = self.grid.node(cell)
+        field = cluster_distances(local, self.cluster_size, [local.index((row - top, col - left))])
+        reached = {}
+        for entrance in self.entrances.get(cluster, []):
+            i, j = self.grid.node(entrance)
+            distance = field[local.index((i - top, j - left))]
+            if distance != -1:
+                reached[int(entrance)] = int(distance)
+        return reached
+
+    def local_path(self, a, b):
+        """
+        Shortest path inside their common cluster between two cells, as flat indices of the padded grid.
+        """
+
+        cluster = int(self.cluster_of(a))
+        local, (top, left) = self.local_grid(cluster)
+        (i, j), (k, l) = self.grid.node(a), self.grid.node(b)
+        result = bfs_solve(local, sources=(i - top, j - left), destinations=(k - top, l - left))
+        rows, cols = np.divmod(result.path, local.cols)
+        return (rows + top + 1) * self.grid.width + cols + left + 1
+
+    def abstract_path(self, source, destination):
+        """
+        A* over the entrances, from the source to the destination.
+
+        Returns:
+            tuple: The cells of the abstract path (empty if there is none) and the number of expanded nodes.
+        """
+
+        grid = self.grid
+        goal_cluster = int(self.cluster_of(destination))
+        from_source = self.local_distances(source)
+        to_destination = self.local_distances(destination)
+        if int(self.cluster_of(source)) == goal_cluster:
+            # The destination in the same cluster is reached from the source directly, if it can be
+            local, (top, left) = self.local_grid(goal_cluster)
+            (i, j), (k, l) = grid.node(source), grid.node(destination)
+            direct = bfs_solve(local, sources=(i - top, j - left), destinations=(k - top, l - left))
+            if direct.found:
+                to_destination[source] = direct.path_length - 1
+
+        slots, entrances, distances, partners = self.slots, self.entrances, self.distances, self.partners
+        goal_row, goal_col = divmod(destination, grid.width)
+
+        def heuristic(cell):
+            row, col = divmod(cell, grid.width)
+            return abs(row - goal_row) + abs(col - goal_col)
+
+        def edges(cell):
+            # Lengths of -1 are unreachable entrances and 0 the cell itself, both skipped by the search
+            if cell == source:
+                others, lengths = list(from_source), list(from_source.values())
+            elif cell in slots:
+                cluster, slot = slots[cell]
+                others, lengths = entrances[cluster].tolist(), distances[cluster][slot].tolist()
+            else:
+                others, lengths = [], []
+            across = partners.get(cell)
+            if across is not None:
+                others, lengths = others + across, lengths + [1] * len(across)
+            if cell in to_destination:
+                others.append(destination)
+                lengths.append(to_destination[cell])
+            return zip(others, lengths)
+
+        costs, parents = {source: 0}, {source: -1}
+        queue = [(heuristic(source), 0, source)]
+        expanded = 0
+        while len(queue) != 0:
+            _, cost, cell = heapq.heappop(queue)
+            if cost > costs[cell]:
+                continue
+            expanded += 1
+            if cell == destination:
+                path = [cell]
+                while parents[path[-1]] != -1:
+                    path.append(parents[path[-1]])
+                return path[::-1], expanded
+            for other, distance in edges(cell):
+                next_cost = cost + distance
+                if distance > 0 and next_cost < costs.get(other, next_cost + 1):
+                    costs[other], parents[other] = next_cost, cell
+                    heapq.heappush(queue, (next_cost + heuristic(other), next_cost, other))
+        return [], expanded
+
+    def query(self, source=None, destination=None):
+        """
+        Find a path between two nodes: an abstract path over the entrances, refined inside each cluster.
+
+        Args:
+            source (tuple of int, optional): The (row, column) start node, the top-left corner by default.
+            destination (tuple of int, optional): The (row, column) goal node, the bottom-right corner by default.
+
+        Returns:
+            SearchResult: The path and its length, the abstract nodes expanded, and as visited cells the path.
+        """
+
+        self.refresh()
+        grid = self.grid
+        source, destination = grid.endpoints(source, destination)
+        if grid.cells[destination]:
+            return grid.path_result("hpa-star", np.zeros(0, dtype=grid.index_dtype), grid.new_visited(), 0)
+
+        abstract, expanded = self.abstract_path(source, destination)
+        path = [np.array([source], dtype=grid.index_dtype)] if len(abstract) != 0 else []
+        for a, b in zip(abstract, abstract[1:]):
+            if b in self.partners.get(a, []):
+                path.append(np.array([b], dtype=grid.index_dtype))
+            else:
+                path.append(self.local_path(a, b)[1:])
+        path = np.concatenate(path) if len(path) != 0 else np.zeros(0, dtype=grid.index_dtype)
+
+        visited = grid.new_visited()
+        visited[path] = 1
+        return grid.path_result("hpa-star", path, visited, expanded)
+
+    def save(self, path):
+        """
+        Write the index, with the walls it was built on, to a .npz file.
+        """
+
+        self.refresh()
+        borders = sorted(self.transitions)
+        pairs = [pair for border in borders for pair in self.transitions[border]]
+        clusters = sorted(self.entrances)
+        np.savez(
+            path,
+            version=INDEX_VERSION,
+            shape=np.array([self.grid.rows, self.grid.cols, self.cluster_size]),
+            walls=np.packbits(self.grid.unpad(self.grid.walls).reshape(-1)),
+            borders=np.array(borders, dtype=np.int64).reshape(-1, 2),
+            border_sizes=np.array([len(self.transitions[border]) for border in borders], dtype=np.int64),
+            pairs=np.array(pairs, dtype=np.int64).reshape(-1, 2),
+            clusters=np.array(clusters, dtype=np.int64),
+            entrances=np.concatenate([self.entrances[c] for c in clusters] or [np.zeros(0, np.int64)]),
+            entrance_counts=np.array([len(self.entrances[c]) for c in clusters], dtype=np.int64),
+            distances=np.concatenate([self.distances[c].reshape(-1) for c in clusters] or [np.zeros(0, self.dtype)]),
+        )
+
+    @classmethod
+    def load(cls, path, maze=None):
+        """
+        Read an index written by save.
+
+        Args:
+            path (str): The .npz file.
+            maze (numpy.ndarray, optional): The maze the index is for. Its walls are checked against the ones
+                                            the index was built on. By default the stored walls are used.
+
+        Raises:
+            ValueError: If the file is not an index of a supported version, or was built for another maze.
+        """
+
+        with np.load(path) as data:
+            if int(data["version"]) != INDEX_VERSION:
+                raise ValueError(f"{path} is not a version {INDEX_VERSION} maze index")
+            rows, cols, cluster_size = (int(value) for value in data["shape"])
+            walls = np.unpackbits(data["walls"], count=rows * cols).reshape(rows, cols)
+            if maze is not None:
+                if np.shape(maze) != (rows, cols) or not np.array_equal(np.asarray(maze) == 1, walls == 1):
+                    raise ValueError(f"{path} was built for a different maze")
+
+            index = cls(walls, cluster_size, build=False)
+            pairs = iter(data["pairs"].tolist())
+            for border, size in zip(data["borders"].tolist(), data["border_sizes"].tolist()):
+                index.set_transitions(tuple(border), [tuple(next(pairs)) for _ in range(size)])
+
+            entrances, distances = data["entrances"], data["distances"]
+            first, first_distance = 0, 0
+            for cluster, count in zip(data["clusters"].tolist(), data["entrance_counts"].tolist()):
+                cells = entrances[first:first + count].astype(index.grid.index_dtype)
+                matrix = distances[first_distance:first_distance + count * count].reshape(count, count).astype(index.dtype)
+                index.set_entrances(cluster, cells, matrix)
+                first, first_distance = first + count, first_distance + count * count
+        return index
+
+
+def hpa_star_solve(hpa_maze, components=None, source=None, destination=None, cluster_size=32):
+    """
+    One-off HPA* search, through the same interface as the other solvers. It builds the whole index for one
+    query, so for repeated queries keep a HierarchicalIndex instead.
+
+    Args:
+        hpa_maze (numpy.ndarray): The maze as a 2D array where 1 represents a wall. It is not modified.
+        components (ComponentIndex, optional): Connected-component index of the maze. When given and the
+                                               destination is in another component, no search is run.
+        source (tuple of int, optional): The (row, column) start node, the top-left corner by default.
+        destination (tuple of int, optional): The (row, column) goal node, the bottom-right corner by default.
+        cluster_size (int, optional): Side of the square clusters, in cells. Defaults to 32.
+
+    Returns:
+        SearchResult: The near-optimal path, its length, the abstract nodes expanded and the path cells.
+    """
+
+    # The component index answers unreachable queries without searching
+    unreachable = unreachable_result("hpa-star", hpa_maze, components, source, destination)
+    if unreachable is not None:
+        return unreachable
+    return HierarchicalIndex(hpa_maze, cluster_size).query(source, destination)
@@ -0,0 +1,227 @@
+from search_algorithms.search_core import SearchGrid, as_search_grid, UNREACHED, unreachable_result
+from search_algorithms.heuristics import grid_heuristic
+import heapq
+import numpy as np
+
+
+class IncrementalPlanner:
+    """
+    Lifelong Planning A* (LPA*): a shortest-path planner between two fixed cells that is built once on a
+    maze and then kept up to date as walls are added and removed.
+
+    Every cell has a cost g, the length of the best path found to it, and a one-step lookahead rhs, the
+    smallest g of its open neighbors plus one. Cells where the two differ are locally inconsistent and sit
+    in a priority queue ordered like A*. A wall change only makes the changed cell and its neighbors
+    inconsistent, and the next solve() repairs the costs outward from them until the destination's cost is
+    settled, leaving the rest of the search state as it was. After a few edits this expands a small
+    fraction of the cells a new A* search would.
+
+    Example:
+        planner = IncrementalPlanner(maze)
+        result = planner.solve()
+        planner.toggle([(3, 4), (10, 2)])
+        result = planner.solve()
+    """
+
+    def __init__(self, maze, source=None, destination=None, h="manhattan"):
+        """
+        Args:
+            maze (numpy.ndarray | SearchGrid | MazeFile): The maze as a 2D array where 1 represents a wall,
+                                                          or a grid over it. It is copied, later edits
+                                                          go through toggle and set_wall and leave it untouched.
+            source (tuple of int, optional): The (row, column) start node, the top-left corner by default.
+            destination (tuple of int, optional): The (row, column) goal node, the bottom-right corner by default.
+            h (str, optional): The heuristic, one of "euclid", "manhattan", "octile" or "chebyshev".
+                               Defaults to "manhattan", the tightest one on a 4-connected grid.
+        """
+
+        # A grid given by the caller, or mapped from a maze file, is copied so that toggle never writes to it.
+        # np.array unpacks the Bitset of a PackedSearchGrid to the one byte per cell the planner edits.
+        grid = as_search_grid(maze)
+        if isinstance(maze, SearchGrid) or hasattr(maze, "search_grid"):
+            grid = SearchGrid.from_padded(np.array(grid.walls, dtype=np.uint8), grid.rows, grid.cols)
+        self.grid = grid
+        self.source, self.destination = self.grid.endpoints(source, destination)
+        self.heuristic = grid_heuristic(self.grid, self.grid.node(self.destination), h)
+
+        # Costs and lookaheads, UNREACHED standing for infinity, and memoryviews of them for the loops
+        self.costs = np.full(self.grid.size, UNREACHED, dtype=np.int32)
+        self.lookaheads = np.full(self.grid.size, UNREACHED, dtype=np.int32)
+        self.g, self.rhs = memoryview(self.costs), memoryview(self.lookaheads)
+
+        # Priority queue of (key, cell) entries. A cell gets a new entry whenever its key changes, and
+        # entries that no longer match their cell's key are skipped when they come up.
+        self.queue = []
+        self.expanded = 0
+        self.path = np.zeros(0, dtype=self.grid.index_dtype)
+        self.update(self.source)
+
+    @property
+    def maze(self):
+        """
+        The current (rows, cols) maze, 1 for walls, as a view of the planner's wall grid.
+        """
+        return self.grid.unpad(self.grid.walls)
+
+    def key(self, cell):
+        """
+        Priority of a cell: like f and g in A*, with the smaller of its cost and lookahead as g.
+        """
+        g = min(self.g[cell], self.rhs[cell])
+        return (g + self.heuristic[cell], g)
+
+    def update(self, cell):
+        """
+        Recompute the lookahead of a cell and queue it if it became inconsistent.
+        """
+
+        # The source is searched from even when it is a wall, as in the other solvers
+        g, walls, source = self.g, self.grid.cells, self.source
+        if cell == source:
+            lookahead = 0
+        elif walls[cell]:
+            lookahead = UNREACHED
+        else:
+            lookahead = UNREACHED
+            for offset in self.grid.offsets:
+                node = cell + offset
+                if (not walls[node] or node == source) and g[node] < lookahead:
+                    lookahead = g[node]
+            lookahead = min(lookahead + 1, UNREACHED)
+        self.rhs[cell] = lookahead
+
+        if g[cell] != lookahead:
+            heapq.heappush(self.queue, (self.key(cell), cell))
+
+    def top_key(self):
+        """
+        Key of the first queued cell that is still inconsistent with that key, dropping stale entries.
+        """
+
+        queue, g, rhs = self.queue, self.g, self.rhs
+        while len(queue) != 0:
+            key, cell = queue[0]
+            if g[cell] != rhs[cell] and key == self.key(cell):
+                return key
+            heapq.heappop(queue)
+        return (float("inf"), float("inf"))
+
+    def set_wall(self, node, wall=True):
+        """
+        Add or remove the wall at a (row, column) node. The costs are repaired by the next solve().
+
+        Raises:
+            ValueError: If the node lies outside the maze.
+        """
+
+        cell = self.grid.endpoints(node, node)[0]
+        cells = self.grid.cells
+        if cells[cell] == int(wall):
+            return
+        cells[cell] = int(wall)
+
+        # Only the cell and the lookaheads of its neighbors depend on the wall
+        self.update(cell)
+        for offset in self.grid.offsets:
+            if not cells[cell + offset]:
+                self.update(cell + offset)
+
+    def toggle(self, nodes):
+        """
+        Flip the wall state of one (row, column) node or a list of them.
+        """
+
+        for node in np.reshape(nodes, (-1, 2)):
+            node = (int(node[0]), int(node[1]))
+            self.set_wall(node, not self.grid.cells[self.grid.index(node)])
+
+    def solve(self):
+        """
+        Repair the costs invalidated by the wall changes so far and return the current shortest path.
+
+        The first call is a plain A* search. Later calls only expand the cells whose cost changed, or
+        might have changed, on the way to the destination.
+
+        Returns:
+            SearchResult: The path, its length, the cells expanded by this call, and as visited cells the
+                          ones with a known cost.
+        """
+
+        g, rhs, walls, offsets = self.g, self.rhs, self.grid.cells, self.grid.offsets
+        destination = self.destination
+        expanded = 0
+
+        # Expand until the destination is consistent and no queued cell could still lower its cost
+        while self.top_key() < self.key(destination) or g[destination] != rhs[destination]:
+            _, cell = heapq.heappop(self.queue)
+            expanded += 1
+            if g[cell] > rhs[cell]:
+                # The cost dropped: settle it, as A* would
+                g[cell] = rhs[cell]
+            else:
+                # The cost rose: forget it and requeue the cell with its new lookahead
+                g[cell] = UNREACHED
+                self.update(cell)
+            for offset in offsets:
+                if not walls[cell + offset]:
+                    self.update(cell + offset)
+
+        self.expanded += expanded
+        if g[destination] == UNREACHED:
+            self.path = np.zeros(0, dtype=self.grid.index_dtype)
+        elif not self.path_is_current():
+            self.path = self.trace_path()
+        return self.grid.path_result("lpa-star", self.path, self.costs != UNREACHED, expanded)
+
+    def path_is_current(self):
+        """
+        True if the last path is still a shortest path: it is open and its costs still count up from 0 to the
+        cost of the destination. Most edits away from the path leave it so, and it is not traced again.
+        """
+
+        path = self.path
+        if len(path) == 0 or self.g[self.destination] != len(path) - 1:
+            return False
+        return bool((self.costs[path] == np.arange(len(path))).all() and not self.grid.walls[path[1:]].any())
+
+    def trace_path(self):
+        """
+        Walk from the destination back to the source, always to the cheapest open neighbor.
+        """
+
+        g, walls, offsets, source = self.g, self.grid.cells, self.grid.offsets, self.source
+        path = [self.destination]
+        cell = self.destination
+        while cell != source:
+            best, cost = cell, UNREACHED
+            for offset in offsets:
+                node = cell + offset
+                if g[node] < cost and (not walls[node] or node == source):
+                    best, cost = node, g[node]
+            cell = best
+            path.append(cell)
+        return np.array(path[::-1], dtype=self.grid.index_dtype)
+
+
+def lpa_star_solve(lpa_maze, components=None, source=None, destination=None, h="manhattan"):
+    """
+    One-off LPA* search, through the same interface as the other solvers. For repeated searches while the
+    walls change, keep an IncrementalPlanner instead.
+
+    Args:
+        lpa_maze (numpy.ndarray): The maze as a 2D array where 1 represents a wall. It is not modified.
+        components (ComponentIndex, optional): Connected-component index of the maze. When given and the
+                                               destination is in another component, no search is run.
+        source (tuple of int, optional): The (row, column) start node, the top-left corner by default.
+        destination (tuple of int, optional): The (row, column) goal node, the bottom-right corner by default.
+        h (str, optional): The heuristic. Defaults to "manhattan".
+
+    Returns:
+        SearchResult: The path, its length, the number of expanded cells and the cells given a cost.
+    """
+
+    # The component index answers unreachable queries without searching
+    unreachable = unreachable_result("lpa-star", lpa_maze, components, source, destination)
+    if unreachable is not None:
+        return unreachable
+    return IncrementalPlanner(lpa_maze, source, destination, h).solve()
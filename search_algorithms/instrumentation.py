@@ -0,0 +1,80 @@
+import time
+
+
+class SearchStats:
+    """
+    Opt-in counters that the solve functions report into.
+
+    Pass an instance as the `stats` argument of bfs_solve, dfs_solve or a_star_solve. Without it the
+    searches skip all bookkeeping: the loops only test one local flag per node taken off the frontier,
+    and the remaining counters are derived once the search is over. The counters add up over every
+    search reported into the same instance, except max_frontier which keeps the largest.
+
+    Attributes:
+        searches (int): Number of searches reported.
+        expanded (int): Nodes expanded, as in SearchResult.expanded.
+        neighbor_checks (int): Neighbor cells looked at by the expansions.
+        pushes (int): Entries put on the queue, stack or heap, the start nodes included.
+        pops (int): Entries taken off it, stale or already visited entries included.
+        max_frontier (int): Largest queue, stack or heap size seen when taking an entry off.
+        phases (dict): Seconds spent per phase ("setup", "heuristic", "search", "reconstruction").
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """
+        Set every counter back to zero.
+        """
+        self.searches = 0
+        self.expanded = 0
+        self.neighbor_checks = 0
+        self.pushes = 0
+        self.pops = 0
+        self.max_frontier = 0
+        self.phases = {}
+        self.lap_started = time.perf_counter()
+
+    def start(self):
+        """
+        Start timing the first phase of a search.
+        """
+        self.lap_started = time.perf_counter()
+
+    def lap(self, name):
+        """
+        Add the time since the last start() or lap() to the phase `name`.
+        """
+        now = time.perf_counter()
+        self.phases[name] = self.phases.get(name, 0.0) + now - self.lap_started
+        self.lap_started = now
+
+    def record(self, expanded, neighbor_checks, pushes, pops, max_frontier):
+        """
+        Add the counters of one finished search.
+        """
+        self.searches += 1
+        self.expanded += expanded
+        self.neighbor_checks += neighbor_checks
+        self.pushes += pushes
+        self.pops += pops
+        self.max_frontier = max(self.max_frontier, max_frontier)
+
+    def as_dict(self):
+        """
+        The counters and phase times as a plain dict, ready for json.dump or a CSV row.
+        """
+        return {
+            "searches": self.searches,
+            "expanded": self.expanded,
+            "neighbor_checks": self.neighbor_checks,
+            "pushes": self.pushes,
+            "pops": self.pops,
+            "max_frontier": self.max_frontier,
+            "phases": dict(self.phases),
+        }
+
+    def __repr__(self):
+        return f"SearchStats({self.as_dict()})"
+
@@ -0,0 +1,194 @@
+from search_algorithms.search_core import as_search_grid, fast_view, unreachable_result, UNREACHED
+from search_algorithms.heuristics import grid_heuristic
+import numpy as np
+import heapq
+
+
+def horizontal_jump(walls, width, node, direction, destination):
+    """
+    Scan from a cell along a row until a jump point, a wall or the destination.
+
+    A cell is a jump point when the cell above or below it is open while the one diagonally behind it
+    is a wall: a path turning there cannot be replaced by one turning earlier.
+
+    Args:
+        walls (memoryview): Wall flags of the padded grid.
+        width (int): Row stride of the padded grid.
+        node (int): Flat index of the cell the scan starts from (not itself checked).
+        direction (int): +1 to scan right, -1 to scan left.
+        destination (int): Flat index of the goal cell.
+
+    Returns:
+        int: Flat index of the jump point, or -1 if the scan ran into a wall.
+    """
+
+    while True:
+        node += direction
+        if walls[node]:
+            return -1
+        if node == destination:
+            return node
+        behind = node - direction
+        if (not walls[node - width] and walls[behind - width]) or (not walls[node + width] and walls[behind + width]):
+            return node
+
+
+def vertical_jump(walls, width, node, direction, destination):
+    """
+    Scan from a cell along a column until a jump point, a wall or the destination.
+
+    Besides the forced neighbors to the left and right, a cell is a jump point when a horizontal scan
+    from it finds a jump point, since paths are only allowed to turn from vertical to horizontal there.
+
+    Args:
+        walls (memoryview): Wall flags of the padded grid.
+        width (int): Row stride of the padded grid.
+        node (int): Flat index of the cell the scan starts from (not itself checked).
+        direction (int): +width to scan down, -width to scan up.
+        destination (int): Flat index of the goal cell.
+
+    Returns:
+        int: Flat index of the jump point, or -1 if the scan ran into a wall.
+    """
+
+    while True:
+        node += direction
+        if walls[node]:
+            return -1
+        if node == destination:
+            return node
+        behind = node - direction
+        if (not walls[node - 1] and walls[behind - 1]) or (not walls[node + 1] and walls[behind + 1]):
+            return node
+        if horizontal_jump(walls, width, node, 1, destination) != -1 \
+                or horizontal_jump(walls, width, node, -1, destination) != -1:
+            return node
+
+
+def jump_point_path(grid, parents, source, destination):
+    """
+    Expand the chain of jump points into the full list of cells, filling in the straight segments.
+
+    Returns:
+        numpy.ndarray: Flat indices of the path, from the source to the destination.
+    """
+
+    jump_points = grid.trace_path(parents, source, destination)
+    path = [source]
+    for start, end in zip(jump_points[:-1].tolist(), jump_points[1:].tolist()):
+        # Consecutive jump points share a row or a column
+        step = grid.width if abs(end - start) >= grid.width else 1
+        step = step if end > start else -step
+        path.extend(range(start + step, end + step, step))
+    return np.array(path, dtype=grid.index_dtype)
+
+
+def jps_solve(jps_maze, components=None, source=None, destination=None):
+    """
+    Jump Point Search (4-connected variant) from the source (top-left) to the destination (bottom-right).
+
+    The maze is a uniform-cost 4-connected grid, so most shortest paths have many symmetric variants.
+    JPS only puts jump points on the open list: from each expanded cell it scans straight ahead in the
+    pruned directions and stops at cells where a path has to turn. The scans are plain loops over the
+    wall grid, which makes them much cheaper than pushing every open neighbor onto the heap as A* does.
+    Paths turn from vertical to horizontal at jump points only, and the search is A* over jump points
+    with the Manhattan heuristic, so the path length is optimal.
+
+    Args:
+        jps_maze (numpy.ndarray): The maze as a 2D array where 1 represents a wall. It is not modified.
+        components (ComponentIndex, optional): Connected-component index of the maze. When given and the
+                                               destination is in another component, no search is run.
+        source (tuple of int, optional): The (row, column) start node, the top-left corner by default.
+        destination (tuple of int, optional): The (row, column) goal node, the bottom-right corner by default.
+
+    Returns:
+        SearchResult: The full cell path, its length, the number of expanded jump points and the mask of
+                      the jump points reached.
+    """
+
+    # The component index answers unreachable queries without searching
+    unreachable = unreachable_result("jps", jps_maze, components, source, destination)
+    if unreachable is not None:
+        return unreachable
+
+    grid = as_search_grid(jps_maze)
+    source, destination = grid.endpoints(source, destination)
+    heuristic = grid_heuristic(grid, grid.node(destination), "manhattan")
+    walls, width = grid.cells, grid.width
+
+    jps_parent, jps_closed = grid.new_parents(), grid.new_visited()
+    g_array = np.full(grid.size, UNREACHED, dtype=np.int32)
+    parents, closed, g_costs = memoryview(jps_parent), fast_view(jps_closed), memoryview(g_array)
+
+    # The open list holds (f, -g, node), ties in f go to the jump point furthest from the source
+    g_costs[source] = 0
+    jps_p_queue = [(heuristic[source], 0, source)]
+    path_found = 0
+    expanded = 0
+
+    while len(jps_p_queue) != 0:
+        _, neg_cost, cur_node = heapq.heappop(jps_p_queue)
+
+        # Skip stale entries of jump points that were reached again more cheaply
+        if closed[cur_node] or -neg_cost != g_costs[cur_node]:
+            continue
+        closed[cur_node] = 1
+        expanded += 1
+
+        if cur_node == destination:
+            path_found = 1
+            break
+
+        # Pruned directions: all four from the source, otherwise straight on and both perpendicular ones
+        parent = parents[cur_node]
+        if parent == -1:
+            directions = (-1, -width, width, 1)
+        elif abs(cur_node - parent) < width:
+            direction = 1 if cur_node > parent else -1
+            directions = (direction, -width, width)
+        else:
+            direction = width if cur_node > parent else -width
+            directions = (direction, -1, 1)
+
+        for direction in directions:
+            if direction == 1 or direction == -1:
+                jump_point = horizontal_jump(walls, width, cur_node, direction, destination)
+            else:
+                jump_point = vertical_jump(walls, width, cur_node, direction, destination)
+            if jump_point == -1:
+                continue
+
+            # Jump points are in a straight line from the current one
+            distance = abs(jump_point - cur_node)
+            next_cost = -neg_cost + (distance if distance < width else distance // width)
+            if next_cost < g_costs[jump_point]:
+                g_costs[jump_point] = next_cost
+                parents[jump_point] = cur_node
+                heapq.heappush(jps_p_queue, (heuristic[jump_point] + next_cost, -next_cost, jump_point))
+
+    reached = (g_array != UNREACHED).view(np.uint8)
+    if not path_found:
+        return grid.path_result("jps", np.zeros(0, dtype=np.int32), reached, expanded)
+    return grid.path_result("jps", jump_point_path(grid, parents, source, destination), reached, expanded)
+
+
+def jump_point_search(jps_maze, display=True):
+    """
+    Solve the maze with Jump Point Search and optionally plot the explored maze and the path.
+
+    Args:
+        jps_maze (numpy.ndarray): The maze to be solved, represented as a 2D array where 1 is a wall.
+        display (bool, optional): If True, display the result of the search. Defaults to True.
+                                  matplotlib is only imported in that case.
+
+    Returns:
+        int: 1 if a path is found, 0 otherwise.
+    """
+
+    result = jps_solve(jps_maze)
+
+    if display:
+        from util.maze_plotter import plot_result
+        print("Path Found!!!!" if result.found else "No Path found :(")
+        plot_result(jps_maze, result)
+    return int(result.found)
@@ -0,0 +1,176 @@
+from search_algorithms.search_core import as_search_grid, SearchResult, as_nodes
+from search_algorithms.bread_first_search import bfs_solve
+from collections import OrderedDict, deque
+import numpy as np
+
+
+def bfs_distance_field(grid, goals):
+    """
+    Number of steps from every cell to the nearest goal, from one multi-source BFS started at the goals.
+
+    Args:
+        grid (SearchGrid): The grid to measure.
+        goals (list of int): Flat indices of the goal cells.
+
+    Returns:
+        tuple: The flat int32 distance array of the padded grid (-1 for walls and unreachable cells) and
+               the number of cells expanded to build it.
+    """
+
+    field = np.full(grid.size, -1, dtype=np.int32)
+    distances, walls, offsets = memoryview(field), grid.cells, grid.offsets
+
+    queue = deque()
+    for goal in goals:
+        if not walls[goal] and distances[goal] == -1:
+            distances[goal] = 0
+            queue.append(goal)
+
+    expanded = 0
+    while len(queue) != 0:
+        cur_node = queue.popleft()
+        expanded += 1
+        next_distance = distances[cur_node] + 1
+        for offset in offsets:
+            node = cur_node + offset
+            if walls[node] or distances[node] != -1:
+                continue
+            distances[node] = next_distance
+            queue.append(node)
+
+    return field, expanded
+
+
+class MazeQueries:
+    """
+    Answers many start/goal queries on one maze.
+
+    A query either runs a multi-source, multi-target BFS, or, for goal sets asked for repeatedly,
+    builds a full BFS distance field from the goals once. Later queries to the same goals then
+    follow the field downhill from the start, without running another search. Fields are kept
+    in an LRU cache bounded by bytes.
+
+    Example:
+        queries = MazeQueries(maze)
+        result = queries.path((5, 3), [(0, 0), (99, 99)])
+        steps = queries.distance((5, 3), (99, 99))
+    """
+
+    def __init__(self, maze, max_bytes=256 * 2**20):
+        """
+        Args:
+            maze (numpy.ndarray): The maze as a 2D array where 1 represents a wall. It is not modified.
+            max_bytes (int, optional): Maximum total size of the cached distance fields. Defaults to 256 MiB.
+        """
+        self.maze = maze
+        self.grid = as_search_grid(maze)
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.fields = OrderedDict()
+
+    def goal_key(self, goals):
+        """
+        Cache key of a goal node or set of goal nodes: their sorted flat indices.
+        """
+        return tuple(sorted({self.grid.endpoints(node, node)[0] for node in as_nodes(goals)}))
+
+    def padded_field(self, goals):
+        """
+        Flat distance field of the padded grid for the goals, built and cached on a miss.
+
+        Returns:
+            tuple: The field and the number of cells expanded to build it, 0 when it came from the cache.
+        """
+
+        key = self.goal_key(goals)
+        field = self.fields.get(key)
+        if field is not None:
+            self.fields.move_to_end(key)
+            return field, 0
+
+        field, expanded = bfs_distance_field(self.grid, key)
+        field.setflags(write=False)
+
+        # Fields larger than the whole budget are returned without being cached
+        if field.nbytes <= self.max_bytes:
+            while self.nbytes + field.nbytes > self.max_bytes:
+                _, evicted = self.fields.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+            self.fields[key] = field
+            self.nbytes += field.nbytes
+        return field, expanded
+
+    def distance_field(self, goals):
+        """
+        Distances from every cell to the nearest of the goals.
+
+        Args:
+            goals (tuple | list of tuple): A (row, column) goal node or a list of them.
+
+        Returns:
+            numpy.ndarray: Read-only int32 (rows, cols) distances, -1 for walls and cells with no path.
+        """
+        return self.grid.unpad(self.padded_field(goals)[0])
+
+    def distance(self, starts, goals):
+        """
+        Number of steps of the shortest path from any of the starts to any of the goals, -1 if there is none.
+        """
+
+        field, _ = self.padded_field(goals)
+        reachable = [int(field[self.grid.endpoints(node, node)[0]]) for node in as_nodes(starts)]
+        reachable = [distance for distance in reachable if distance != -1]
+        return min(reachable) if len(reachable) != 0 else -1
+
+    def path(self, starts, goals, cache=True):
+        """
+        Shortest path from the nearest of the starts to the nearest of the goals.
+
+        Args:
+            starts (tuple | list of tuple): A (row, column) start node or a list of them.
+            goals (tuple | list of tuple): A (row, column) goal node or a list of them.
+            cache (bool, optional): If True, answer from the goals' distance field, building and caching it
+                                    if needed. If False, use an already cached field or else run a
+                                    multi-source, multi-target BFS. Defaults to True.
+
+        Returns:
+            SearchResult: The path and its length. `expanded` counts the cells searched for this query, which
+                          is 0 when the distance field was already cached. The visited mask is empty when
+                          the answer came from a distance field.
+        """
+
+        if not cache and self.goal_key(goals) not in self.fields:
+            return bfs_solve(self.maze, sources=starts, destinations=goals)
+
+        field, expanded = self.padded_field(goals)
+        grid = self.grid
+        no_visits = np.broadcast_to(False, (grid.rows, grid.cols))
+
+        # Start from the start cell closest to the goals
+        start_cells = [grid.endpoints(node, node)[0] for node in as_nodes(starts)]
+        start_cells = [cell for cell in start_cells if field[cell] != -1]
+        if len(start_cells) == 0:
+            return SearchResult("distance-field", False, np.zeros(0, dtype=np.int32), expanded, no_visits)
+        cur_node = min(start_cells, key=lambda cell: field[cell])
+
+        # Walk downhill: every cell at distance d > 0 has a neighbor at distance d - 1
+        distances, offsets = memoryview(field), grid.offsets
+        path = [cur_node]
+        distance = distances[cur_node]
+        while distance != 0:
+            distance -= 1
+            for offset in offsets:
+                if distances[cur_node + offset] == distance:
+                    cur_node += offset
+                    break
+            path.append(cur_node)
+
+        path = grid.maze_indices(path)
+        return SearchResult("distance-field", True, path, expanded, no_visits)
+
+    def clear(self):
+        """
+        Drop every cached distance field.
+        """
+        self.fields.clear()
+        self.nbytes = 0
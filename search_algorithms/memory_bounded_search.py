@@ -0,0 +1,276 @@
+from search_algorithms.search_core import as_search_grid, unreachable_result
+from search_algorithms.heuristics import grid_heuristic
+import heapq
+import numpy as np
+
+
+def reached_result(grid, algorithm, path, reached, expanded):
+    """
+    Package a path and the flat indices of the cells a memory-bounded search stored as a SearchResult.
+    The full-size visited bitmap is only built here, once the search is over.
+    """
+
+    visited = grid.new_visited()
+    for cell in reached:
+        visited[cell] = 1
+    return grid.path_result(algorithm, np.array(path, dtype=grid.index_dtype), visited, expanded)
+
+
+def ida_star_solve(ida_maze, h="manhattan", components=None, source=None, destination=None, table_size=2**16,
+                   max_expanded=None, stats=None):
+    """
+    Iterative-deepening A* (IDA*): repeated depth-first searches bounded by f = g + h, raising the bound to the
+    smallest f that exceeded it until the destination is reached.
+
+    Only the current path is kept, plus a transposition table of at most `table_size` cells with the
+    smallest g each was reached with. Without the table (table_size=0) IDA* is optimal in O(path length)
+    memory, but on a grid it walks the many equivalent paths around every obstacle again and again, so its
+    expansions grow exponentially. A table holding the cells around the path prunes most of these repeats,
+    and one holding the whole reachable region also stops the search on an unreachable destination once
+    the region is exhausted. Too small a table falls back to the exponential behaviour, so expansions trade
+    off against table_size, never against optimality. The heuristic is computed on demand, so no per-cell
+    array is allocated. The path is optimal unless max_expanded stops the search first.
+
+    Args:
+        ida_maze (numpy.ndarray): The maze as a 2D array where 1 represents a wall. It is not modified.
+        h (str, optional): The heuristic, one of "euclid", "manhattan", "octile" or "chebyshev".
+                           Defaults to "manhattan", the tightest one on a 4-connected grid.
+        components (ComponentIndex, optional): Connected-component index of the maze. When given and the
+                                               destination is in another component, no search is run.
+        source (tuple of int, optional): The (row, column) start node, the top-left corner by default.
+        destination (tuple of int, optional): The (row, column) goal node, the bottom-right corner by default.
+        table_size (int, optional): Maximum number of cells in the transposition table. Defaults to 65536.
+        max_expanded (int, optional): Give up, reporting no path, after this many expansions. Unlimited by default.
+        stats (SearchStats, optional): Counters the search reports into. max_frontier is the largest number of
+                                       cells stored at once, on the path and in the table.
+
+    Returns:
+        SearchResult: The path, its length, the expansions over all iterations, and as visited cells the
+                      ones stored in the table.
+    """
+
+    # The component index answers unreachable queries without searching
+    unreachable = unreachable_result("ida-star", ida_maze, components, source, destination)
+    if unreachable is not None:
+        return unreachable
+
+    counting = stats is not None
+    if counting:
+        stats.start()
+
+    grid = as_search_grid(ida_maze)
+    source, destination = grid.endpoints(source, destination)
+    heuristic = grid_heuristic(grid, grid.node(destination), h, lazy=True)
+    walls, offsets = grid.cells, grid.offsets
+    if counting:
+        stats.lap("setup")
+
+    # The table maps a cell to the smallest g it was reached with so far and the iteration that reached it
+    # with that g. It is kept across iterations: a cell reached more cheaply before is reached that cheaply
+    # again under the higher bound, so a costlier visit can be pruned at once.
+    expanded, peak, checks = 0, 0, 0
+    threshold = heuristic[source]
+    found = source == destination
+    path, table = [source], {}
+    iteration = 0
+
+    while not found and threshold != float("inf"):
+        # One depth-first pass with the current bound. The path holds the cells from the source, and
+        # next_offset the index of the next offset to try from each of them.
+        iteration += 1
+        path, next_offset, on_path = [source], [0], {source}
+        table[source] = (0, iteration)
+        next_threshold = float("inf")
+        expanded += 1
+
+        # Cells expanded in this iteration, and whether the pass saw a cell it could not store or an
+        # unknown cell beyond the bound. If neither, and every stored cell was expanded, the pass covered
+        # the whole region reachable from the source and raising the bound cannot find the destination.
+        touched, open_region = 1, False
+
+        while len(path) != 0 and not found:
+            if max_expanded is not None and expanded >= max_expanded:
+                break
+
+            cur_node, k = path[-1], next_offset[-1]
+            if k == len(offsets):
+                # Every neighbor is done, backtrack
+                on_path.discard(path.pop())
+                next_offset.pop()
+                continue
+            next_offset[-1] = k + 1
+            checks += 1
+
+            node = cur_node + offsets[k]
+            if walls[node] or node in on_path:
+                continue
+            cost = len(path)
+            best = table.get(node)
+            f = cost + heuristic[node]
+            if f > threshold:
+                next_threshold = min(next_threshold, f)
+                open_region = open_region or best is None
+                continue
+
+            # Skip cells reached more cheaply, or as cheaply in this iteration, their subtree is covered
+            if best is not None and (best[0] < cost or (best[0] == cost and best[1] == iteration)):
+                continue
+            if best is None and len(table) >= table_size:
+                open_region = True
+            else:
+                touched += best is None or best[1] != iteration
+                table[node] = (cost, iteration)
+
+            path.append(node)
+            next_offset.append(0)
+            on_path.add(node)
+            expanded += 1
+            if counting:
+                peak = max(peak, len(path) + len(table))
+            found = node == destination
+
+        if max_expanded is not None and expanded >= max_expanded:
+            break
+        if not found and not open_region and touched == len(table):
+            break
+        threshold = next_threshold
+
+    if counting:
+        stats.lap("search")
+        stats.record(expanded, checks, expanded, expanded, peak)
+
+    reached = set(table) | set(path)
+    return reached_result(grid, "ida-star", path if found else [], reached, expanded)
+
+
+def beam_search_solve(beam_maze, width=64, h="manhattan", components=None, source=None, destination=None,
+                      stats=None):
+    """
+    Beam search: a breadth-first search that keeps only the `width` cells of each level closest to the
+    destination by the heuristic, ties going to the cell discovered first.
+
+    Memory is bounded by the beam, plus the parent links of the cells it kept, O(width x path length),
+    instead of the whole grid. The price is optimality and completeness: the path found is as long as the
+    level the destination was first reached at, which can be longer than the shortest path, and no path is
+    found when every way to the destination was pruned. Wider beams trade memory for shorter paths; with an
+    unbounded width it is plain BFS.
+
+    Args:
+        beam_maze (numpy.ndarray): The maze as a 2D array where 1 represents a wall. It is not modified.
+        width (int, optional): Number of cells kept per level. Defaults to 64.
+        h (str, optional): The heuristic ranking the cells of a level. Defaults to "manhattan".
+        components (ComponentIndex, optional): Connected-component index of the maze. When given and the
+                                               destination is in another component, no search is run.
+        source (tuple of int, optional): The (row, column) start node, the top-left corner by default.
+        destination (tuple of int, optional): The (row, column) goal node, the bottom-right corner by default.
+        stats (SearchStats, optional): Counters the search reports into. max_frontier is the largest level
+                                       before pruning.
+
+    Returns:
+        SearchResult: The path, its length, the number of expanded cells and as visited cells the ones kept.
+    """
+
+    # The component index answers unreachable queries without searching
+    unreachable = unreachable_result("beam-search", beam_maze, components, source, destination)
+    if unreachable is not None:
+        return unreachable
+
+    counting = stats is not None
+    if counting:
+        stats.start()
+
+    grid = as_search_grid(beam_maze)
+    source, destination = grid.endpoints(source, destination)
+    heuristic = grid_heuristic(grid, grid.node(destination), h, lazy=True)
+    walls, offsets = grid.cells, grid.offsets
+    if counting:
+        stats.lap("setup")
+
+    # Parent links of every cell ever kept in the beam, which doubles as the visited set
+    parents = {source: -1}
+    beam = [source]
+    expanded, pushes, largest = 0, 1, 0
+    found = source == destination
+
+    while len(beam) != 0 and not found:
+        level = []
+        for cur_node in beam:
+            expanded += 1
+            for offset in offsets:
+                node = cur_node + offset
+                if walls[node] or node in parents:
+                    continue
+                parents[node] = cur_node
+                level.append(node)
+                if node == destination:
+                    found = True
+                    break
+            if found:
+                break
+
+        # Keep the best cells of the level and forget the parent links of the pruned ones
+        largest = max(largest, len(level))
+        if not found and len(level) > width:
+            kept = heapq.nsmallest(width, level, key=lambda cell: heuristic[cell])
+            for cell in set(level).difference(kept):
+                del parents[cell]
+            level = kept
+        pushes += len(level)
+        beam = level
+
+    if counting:
+        stats.lap("search")
+        stats.record(expanded, len(offsets) * expanded, pushes, expanded, largest)
+
+    path = []
+    if found:
+        path = [destination]
+        while parents[path[-1]] != -1:
+            path.append(parents[path[-1]])
+        path.reverse()
+    return reached_result(grid, "beam-search", path, parents, expanded)
+
+
+def ida_star_search(ida_maze, display=True):
+    """
+    Solve the maze with IDA* and optionally plot the stored cells and the path.
+
+    Args:
+        ida_maze (numpy.ndarray): The maze to be solved, represented as a 2D array where 1 is a wall.
+        display (bool, optional): If True, display the result of the search. Defaults to True.
+                                  matplotlib is only imported in that case.
+
+    Returns:
+        int: 1 if a path is found, 0 otherwise.
+    """
+
+    result = ida_star_solve(ida_maze)
+
+    if display:
+        from util.maze_plotter import plot_result
+        print("Path Found!!!!" if result.found else "No Path found :(")
+        plot_result(ida_maze, result)
+    return int(result.found)
+
+
+def beam_search(beam_maze, width=64, display=True):
+    """
+    Solve the maze with beam search and optionally plot the kept cells and the path.
+
+    Args:
+        beam_maze (numpy.ndarray): The maze to be solved, represented as a 2D array where 1 is a wall.
+        width (int, optional): Number of cells kept per level. Defaults to 64.
+        display (bool, optional): If True, display the result of the search. Defaults to True.
+                                  matplotlib is only imported in that case.
+
+    Returns:
+        int: 1 if a path is found, 0 otherwise.
+    """
+
+    result = beam_search_solve(beam_maze, width)
+
+    if display:
+        from util.maze_plotter import plot_result
+        print("Path Found!!!!" if result.found else "No Path found :(")
+        plot_result(beam_maze, result)
+    return int(result.found)
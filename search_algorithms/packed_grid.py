@@ -0,0 +1,137 @@
+from search_algorithms.search_core import SearchGrid
+import numpy as np
+
+
+class Bitset:
+    """
+    Fixed-size set of bit flags packed 8 per byte, least significant bit first.
+
+    It is indexed like the uint8 flag arrays of the searches (`bits[i]`, `bits[i] = 1`), so a solver loop
+    runs unchanged on it, at an eighth of the memory. Each access is a Python method call, so the loops
+    run slower than on a memoryview: packing trades speed for memory on mazes that would not fit otherwise.
+
+    Attributes:
+        size (int): Number of flags.
+        bits (numpy.ndarray): The packed uint8 bytes, possibly a memory-mapped file.
+    """
+
+    def __init__(self, size, bits=None):
+        """
+        Args:
+            size (int): Number of flags.
+            bits (numpy.ndarray, optional): Existing packed bytes to use without copying. All flags start
+                                            cleared when it is None.
+        """
+
+        self.size = size
+        self.bits = np.zeros((size + 7) // 8, dtype=np.uint8) if bits is None else bits
+        if len(self.bits) * 8 < size:
+            raise ValueError(f"{len(self.bits)} bytes cannot hold {size} flags")
+        self.bytes = memoryview(self.bits)
+
+    @classmethod
+    def from_flags(cls, flags):
+        """
+        Pack a flat array of flags, nonzero meaning set.
+        """
+        flags = np.asarray(flags).reshape(-1)
+        return cls(len(flags), np.packbits(flags != 0, bitorder="little"))
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        return (self.bytes[index >> 3] >> (index & 7)) & 1
+
+    def __setitem__(self, index, value):
+        if value:
+            self.bytes[index >> 3] |= 1 << (index & 7)
+        else:
+            self.bytes[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def get_many(self, indices):
+        """
+        Vectorized lookup: the flags at an array of indices, as a uint8 array of 0 and 1.
+        """
+        indices = np.asarray(indices)
+        return (self.bits[indices >> 3] >> (indices & 7).astype(np.uint8)) & 1
+
+    def set_many(self, indices):
+        """
+        Vectorized update: set the flags at an array of indices, repeated indices included.
+        """
+        indices = np.asarray(indices)
+        np.bitwise_or.at(self.bits, indices >> 3, np.left_shift(1, indices & 7).astype(np.uint8))
+
+    def unpack(self):
+        """
+        The flags as a flat uint8 array of 0 and 1, one byte per flag.
+        """
+        return np.unpackbits(self.bits, count=self.size, bitorder="little")
+
+    def __array__(self, dtype=None, copy=None):
+        flags = self.unpack()
+        return flags if dtype is None else flags.astype(dtype)
+
+    @property
+    def nbytes(self):
+        return self.bits.nbytes
+
+
+class PackedSearchGrid(SearchGrid):
+    """
+    SearchGrid whose wall flags, and the visited bitmaps of its searches, take one bit per cell.
+
+    Every solve function accepts it in place of the maze. The wall grid shrinks 8x, and so does each
+    uint8 visited or closed bitmap of the search. Parent and cost arrays keep their size.
+
+    The solver loops test one bit at a time, through Bitset.__getitem__, and run unchanged on it. Only
+    open_neighbors, used by util.traversable_neighbors, reads packed words: from Python its byte
+    arithmetic costs more than the four single-bit lookups it replaces, so the loops do not use it.
+
+    Example:
+        grid = PackedSearchGrid(maze)
+        result = bfs_solve(grid)
+    """
+
+    def __init__(self, maze):
+        """
+        Args:
+            maze (numpy.ndarray): The maze as a 2D array where 1 represents a wall. It is not modified.
+        """
+
+        maze = np.asarray(maze)
+        rows, cols = maze.shape
+
+        # Pad the maze with walls on every side, then pack the flags
+        walls = np.ones((rows + 2, cols + 2), dtype=bool)
+        walls[1:-1, 1:-1] = maze == 1
+        self.set_walls(Bitset.from_flags(walls), rows, cols)
+
+    def new_visited(self):
+        """
+        Allocate a visited bitset for a search, one bit per cell of the padded grid.
+        """
+        return Bitset(self.size)
+
+    def open_neighbors(self, index):
+        """
+        Flat indices of the open neighbors of a cell, read from the packed words of its row and the two
+        rows next to it instead of one bit at a time. The search loops keep to per-bit lookups, which
+        are faster from Python.
+        """
+
+        bits, width = self.walls.bits, self.width
+
+        # A 16-bit word starting at the byte of the left neighbor holds the left and right neighbors. When
+        # that byte is the last one, the right neighbor is in it too and the high byte is left empty.
+        first = (index - 1) >> 3
+        shift = (index - 1) & 7
+        high = int(bits[first + 1]) << 8 if first + 1 < len(bits) else 0
+        row = (int(bits[first]) | high) >> shift
+        above = bits[(index - width) >> 3] >> ((index - width) & 7)
+        below = bits[(index + width) >> 3] >> ((index + width) & 7)
+
+        # Same order as `offsets`: left, up, down, right
+        blocked = (row & 1, above & 1, below & 1, (row >> 2) & 1)
+        return [index + offset for offset, wall in zip(self.offsets, blocked) if not wall]
@@ -0,0 +1,348 @@
+import numpy as np
+
+# Cost of an unreached cell in the int32 g arrays of the searches
+UNREACHED = np.iinfo(np.int32).max
+
+
+class SearchGrid:
+    """
+    Flat, array-backed view of a maze shared by the search algorithms.
+
+    Cells are addressed by a single int index into a copy of the maze padded with a border of walls,
+    so the four neighbors of any open cell are always `index + offset` for the offsets in `offsets`
+    and the searches never need a bounds check. Wall flags are stored as one uint8 per cell.
+
+    Attributes:
+        rows (int): Number of rows of the maze.
+        cols (int): Number of columns of the maze.
+        width (int): Row stride of the padded grid (cols + 2).
+        size (int): Number of cells of the padded grid.
+        walls (numpy.ndarray): Flat uint8 array, 1 for walls (including the border) and 0 for open cells.
+        cells (memoryview): Memoryview of `walls`, which is much faster to index from Python than the array.
+        offsets (tuple of int): Index offsets of the left, up, down and right neighbors, in that order.
+        index_dtype (numpy.dtype): int32, or int64 for grids with more than 2**31 - 1 cells. Parent
+                                   arrays and paths hold flat indices of this type.
+    """
+
+    def __init__(self, maze):
+        """
+        Args:
+            maze (numpy.ndarray): The maze as a 2D array where 1 represents a wall. It is not modified.
+        """
+
+        maze = np.asarray(maze)
+        rows, cols = maze.shape
+
+        # Pad the maze with walls on every side, as one byte per cell
+        walls = np.ones((rows + 2, cols + 2), dtype=np.uint8)
+        walls[1:-1, 1:-1] = maze == 1
+        self.set_walls(walls.reshape(-1), rows, cols)
+
+    @classmethod
+    def from_padded(cls, walls, rows, cols):
+        """
+        Wrap an already padded flat wall array without copying it, such as a memory-mapped maze file.
+
+        Args:
+            walls (numpy.ndarray): Flat uint8 array of (rows + 2) * (cols + 2) wall flags, whose border cells
+                                   are all walls. It is only read.
+            rows (int): Number of rows of the maze.
+            cols (int): Number of columns of the maze.
+        """
+
+        grid = cls.__new__(cls)
+        grid.set_walls(walls, rows, cols)
+        return grid
+
+    def set_walls(self, walls, rows, cols):
+        """
+        Set the flat padded wall array and the geometry derived from the maze shape.
+        """
+
+        self.rows, self.cols = rows, cols
+        self.width = cols + 2
+        self.size = (rows + 2) * self.width
+        if len(walls) != self.size:
+            raise ValueError(f"expected {self.size} padded cells for a {rows}x{cols} maze, got {len(walls)}")
+        self.walls = walls
+        self.cells = fast_view(walls)
+        self.index_dtype = np.dtype(np.int32 if self.size <= np.iinfo(np.int32).max else np.int64)
+
+        # The offsets for the four possible neighbors of a cell, in the order used by traversable_neighbors
+        # left, up, down, right
+        self.offsets = (-1, -self.width, self.width, 1)
+
+    @property
+    def shape(self):
+        """
+        Shape (rows, cols) of the maze, so np.shape works on a grid as on a maze array.
+        """
+        return (self.rows, self.cols)
+
+    def index(self, node):
+        """
+        Convert a (row, column) node of the maze to its flat index.
+        """
+        return (node[0] + 1) * self.width + node[1] + 1
+
+    def endpoints(self, source=None, destination=None):
+        """
+        Flat indices of the start and goal cells of a search, by default the top-left and bottom-right corners.
+
+        Args:
+            source (tuple of int, optional): The (row, column) start node.
+            destination (tuple of int, optional): The (row, column) goal node.
+
+        Returns:
+            tuple of int: Flat indices of the source and the destination.
+
+        Raises:
+            ValueError: If a node lies outside the maze.
+        """
+
+        source = (0, 0) if source is None else source
+        destination = (self.rows - 1, self.cols - 1) if destination is None else destination
+        for node in (source, destination):
+            if not (0 <= node[0] < self.rows and 0 <= node[1] < self.cols):
+                raise ValueError(f"node {tuple(node)} is outside the {self.rows}x{self.cols} maze")
+        return self.index(source), self.index(destination)
+
+    def node(self, index):
+        """
+        Convert a flat index back to its (row, column) node in the maze.
+        """
+        i, j = divmod(int(index), self.width)
+        return (i - 1, j - 1)
+
+    def new_parents(self):
+        """
+        Allocate a parent array for a search, -1 meaning "no parent".
+
+        Returns:
+            numpy.ndarray: Flat array of index_dtype with one entry per cell of the padded grid.
+        """
+        return np.full(self.size, -1, dtype=self.index_dtype)
+
+    def new_visited(self):
+        """
+        Allocate a visited bitmap for a search, one uint8 flag per cell of the padded grid.
+        """
+        return np.zeros(self.size, dtype=np.uint8)
+
+    def open_neighbors(self, index):
+        """
+        Flat indices of the open neighbors of a cell, in the order of `offsets`.
+        """
+        cells = self.cells
+        return [index + offset for offset in self.offsets if not cells[index + offset]]
+
+    def trace_path(self, parents, source, destination):
+        """
+        Follow the parent links from the destination back to the source.
+
+        Args:
+            parents (numpy.ndarray | memoryview): Parent array filled by a search.
+            source (int | None): Flat index of the start cell, or None to stop at the first cell without a
+                                 parent, as for searches started from several cells.
+            destination (int): Flat index of the goal cell, which must have been reached.
+
+        Returns:
+            numpy.ndarray: Flat indices of the path, from the source to the destination.
+        """
+
+        path = [destination]
+        if source is None:
+            while parents[path[-1]] != -1:
+                path.append(parents[path[-1]])
+        else:
+            while path[-1] != source:
+                path.append(parents[path[-1]])
+        return np.array(path[::-1], dtype=self.index_dtype)
+
+    def unpad(self, flags):
+        """
+        Crop a flat per-cell array of the padded grid back to the (rows, cols) shape of the maze.
+        """
+        return np.asarray(flags).reshape(self.rows + 2, self.width)[1:-1, 1:-1]
+
+    def maze_indices(self, indices):
+        """
+        Convert flat indices of the padded grid to flat indices of the maze itself (row * cols + col).
+        """
+        rows, cols = np.divmod(np.asarray(indices, dtype=self.index_dtype), self.width)
+        return ((rows - 1) * self.cols + cols - 1).astype(self.index_dtype)
+
+    def neighbor_checks(self, expanded, parents, destination):
+        """
+        Number of neighbor cells looked at by a search that checks all four neighbors of every expanded
+        node, except for the last one when it stops as soon as it reaches the destination as a neighbor.
+
+        Args:
+            expanded (int): Number of nodes expanded by the search.
+            parents (numpy.ndarray | memoryview): Parent array filled by the search.
+            destination (int): Flat index of the goal cell reached, -1 if there is none.
+
+        Returns:
+            int: The number of neighbor checks.
+        """
+
+        checks = len(self.offsets) * expanded
+        if destination != -1 and parents[destination] != -1 and expanded != 0:
+            # The offsets after the one leading to the destination were never checked
+            checks -= len(self.offsets) - 1 - self.offsets.index(destination - parents[destination])
+        return checks
+
+    def make_result(self, algorithm, found, parents, visited, source, destination, expanded):
+        """
+        Package the state of a finished search as a SearchResult.
+
+        Args:
+            algorithm (str): Name of the search.
+            found (bool): True if the destination was reached.
+            parents (numpy.ndarray | memoryview): Parent array filled by the search.
+            visited (numpy.ndarray): Visited bitmap filled by the search.
+            source (int): Flat index of the start cell.
+            destination (int): Flat index of the goal cell.
+            expanded (int): Number of nodes expanded by the search.
+
+        Returns:
+            SearchResult: The result, whose visited mask is a view of the search's bitmap.
+        """
+
+        path = self.trace_path(parents, source, destination) if found else np.zeros(0, dtype=np.int32)
+        return self.path_result(algorithm, path, visited, expanded)
+
+    def path_result(self, algorithm, path, visited, expanded, cost=None):
+        """
+        Package an already traced path as a SearchResult, an empty path meaning no path was found.
+
+        Args:
+            algorithm (str): Name of the search.
+            path (numpy.ndarray): Flat indices of the padded grid, from the source to the destination.
+            visited (numpy.ndarray): Visited bitmap filled by the search, holding only 0 and 1.
+            expanded (int): Number of nodes expanded by the search.
+            cost (int, optional): Cost of the path, for searches on a cost grid.
+
+        Returns:
+            SearchResult: The result, whose visited mask is a view of the search's bitmap.
+        """
+
+        return SearchResult(algorithm, len(path) != 0, self.maze_indices(path), expanded, self.unpad(visited).view(bool),
+                            cost)
+
+
+def fast_view(flags):
+    """
+    View of a per-cell array for the search loops: a memoryview of a numpy array, which is much faster
+    to index from Python, or the object itself when it is already indexable, such as a packed Bitset.
+    """
+    return memoryview(flags) if isinstance(flags, np.ndarray) else flags
+
+
+def gather_flags(flags, indices):
+    """
+    Vectorized lookup of per-cell flags at an array of flat indices, for numpy arrays and packed Bitsets.
+    """
+    return flags.get_many(indices) if hasattr(flags, "get_many") else flags[indices]
+
+
+def scatter_flags(flags, indices):
+    """
+    Vectorized update setting the per-cell flags at an array of flat indices, for numpy arrays and packed Bitsets.
+    """
+    if hasattr(flags, "set_many"):
+        flags.set_many(indices)
+    else:
+        flags[indices] = 1
+
+
+def as_search_grid(maze):
+    """
+    The SearchGrid of a maze: a SearchGrid is used as is, an object with a `search_grid()` method (such as
+    util.maze_file.MazeFile) provides its own without copying, and an array is padded into a new grid.
+    """
+
+    if isinstance(maze, SearchGrid):
+        return maze
+    if hasattr(maze, "search_grid"):
+        return maze.search_grid()
+    return SearchGrid(maze)
+
+
+def unreachable_result(algorithm, maze, components, sources=None, destinations=None):
+    """
+    Answer a search from the component index alone when it shows there is no path.
+
+    The index only answers when every source and destination is an open cell. A wall endpoint is left to
+    the search, as it is without an index, so passing one never changes a result.
+
+    Args:
+        algorithm (str): Name of the search.
+        maze (numpy.ndarray): The maze being searched.
+        components (ComponentIndex | None): Component index of the maze, or None to always search.
+        sources (tuple | list of tuple, optional): Start node or nodes, by default the top-left corner.
+        destinations (tuple | list of tuple, optional): Goal node or nodes, by default the bottom-right corner.
+
+    Returns:
+        SearchResult | None: An empty result when no source shares a component with a destination,
+                             otherwise None and the search has to run. Also None when an endpoint is a wall.
+    """
+
+    if components is None:
+        return None
+    rows, cols = np.shape(maze)
+    sources = as_nodes((0, 0) if sources is None else sources)
+    destinations = as_nodes((rows - 1, cols - 1) if destinations is None else destinations)
+    source_labels = {components.component(node) for node in sources}
+    destination_labels = {components.component(node) for node in destinations}
+    # Walls are labeled -1 and have no component to compare
+    if -1 in source_labels or -1 in destination_labels or source_labels & destination_labels:
+        return None
+    # Nothing is visited, the broadcast mask takes no memory
+    return SearchResult(algorithm, False, np.zeros(0, dtype=np.int32), 0, np.broadcast_to(False, (rows, cols)))
+
+
+def as_nodes(nodes):
+    """
+    Normalize one (row, column) node or a sequence of nodes to a list of (row, column) tuples.
+    """
+
+    if np.ndim(nodes) == 1:
+        return [(int(nodes[0]), int(nodes[1]))]
+    return [(int(i), int(j)) for i, j in nodes]
+
+
+class SearchResult:
+    """
+    Outcome of one search, independent of any plotting.
+
+    Attributes:
+        algorithm (str): Name of the search that produced the result.
+        found (bool): True if a path from the source to the destination was found.
+        path (numpy.ndarray): Flat indices (row * cols + col) of the path cells, from the source to the
+                              destination, int32 or int64 on huge mazes. Empty when no path was found.
+        path_length (int): Number of cells on the path, including both ends. 0 when no path was found.
+        expanded (int): Number of nodes expanded by the search.
+        visited (numpy.ndarray): (rows, cols) bool mask of the cells reached by the search.
+        cost (int | None): Sum of the costs of the cells entered along the path, for searches on a cost
+                           grid (see weighted_search). None for the searches where every step costs 1.
+    """
+
+    def __init__(self, algorithm, found, path, expanded, visited, cost=None):
+        self.algorithm = algorithm
+        self.found = bool(found)
+        self.path = path
+        self.path_length = len(path)
+        self.expanded = expanded
+        self.visited = visited
+        self.cost = cost
+
+    def nodes(self):
+        """
+        Return the path as a (path_length, 2) array of (row, column) nodes.
+        """
+        return np.column_stack(np.divmod(self.path, self.visited.shape[1]))
+
+    def __repr__(self):
+        return (f"SearchResult(algorithm={self.algorithm!r}, found={self.found}, "
+                f"path_length={self.path_length}, expanded={self.expanded})")
@@ -0,0 +1,76 @@
+from search_algorithms.bread_first_search import bfs_solve
+from search_algorithms.depth_first_search import dfs_solve
+from search_algorithms.a_star_search import a_star_solve
+from search_algorithms.bidirectional_search import bidirectional_bfs_solve, bidirectional_a_star_solve
+from search_algorithms.jump_point_search import jps_solve
+from search_algorithms.memory_bounded_search import ida_star_solve, beam_search_solve
+from search_algorithms.incremental_search import lpa_star_solve
+from search_algorithms.hierarchical_search import hpa_star_solve
+from search_algorithms.weighted_search import dijkstra_solve, cost_a_star_solve
+from functools import partial
+
+# Every headless solver by name. Each one is called as solver(maze, components=None) and returns a SearchResult.
+SOLVERS = {
+    "bfs": bfs_solve,
+    "bfs-vectorized": partial(bfs_solve, vectorized=True),
+    "dfs": dfs_solve,
+    "a-star": a_star_solve,
+    "a-star-manhattan": partial(a_star_solve, h="manhattan"),
+    "bidirectional-bfs": bidirectional_bfs_solve,
+    "bidirectional-a-star": bidirectional_a_star_solve,
+    "jps": jps_solve,
+    "ida-star": ida_star_solve,
+    "beam-search": beam_search_solve,
+    "lpa-star": lpa_star_solve,
+    "hpa-star": hpa_star_solve,
+    "dijkstra": dijkstra_solve,
+    "a-star-cost": cost_a_star_solve,
+}
+
+# Solvers whose paths are always shortest paths. HPA* paths go through the entrances of its clusters and
+# can be a few steps longer.
+OPTIMAL_SOLVERS = frozenset(("bfs", "bfs-vectorized", "a-star", "a-star-manhattan", "bidirectional-bfs",
+                             "bidirectional-a-star", "jps", "ida-star", "lpa-star", "dijkstra", "a-star-cost"))
+
+# Solvers that bound their memory at the cost of expansions or optimality, see memory_bounded_search.
+# IDA* sweeps the whole reachable region once per f bound on an unreachable destination, so they are
+# left out of sweeps over large mazes unless asked for.
+MEMORY_BOUNDED_SOLVERS = frozenset(("ida-star", "beam-search"))
+
+
+def get_solver(name):
+    """
+    Look up a solver of SOLVERS by name.
+
+    Raises:
+        ValueError: If there is no solver with that name.
+    """
+
+    if name not in SOLVERS:
+        raise ValueError(f"unknown solver {name!r}, expected one of {tuple(SOLVERS)}")
+    return SOLVERS[name]
+
+
+def solve(name, maze, source=None, destination=None, **kwargs):
+    """
+    Solve a maze with a solver of SOLVERS between one start and one goal node.
+
+    Args:
+        name (str): Name of the solver.
+        maze (numpy.ndarray): The maze as a 2D array where 1 represents a wall.
+        source (tuple of int, optional): The (row, column) start node, the top-left corner by default.
+        destination (tuple of int, optional): The (row, column) goal node, the bottom-right corner by default.
+        **kwargs: Further arguments of the solver.
+
+    Returns:
+        SearchResult: The result of the search.
+
+    Raises:
+        ValueError: If there is no solver with that name.
+    """
+
+    solver = get_solver(name)
+    # bfs_solve takes lists of sources and destinations, the other solvers a single node of each
+    if name in ("bfs", "bfs-vectorized"):
+        return solver(maze, sources=source, destinations=destination, **kwargs)
+    return solver(maze, source=source, destination=destination, **kwargs)
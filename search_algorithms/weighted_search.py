@@ -0,0 +1,254 @@
+from search_algorithms.search_core import as_search_grid, fast_view, unreachable_result, UNREACHED
+from search_algorithms.heuristics import grid_heuristic
+import heapq
+import itertools
+import numpy as np
+
+# Priority queues accepted by the weighted solvers
+QUEUES = ("bucket", "heap")
+
+
+class BucketQueue:
+    """
+    Monotone priority queue for small integer keys (Dial's algorithm): a ring of buckets, one per key.
+
+    The searches only push keys between the key last popped and that key plus a fixed span, set by the
+    largest cell cost. A ring of span buckets then holds every pending key at a distinct position, a push
+    is an append to its bucket and a pop moves forward to the next non-empty bucket. Both take constant
+    time instead of the log(n) of a binary heap. Entries of equal key come out last in, first out, which
+    like the "high-g" tie break of a_star_solve favors the most recently reached cells.
+    """
+
+    def __init__(self, span, start=0):
+        """
+        Args:
+            span (int): One more than the largest difference between a pushed key and the last popped key.
+            start (int, optional): The smallest key that will be pushed, where the first pop starts looking.
+        """
+
+        self.buckets = [[] for _ in range(span)]
+        self.span = span
+        self.key = start
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def push(self, key, item):
+        """
+        Queue an item with an integer key, at least the last popped key and below it plus the span.
+        """
+        self.buckets[key % self.span].append(item)
+        self.count += 1
+
+    def pop(self):
+        """
+        Take an item of the smallest key.
+
+        Returns:
+            tuple: (key, item).
+        """
+
+        buckets, span, key = self.buckets, self.span, self.key
+        while not buckets[key % span]:
+            key += 1
+        self.key = key
+        self.count -= 1
+        return key, buckets[key % span].pop()
+
+
+class HeapQueue:
+    """
+    The same interface over heapq, as the reference for BucketQueue. Entries of equal key also come out
+    last in, first out, so both queues expand the same cells.
+    """
+
+    def __init__(self, span=None, start=0):
+        self.heap = []
+        self.pushes = itertools.count()
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, key, item):
+        heapq.heappush(self.heap, (key, -next(self.pushes), item))
+
+    def pop(self):
+        key, _, item = heapq.heappop(self.heap)
+        return key, item
+
+
+def padded_costs(grid, costs):
+    """
+    Cell costs as a flat int32 array of the padded grid, all 1 when costs is None.
+
+    Args:
+        grid (SearchGrid): The grid searched.
+        costs (numpy.ndarray | None): (rows, cols) integer cost of entering every cell, at least 1 on open cells.
+
+    Returns:
+        tuple: The flat costs and the smallest and largest cost of an open cell.
+
+    Raises:
+        ValueError: If the costs do not match the maze or an open cell costs less than 1.
+    """
+
+    padded = np.zeros((grid.rows + 2, grid.width), dtype=np.int32)
+    if costs is None:
+        padded[1:-1, 1:-1] = 1
+    else:
+        if np.shape(costs) != grid.shape:
+            raise ValueError(f"cost grid of shape {np.shape(costs)} for a {grid.rows}x{grid.cols} maze")
+        padded[1:-1, 1:-1] = costs
+    # np.asarray unpacks the walls of a PackedSearchGrid, whose Bitset does not compare elementwise
+    open_costs = padded.reshape(-1)[np.asarray(grid.walls) == 0]
+    if len(open_costs) == 0:
+        return padded.reshape(-1), 1, 1
+    smallest, largest = int(open_costs.min()), int(open_costs.max())
+    if smallest < 1:
+        raise ValueError(f"cell costs must be at least 1, got {smallest}")
+    return padded.reshape(-1), smallest, largest
+
+
+def weighted_solve(algorithm, maze, costs=None, h=None, components=None, source=None, destination=None,
+                   queue="bucket", stats=None):
+    """
+    Cheapest path search on a grid of integer cell costs, shared by dijkstra_solve and cost_a_star_solve.
+
+    Stepping into a cell costs that cell's cost. Cells are expanded by increasing g, or g + h with a
+    heuristic, from a BucketQueue or a HeapQueue. The heuristic is the Manhattan distance times the
+    smallest cell cost, which never overestimates the cost left and only changes by that cost per step,
+    so the first time a cell is taken off the queue its cost is final and stale entries are skipped.
+
+    Args:
+        algorithm (str): Name of the search in the result.
+        maze (numpy.ndarray): The maze as a 2D array where 1 represents a wall. It is not modified.
+        costs (numpy.ndarray, optional): (rows, cols) integer cost of entering every cell, at least 1 on
+                                         open cells. Every cell costs 1 by default.
+        h (str, optional): "manhattan" for A*, None for Dijkstra.
+        components (ComponentIndex, optional): Connected-component index of the maze. When given and the
+                                               destination is in another component, no search is run.
+        source (tuple of int, optional): The (row, column) start node, the top-left corner by default.
+        destination (tuple of int, optional): The (row, column) goal node, the bottom-right corner by default.
+        queue (str, optional): "bucket" for a BucketQueue or "heap" for heapq. Defaults to "bucket".
+        stats (SearchStats, optional): Counters and phase timers the search reports into.
+
+    Returns:
+        SearchResult: The cheapest path and its cost, the number of expanded cells and the reached cells.
+    """
+
+    if queue not in QUEUES:
+        raise ValueError(f"unknown queue {queue!r}, expected one of {QUEUES}")
+
+    # The component index answers unreachable queries without searching
+    unreachable = unreachable_result(algorithm, maze, components, source, destination)
+    if unreachable is not None:
+        return unreachable
+
+    counting = stats is not None
+    if counting:
+        stats.start()
+
+    grid = as_search_grid(maze)
+    source, destination = grid.endpoints(source, destination)
+    cell_costs, smallest, largest = padded_costs(grid, costs)
+    if h is None:
+        heuristic, scale = None, 0
+    else:
+        heuristic, scale = grid_heuristic(grid, grid.node(destination), h), smallest
+    if counting:
+        stats.lap("setup")
+
+    # A key grows by at most the cost of a step plus the heuristic change, at most the smallest cost
+    start = heuristic[source] * scale if scale else 0
+    frontier = (BucketQueue if queue == "bucket" else HeapQueue)(largest + scale + 1, start)
+    parent_array, closed_array = grid.new_parents(), grid.new_visited()
+    cost_array = np.full(grid.size, UNREACHED, dtype=np.int32)
+    parents, closed, g_costs = memoryview(parent_array), fast_view(closed_array), memoryview(cost_array)
+    step_costs, walls, offsets = memoryview(cell_costs), grid.cells, grid.offsets
+
+    g_costs[source] = 0
+    frontier.push(start, source)
+    found, expanded, pushes, pops, max_frontier = 0, 0, 1, 0, 0
+
+    while len(frontier) != 0:
+        if counting:
+            pops += 1
+            max_frontier = max(max_frontier, len(frontier))
+        _, cell = frontier.pop()
+        if closed[cell]:
+            continue
+        closed[cell] = 1
+        expanded += 1
+        if cell == destination:
+            found = 1
+            break
+
+        cost = g_costs[cell]
+        for offset in offsets:
+            node = cell + offset
+            if walls[node]:
+                continue
+            next_cost = cost + step_costs[node]
+            if next_cost >= g_costs[node]:
+                continue
+            g_costs[node] = next_cost
+            parents[node] = cell
+            frontier.push(next_cost + heuristic[node] * scale if scale else next_cost, node)
+            pushes += 1
+
+    if counting:
+        stats.lap("search")
+
+    reached = (cost_array != UNREACHED).view(np.uint8)
+    path = grid.trace_path(parents, source, destination) if found else np.zeros(0, dtype=grid.index_dtype)
+    result = grid.path_result(algorithm, path, reached, expanded, int(cost_array[destination]) if found else None)
+
+    if counting:
+        stats.lap("reconstruction")
+        stats.record(expanded, len(offsets) * (expanded - found), pushes, pops + len(frontier), max_frontier)
+    return result
+
+
+def dijkstra_solve(dijkstra_maze, costs=None, components=None, source=None, destination=None, queue="bucket",
+                   stats=None):
+    """
+    Dijkstra's algorithm on a grid of integer cell costs, with a bucket queue by default.
+
+    Args:
+        dijkstra_maze (numpy.ndarray): The maze as a 2D array where 1 represents a wall. It is not modified.
+        costs (numpy.ndarray, optional): (rows, cols) integer cost of entering every cell, such as the cost
+                                         grid of maze_generator(..., max_cost=9). Every cell costs 1 by default.
+        components (ComponentIndex, optional): Connected-component index of the maze.
+        source (tuple of int, optional): The (row, column) start node, the top-left corner by default.
+        destination (tuple of int, optional): The (row, column) goal node, the bottom-right corner by default.
+        queue (str, optional): "bucket" or "heap". Defaults to "bucket".
+        stats (SearchStats, optional): Counters and phase timers the search reports into.
+
+    Returns:
+        SearchResult: The cheapest path, with its cost in result.cost.
+    """
+    return weighted_solve("dijkstra", dijkstra_maze, costs, None, components, source, destination, queue, stats)
+
+
+def cost_a_star_solve(cost_maze, costs=None, components=None, source=None, destination=None, queue="bucket",
+                      stats=None):
+    """
+    A* on a grid of integer cell costs, with the Manhattan distance times the smallest cell cost as heuristic
+    and a bucket queue by default. Same paths costs as dijkstra_solve, with fewer cells expanded.
+
+    Args:
+        cost_maze (numpy.ndarray): The maze as a 2D array where 1 represents a wall. It is not modified.
+        costs (numpy.ndarray, optional): (rows, cols) integer cost of entering every cell. Every cell costs 1
+                                         by default.
+        components (ComponentIndex, optional): Connected-component index of the maze.
+        source (tuple of int, optional): The (row, column) start node, the top-left corner by default.
+        destination (tuple of int, optional): The (row, column) goal node, the bottom-right corner by default.
+        queue (str, optional): "bucket" or "heap". Defaults to "bucket".
+        stats (SearchStats, optional): Counters and phase timers the search reports into.
+
+    Returns:
+        SearchResult: The cheapest path, with its cost in result.cost.
+    """
+    return weighted_solve("a-star-cost", cost_maze, costs, "manhattan", components, source, destination, queue,
+                          stats)
@@ -0,0 +1,49 @@
+from generator.maze_generator import maze_batch_generator
+from search_algorithms.bread_first_search import bfs_solve
+from search_algorithms.a_star_search import a_star_solve, TIE_BREAKS
+from search_algorithms.heuristics import HEURISTICS
+import numpy as np
+import pytest
+
+# Run from the repository root: python -m pytest -q
+
+
+@pytest.mark.parametrize("tie_break", TIE_BREAKS)
+@pytest.mark.parametrize("h", HEURISTICS)
+@pytest.mark.parametrize("probabillity", [0.0, 0.2, 0.3, 0.4])
+@pytest.mark.parametrize("dimension", [1, 2, 7, 30])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_a_star_path_is_as_short_as_bfs(seed, dimension, probabillity, h, tie_break):
+    for maze in maze_batch_generator(20, dimension, probabillity, seed):
+        optimal = bfs_solve(maze)
+        result = a_star_solve(maze, h, tie_break=tie_break)
+        assert result.found == optimal.found
+        assert result.path_length == optimal.path_length
+
+
+@pytest.mark.parametrize("tie_break", TIE_BREAKS)
+@pytest.mark.parametrize("h", HEURISTICS)
+def test_a_star_between_inner_cells(h, tie_break):
+    rng = np.random.default_rng(5)
+    for maze in maze_batch_generator(20, 25, 0.3, 5):
+        open_cells = np.argwhere(maze == 0)
+        source, destination = (tuple(int(v) for v in open_cells[k]) for k in rng.integers(len(open_cells), size=2))
+        optimal = bfs_solve(maze, sources=source, destinations=destination)
+        result = a_star_solve(maze, h, source=source, destination=destination, tie_break=tie_break)
+        assert result.found == optimal.found
+        assert result.path_length == optimal.path_length
+
+
+@pytest.mark.parametrize("tie_break", TIE_BREAKS)
+def test_a_star_path_is_a_walk_through_open_cells(tie_break):
+    for maze in maze_batch_generator(20, 30, 0.25, 3, solvable=True):
+        result = a_star_solve(maze, "manhattan", tie_break=tie_break)
+        nodes = result.nodes()
+        assert tuple(nodes[0]) == (0, 0) and tuple(nodes[-1]) == (29, 29)
+        assert not maze[nodes[:, 0], nodes[:, 1]].any()
+        assert (np.abs(np.diff(nodes, axis=0)).sum(axis=1) == 1).all()
+
+
+def test_unknown_tie_break():
+    with pytest.raises(ValueError):
+        a_star_solve(np.zeros((3, 3), dtype=np.uint8), tie_break="random")
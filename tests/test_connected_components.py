@@ -0,0 +1,21 @@
+from search_algorithms.solvers import SOLVERS, solve
+from util.connected_components import ComponentIndex
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("name", list(SOLVERS))
+def test_component_index_does_not_change_results(name):
+    rng = np.random.default_rng(1)
+    for _ in range(10):
+        maze = (rng.random((12, 12)) < 0.35).view(np.uint8)
+        components = ComponentIndex(maze)
+        walls = [tuple(int(v) for v in node) for node in np.argwhere(maze == 1)]
+        open_cells = [tuple(int(v) for v in node) for node in np.argwhere(maze == 0)]
+        # Open endpoints, a wall source and a wall destination
+        for source, destination in ((open_cells[0], open_cells[-1]), (walls[0], open_cells[-1]),
+                                    (open_cells[0], walls[-1])):
+            searched = solve(name, maze, source, destination)
+            indexed = solve(name, maze, source, destination, components=components)
+            assert indexed.found == searched.found
+            assert indexed.path_length == searched.path_length
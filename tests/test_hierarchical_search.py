@@ -0,0 +1,76 @@
+from search_algorithms.bread_first_search import bfs_solve
+from search_algorithms.hierarchical_search import HierarchicalIndex, hpa_star_solve
+from search_algorithms.packed_grid import PackedSearchGrid
+import numpy as np
+import pytest
+
+# HPA* paths go through cluster entrances, so they are checked to exist exactly when BFS finds one, to be
+# walks through open cells and to be no shorter than the BFS path
+SHAPES = [(1, 1), (1, 30), (30, 1), (2, 25), (25, 2), (33, 6), (6, 33), (40, 40)]
+
+
+def check_path(maze, result, optimal, source, destination):
+    assert result.found == optimal.found
+    if not result.found:
+        return
+    assert result.path_length >= optimal.path_length
+    nodes = result.nodes()
+    assert tuple(nodes[0]) == source and tuple(nodes[-1]) == destination
+    assert not maze[nodes[:, 0], nodes[:, 1]].any()
+    assert (np.abs(np.diff(nodes, axis=0)).sum(axis=1) == 1).all()
+
+
+def random_endpoints(rng, maze):
+    open_cells = np.argwhere(maze == 0)
+    return (tuple(int(v) for v in open_cells[k]) for k in rng.integers(len(open_cells), size=2))
+
+
+@pytest.mark.parametrize("cluster_size", [4, 6, 8])
+@pytest.mark.parametrize("probabillity", [0.0, 0.25])
+@pytest.mark.parametrize("shape", SHAPES)
+@pytest.mark.parametrize("seed", [0, 1])
+def test_hpa_star_finds_the_paths_bfs_finds(seed, shape, probabillity, cluster_size):
+    rng = np.random.default_rng(seed)
+    for _ in range(5):
+        maze = (rng.random(shape) < probabillity).view(np.uint8)
+        if maze.all():
+            continue
+        index = HierarchicalIndex(maze, cluster_size)
+        for _ in range(10):
+            source, destination = random_endpoints(rng, maze)
+            optimal = bfs_solve(maze, sources=source, destinations=destination)
+            check_path(maze, index.query(source, destination), optimal, source, destination)
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_hpa_star_solve_on_a_packed_grid(seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(5):
+        maze = (rng.random((30, 30)) < 0.25).view(np.uint8)
+        source, destination = random_endpoints(rng, maze)
+        optimal = bfs_solve(maze, sources=source, destinations=destination)
+        result = hpa_star_solve(PackedSearchGrid(maze), source=source, destination=destination, cluster_size=8)
+        check_path(maze, result, optimal, source, destination)
+
+
+@pytest.mark.parametrize("shape", [(1, 40), (40, 1), (30, 30)])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_hpa_star_after_wall_changes_and_reload(tmp_path, seed, shape):
+    rng = np.random.default_rng(seed)
+    maze = (rng.random(shape) < 0.2).view(np.uint8)
+    index = HierarchicalIndex(maze, 8)
+    for _ in range(10):
+        index.toggle([tuple(int(v) for v in rng.integers(shape)) for _ in range(3)])
+        current = index.grid.unpad(index.grid.walls)
+        if current.all():
+            continue
+        source, destination = random_endpoints(rng, current)
+        optimal = bfs_solve(current, sources=source, destinations=destination)
+        check_path(current, index.query(source, destination), optimal, source, destination)
+
+    path = str(tmp_path / "index.npz")
+    index.save(path)
+    loaded = HierarchicalIndex.load(path, current)
+    source, destination = random_endpoints(rng, current)
+    optimal = bfs_solve(current, sources=source, destinations=destination)
+    check_path(current, loaded.query(source, destination), optimal, source, destination)
@@ -0,0 +1,40 @@
+from search_algorithms.bread_first_search import bfs_solve
+from search_algorithms.incremental_search import IncrementalPlanner, lpa_star_solve
+import numpy as np
+import pytest
+
+SHAPES = [(1, 1), (1, 12), (12, 1), (2, 9), (9, 2), (10, 10), (25, 16)]
+
+
+@pytest.mark.parametrize("probabillity", [0.0, 0.2, 0.35])
+@pytest.mark.parametrize("shape", SHAPES)
+@pytest.mark.parametrize("seed", [0, 1])
+def test_lpa_star_path_is_as_short_as_bfs(seed, shape, probabillity):
+    rng = np.random.default_rng(seed)
+    for _ in range(10):
+        maze = (rng.random(shape) < probabillity).view(np.uint8)
+        optimal = bfs_solve(maze)
+        result = lpa_star_solve(maze)
+        assert result.found == optimal.found
+        assert result.path_length == optimal.path_length
+
+
+@pytest.mark.parametrize("shape", [(1, 20), (20, 1), (3, 15), (15, 15)])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_replanning_after_wall_changes_matches_bfs(seed, shape):
+    rng = np.random.default_rng(seed)
+    maze = (rng.random(shape) < 0.2).view(np.uint8)
+    maze[0, 0] = maze[-1, -1] = 0
+    original = maze.copy()
+    planner = IncrementalPlanner(maze)
+    planner.solve()
+    for _ in range(15):
+        # Toggle a few inner cells, never the endpoints
+        cells = [tuple(int(v) for v in rng.integers(shape)) for _ in range(3)]
+        cells = [cell for cell in cells if cell not in ((0, 0), (shape[0] - 1, shape[1] - 1))]
+        planner.toggle(cells)
+        result, optimal = planner.solve(), bfs_solve(planner.maze)
+        assert result.found == optimal.found
+        assert result.path_length == optimal.path_length
+    # The planner edits its own copy of the walls
+    assert np.array_equal(maze, original)
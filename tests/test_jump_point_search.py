@@ -0,0 +1,46 @@
+from search_algorithms.bread_first_search import bfs_solve
+from search_algorithms.jump_point_search import jps_solve
+from search_algorithms.packed_grid import PackedSearchGrid
+import numpy as np
+import pytest
+
+SHAPES = [(1, 1), (1, 12), (12, 1), (2, 9), (9, 2), (7, 7), (20, 13), (30, 30)]
+
+
+def random_queries(shape, probabillity, seed, count=10):
+    """
+    Seeded random mazes of the given shape, each with a random pair of open endpoints.
+    """
+
+    rng = np.random.default_rng(seed)
+    for _ in range(count):
+        maze = (rng.random(shape) < probabillity).view(np.uint8)
+        open_cells = np.argwhere(maze == 0)
+        if len(open_cells) == 0:
+            continue
+        source, destination = (tuple(int(v) for v in open_cells[k]) for k in rng.integers(len(open_cells), size=2))
+        yield maze, source, destination
+
+
+@pytest.mark.parametrize("probabillity", [0.0, 0.2, 0.35])
+@pytest.mark.parametrize("shape", SHAPES)
+@pytest.mark.parametrize("seed", [0, 1])
+def test_jps_path_is_as_short_as_bfs(seed, shape, probabillity):
+    for maze, source, destination in random_queries(shape, probabillity, seed):
+        optimal = bfs_solve(maze, sources=source, destinations=destination)
+        for grid in (maze, PackedSearchGrid(maze)):
+            result = jps_solve(grid, source=source, destination=destination)
+            assert result.found == optimal.found
+            assert result.path_length == optimal.path_length
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_jps_path_is_a_walk_through_open_cells(seed):
+    for maze, source, destination in random_queries((25, 25), 0.25, seed):
+        result = jps_solve(maze, source=source, destination=destination)
+        if not result.found:
+            continue
+        nodes = result.nodes()
+        assert tuple(nodes[0]) == source and tuple(nodes[-1]) == destination
+        assert not maze[nodes[:, 0], nodes[:, 1]].any()
+        assert (np.abs(np.diff(nodes, axis=0)).sum(axis=1) == 1).all()
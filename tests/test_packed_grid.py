@@ -0,0 +1,36 @@
+from search_algorithms.search_core import SearchGrid
+from search_algorithms.packed_grid import Bitset, PackedSearchGrid
+from util.traversable_neighbors import traversable_neighbors
+import numpy as np
+import pytest
+
+SHAPES = [(1, 1), (1, 7), (7, 1), (4, 1), (4, 2), (6, 2), (9, 3), (5, 5), (8, 6), (19, 19)]
+
+
+@pytest.mark.parametrize("probabillity", [0.0, 0.3, 0.6])
+@pytest.mark.parametrize("shape", SHAPES)
+def test_packed_neighbors_match_search_grid(shape, probabillity):
+    rng = np.random.default_rng(sum(shape))
+    for _ in range(10):
+        maze = (rng.random(shape) < probabillity).view(np.uint8)
+        packed, grid = PackedSearchGrid(maze), SearchGrid(maze)
+        for node in np.ndindex(shape):
+            assert traversable_neighbors(packed, node) == traversable_neighbors(grid, node)
+
+
+def test_packed_neighbors_skip_visited():
+    maze = np.zeros((3, 2), dtype=np.uint8)
+    packed, grid = PackedSearchGrid(maze), SearchGrid(maze)
+    packed_visited, visited = packed.new_visited(), grid.new_visited()
+    for flags in (packed_visited, visited):
+        flags[packed.index((2, 1))] = 1
+    assert traversable_neighbors(packed, (2, 0), packed_visited) == traversable_neighbors(grid, (2, 0), visited)
+    assert traversable_neighbors(packed, (2, 0), packed_visited) == [(1, 0)]
+
+
+def test_bitset_round_trip():
+    flags = (np.random.default_rng(0).random(45) < 0.5).view(np.uint8)
+    bits = Bitset.from_flags(flags)
+    assert np.array_equal(np.asarray(bits), flags)
+    assert [bits[index] for index in range(len(flags))] == flags.tolist()
+    assert np.array_equal(bits.get_many(np.arange(45)), flags)
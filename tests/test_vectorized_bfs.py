@@ -0,0 +1,38 @@
+from search_algorithms.bread_first_search import bfs_solve
+from search_algorithms.packed_grid import PackedSearchGrid
+import numpy as np
+import pytest
+
+SHAPES = [(1, 1), (1, 15), (15, 1), (2, 11), (11, 2), (8, 8), (31, 17), (60, 60)]
+
+
+@pytest.mark.parametrize("probabillity", [0.0, 0.2, 0.4])
+@pytest.mark.parametrize("shape", SHAPES)
+@pytest.mark.parametrize("seed", [0, 1])
+def test_vectorized_bfs_matches_bfs(seed, shape, probabillity):
+    rng = np.random.default_rng(seed)
+    for _ in range(10):
+        maze = (rng.random(shape) < probabillity).view(np.uint8)
+        open_cells = np.argwhere(maze == 0)
+        if len(open_cells) == 0:
+            continue
+        source, destination = (tuple(int(v) for v in open_cells[k]) for k in rng.integers(len(open_cells), size=2))
+        optimal = bfs_solve(maze, sources=source, destinations=destination)
+        for grid in (maze, PackedSearchGrid(maze)):
+            result = bfs_solve(grid, sources=source, destinations=destination, vectorized=True)
+            assert result.found == optimal.found
+            assert result.path_length == optimal.path_length
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_vectorized_bfs_with_several_sources_and_destinations(seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(10):
+        maze = (rng.random((20, 20)) < 0.3).view(np.uint8)
+        open_cells = [tuple(int(v) for v in node) for node in np.argwhere(maze == 0)]
+        picks = rng.choice(len(open_cells), size=6, replace=False)
+        sources, destinations = [open_cells[k] for k in picks[:3]], [open_cells[k] for k in picks[3:]]
+        optimal = bfs_solve(maze, sources=sources, destinations=destinations)
+        result = bfs_solve(maze, sources=sources, destinations=destinations, vectorized=True)
+        assert result.found == optimal.found
+        assert result.path_length == optimal.path_length
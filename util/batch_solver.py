@@ -0,0 +1,158 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from search_algorithms.solvers import SOLVERS
+from util.connected_components import ComponentIndex
+import itertools
+import time
+import numpy as np
+
+# Algorithm names accepted by batch_solve. The "algorithm" field of the results holds an index into this tuple.
+ALGORITHMS = ("bfs", "dfs", "a-star", "jps")
+
+# One row per (maze, algorithm) pair
+RESULT_DTYPE = np.dtype([
+    ("maze", np.int64),
+    ("algorithm", np.int8),
+    ("found", np.bool_),
+    ("path_length", np.int32),
+    ("expanded", np.int32),
+    ("seconds", np.float64),
+])
+
+SEARCHES = {name: SOLVERS[name] for name in ALGORITHMS}
+
+
+def solve_shared_chunk(shm_name, shape, start, stop, first_index, algorithm_codes, skip_unsolvable=False):
+    """
+    Worker task: solve a slice of the mazes held in a shared memory block.
+
+    Args:
+        shm_name (str): Name of the shared memory block holding a (count, n, n) uint8 stack of mazes.
+        shape (tuple of int): Shape of the whole stack in the block.
+        start (int): First maze of the slice, relative to the block.
+        stop (int): End of the slice (exclusive), relative to the block.
+        first_index (int): Index of the block's first maze in the whole batch.
+        algorithm_codes (tuple of int): Indices into ALGORITHMS of the searches to run on every maze.
+        skip_unsolvable (bool, optional): If True, label each maze's components first and let the searches
+                                          return at once when the corners are not connected.
+
+    Returns:
+        numpy.ndarray: A RESULT_DTYPE array with one row per maze and algorithm.
+    """
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        mazes = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+        results = np.zeros((stop - start) * len(algorithm_codes), dtype=RESULT_DTYPE)
+        row = 0
+        for k in range(start, stop):
+            # The searches keep their state in their own arrays, so they read the shared maze directly
+            maze = mazes[k]
+            components = ComponentIndex(maze) if skip_unsolvable else None
+            for code in algorithm_codes:
+                started = time.perf_counter()
+                result = SEARCHES[ALGORITHMS[code]](maze, components=components)
+                elapsed = time.perf_counter() - started
+                results[row] = (first_index + k, code, result.found, result.path_length, result.expanded, elapsed)
+                row += 1
+        # Drop the view before closing, the buffer cannot be released while it is exported
+        del mazes
+    finally:
+        shm.close()
+    return results
+
+
+def maze_blocks(mazes, block_size):
+    """
+    Group an array or a stream of mazes into uint8 stacks of at most block_size mazes.
+
+    Args:
+        mazes (numpy.ndarray | iterable): A (count, n, n) array or any iterable of (n, n) mazes.
+        block_size (int): Maximum number of mazes per stack.
+
+    Yields:
+        numpy.ndarray: A (k, n, n) uint8 stack, k <= block_size.
+    """
+
+    if isinstance(mazes, np.ndarray):
+        for start in range(0, len(mazes), block_size):
+            yield mazes[start:start + block_size]
+        return
+
+    iterator = iter(mazes)
+    while True:
+        block = list(itertools.islice(iterator, block_size))
+        if len(block) == 0:
+            return
+        yield np.stack(block)
+
+
+def batch_solve(mazes, algorithms=ALGORITHMS, workers=None, chunk_size=16, block_size=1024, skip_unsolvable=False):
+    """
+    Solve many mazes with one or more search algorithms over a process pool.
+
+    Mazes are copied block by block into shared memory, so the workers read them in place instead of
+    receiving pickled arrays. At most two blocks are alive at a time, which keeps memory bounded when
+    the mazes come from a stream.
+
+    Args:
+        mazes (numpy.ndarray | iterable): A (count, n, n) array or an iterable of (n, n) mazes of equal size,
+                                          where 1 represents a wall.
+        algorithms (sequence of str, optional): Names from ALGORITHMS to run on every maze. Defaults to all of them.
+        workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+        chunk_size (int, optional): Number of mazes solved per worker task. Defaults to 16.
+        block_size (int, optional): Number of mazes per shared memory block. Defaults to 1024.
+        skip_unsolvable (bool, optional): If True, a connected-component index is built for every maze and
+                                          unsolvable mazes are answered without searching. Their rows
+                                          report 0 expanded nodes. Defaults to False.
+
+    Returns:
+        numpy.ndarray: A RESULT_DTYPE array ordered by maze, then by the order of `algorithms`.
+    """
+
+    algorithm_codes = tuple(ALGORITHMS.index(name) for name in algorithms)
+    collected = []
+    pending = []
+
+    def collect_oldest():
+        shm, futures = pending.pop(0)
+        try:
+            collected.extend(future.result() for future in futures)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        try:
+            first_index = 0
+            for block in maze_blocks(mazes, block_size):
+                # Copy the block into a fresh shared memory segment
+                shm = shared_memory.SharedMemory(create=True, size=max(block.size, 1))
+                pending.append((shm, []))
+                shared = np.ndarray(block.shape, dtype=np.uint8, buffer=shm.buf)
+                shared[...] = block
+                del shared
+
+                pending[-1][1].extend(
+                    executor.submit(solve_shared_chunk, shm.name, block.shape, start,
+                                    min(start + chunk_size, len(block)), first_index, algorithm_codes, skip_unsolvable)
+                    for start in range(0, len(block), chunk_size))
+                first_index += len(block)
+
+                # Wait for the older block before reading further, so only two blocks are alive at once
+                if len(pending) > 1:
+                    collect_oldest()
+
+            while len(pending) != 0:
+                collect_oldest()
+        finally:
+            # Release the blocks left behind by a failed task
+            for shm, futures in pending:
+                for future in futures:
+                    future.cancel()
+                shm.close()
+                shm.unlink()
+
+    if len(collected) == 0:
+        return np.zeros(0, dtype=RESULT_DTYPE)
+    return np.concatenate(collected)
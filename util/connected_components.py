@@ -0,0 +1,91 @@
+import numpy as np
+
+
+def label_components(mazes):
+    """
+    Label the open cells of one maze or a stack of mazes by 4-connected component.
+
+    All mazes of a stack are labelled together in one vectorized union-find: every edge between two
+    adjacent open cells hooks the larger root onto the smaller one, then pointer jumping flattens the
+    trees, and edges whose ends already share a root are dropped. This repeats until no edge joins two
+    different roots, which takes a few dozen rounds even on large, winding mazes.
+
+    Args:
+        mazes (numpy.ndarray): One (n, m) maze or a (count, n, m) stack, where 1 represents a wall.
+
+    Returns:
+        numpy.ndarray: int32 labels of the same shape, -1 for walls and 0..k-1 for the components. Labels are
+                       unique across the whole stack, so cells of different mazes never share one.
+    """
+
+    open_cells = np.asarray(mazes) != 1
+    index = np.arange(open_cells.size).reshape(open_cells.shape)
+
+    # Edges between horizontally and vertically adjacent open cells, as pairs of flat indices
+    horizontal = open_cells[..., :, :-1] & open_cells[..., :, 1:]
+    vertical = open_cells[..., :-1, :] & open_cells[..., 1:, :]
+    first = np.concatenate([index[..., :, :-1][horizontal], index[..., :-1, :][vertical]])
+    second = np.concatenate([index[..., :, 1:][horizontal], index[..., 1:, :][vertical]])
+
+    # Every cell starts as its own root, parent[x] <= x always holds so the trees never form cycles
+    parent = np.arange(open_cells.size)
+    while True:
+        first_root, second_root = parent[first], parent[second]
+        joining = first_root != second_root
+        if not joining.any():
+            break
+
+        # Edges inside one tree stay inside it, they never need to be looked at again
+        first, second = first[joining], second[joining]
+        first_root, second_root = first_root[joining], second_root[joining]
+
+        # Hook the larger root of every joining edge onto the smallest root it touches
+        np.minimum.at(parent, np.maximum(first_root, second_root), np.minimum(first_root, second_root))
+
+        # Pointer jumping until every cell points straight at its root
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+    # Renumber the roots of the open cells as 0..k-1 and mark the walls with -1
+    labels = np.full(open_cells.shape, -1, dtype=np.int32)
+    _, labels[open_cells] = np.unique(parent.reshape(open_cells.shape)[open_cells], return_inverse=True)
+    return labels
+
+
+class ComponentIndex:
+    """
+    Connected-component index of a maze, built once and then queried in O(1).
+
+    Solvers take it through their `components` argument and return straight away when the source and
+    destination are in different components, instead of flooding the whole reachable region.
+
+    Attributes:
+        labels (numpy.ndarray): int32 (rows, cols) component labels, -1 for walls.
+        count (int): Number of components.
+        sizes (numpy.ndarray): Number of cells of every component.
+    """
+
+    def __init__(self, maze):
+        """
+        Args:
+            maze (numpy.ndarray): The maze as a 2D array where 1 represents a wall.
+        """
+        self.labels = label_components(maze)
+        self.sizes = np.bincount(self.labels[self.labels >= 0].reshape(-1))
+        self.count = len(self.sizes)
+
+    def component(self, node):
+        """
+        Label of the component containing the (row, column) node, -1 for a wall.
+        """
+        return int(self.labels[node[0], node[1]])
+
+    def connected(self, source, destination):
+        """
+        True if a path exists between the (row, column) nodes source and destination.
+        """
+        label = self.component(source)
+        return label != -1 and label == self.component(destination)
@@ -0,0 +1,250 @@
+from search_algorithms.search_core import SearchGrid
+from search_algorithms.packed_grid import Bitset, PackedSearchGrid
+from search_algorithms.solvers import solve
+import argparse
+import itertools
+import struct
+import numpy as np
+
+# File header: magic, format version, layout, 2 padding bytes, rows, cols, seed (-1 if unknown),
+# start row and column, goal row and column. Little-endian, 64 bytes, so the grid that follows is aligned.
+HEADER = struct.Struct("<4sBB2xQQq4q")
+MAGIC = b"MAZE"
+VERSION = 1
+
+# Grid layouts of the maze padded with a border of walls: one uint8 per cell as used by SearchGrid,
+# or one bit per cell, least significant bit first, as used by PackedSearchGrid
+PADDED_UINT8 = 0
+PADDED_BITS = 1
+
+
+def write_header(file, rows, cols, seed=None, start=None, goal=None, layout=PADDED_UINT8):
+    """
+    Write the header of a maze file. The start and goal default to the top-left and bottom-right corners.
+    """
+
+    start = (0, 0) if start is None else start
+    goal = (rows - 1, cols - 1) if goal is None else goal
+    for node in (start, goal):
+        if not (0 <= node[0] < rows and 0 <= node[1] < cols):
+            raise ValueError(f"node {tuple(node)} is outside the {rows}x{cols} maze")
+    file.write(HEADER.pack(MAGIC, VERSION, layout, rows, cols, -1 if seed is None else seed, *start, *goal))
+
+
+def write_grid(file, blocks, cols, packed=False):
+    """
+    Write the padded grid of a maze from blocks of its rows, adding the top and bottom border rows.
+
+    Args:
+        file (file): File positioned right after the header.
+        blocks (iterable of numpy.ndarray): (k, cols + 2) uint8 blocks of padded rows, 1 for walls.
+        cols (int): Number of columns of the maze.
+        packed (bool, optional): If True, write one bit per cell. Blocks do not have to end on a byte
+                                 boundary, the leftover bits are carried over to the next block.
+    """
+
+    border = np.ones((1, cols + 2), dtype=np.uint8)
+    carry = np.zeros(0, dtype=np.uint8)
+    for block in itertools.chain([border], blocks, [border]):
+        if not packed:
+            file.write(block.tobytes())
+            continue
+        flags = np.concatenate([carry, block.reshape(-1)])
+        whole = len(flags) - len(flags) % 8
+        file.write(np.packbits(flags[:whole], bitorder="little").tobytes())
+        carry = flags[whole:]
+    if len(carry) != 0:
+        file.write(np.packbits(carry, bitorder="little").tobytes())
+
+
+def write_maze(path, maze, seed=None, start=None, goal=None, chunk_rows=4096, packed=False):
+    """
+    Save a maze in the on-disk format read by open_maze.
+
+    The maze is padded and written a block of rows at a time, so a memory-mapped maze larger than RAM
+    can be converted too.
+
+    Args:
+        path (str): File to write.
+        maze (numpy.ndarray): The maze as a 2D array where 1 represents a wall.
+        seed (int, optional): Seed the maze was generated with, kept in the header for reference.
+        start (tuple of int, optional): The (row, column) start node, the top-left corner by default.
+        goal (tuple of int, optional): The (row, column) goal node, the bottom-right corner by default.
+        chunk_rows (int, optional): Number of maze rows converted at a time. Defaults to 4096.
+        packed (bool, optional): If True, store one bit per cell instead of one byte. Defaults to False.
+    """
+
+    rows, cols = np.shape(maze)
+
+    def blocks():
+        for first in range(0, rows, chunk_rows):
+            block = np.ones((min(chunk_rows, rows - first), cols + 2), dtype=np.uint8)
+            block[:, 1:-1] = np.asarray(maze[first:first + chunk_rows]) == 1
+            yield block
+
+    with open(path, "wb") as file:
+        write_header(file, rows, cols, seed, start, goal, PADDED_BITS if packed else PADDED_UINT8)
+        write_grid(file, blocks(), cols, packed)
+
+
+def generate_maze_file(path, dimension, probabillity, seed=None, chunk_rows=4096, packed=False):
+    """
+    Generate a square maze straight into a maze file, a block of rows at a time.
+
+    Only one block of rows is in memory at once, so the maze can be larger than RAM. The walls are drawn
+    block by block, so a maze file does not hold the same cells as maze_generator with the same seed.
+
+    Args:
+        path (str): File to write.
+        dimension (int): The size of the maze (dimension x dimension).
+        probabillity (float): The probability of placing a wall in each cell (0 <= probability <= 1).
+        seed (int, optional): Seed of the wall draw, stored in the header.
+        chunk_rows (int, optional): Number of maze rows drawn at a time. Defaults to 4096.
+        packed (bool, optional): If True, store one bit per cell instead of one byte. Defaults to False.
+    """
+
+    rng = np.random.default_rng(seed)
+
+    def blocks():
+        for first in range(0, dimension, chunk_rows):
+            block = np.ones((min(chunk_rows, dimension - first), dimension + 2), dtype=np.uint8)
+            block[:, 1:-1] = rng.random((len(block), dimension), dtype=np.float32) < probabillity
+
+            # Clear the start and end points like draw_walls
+            if first == 0:
+                block[0, 1] = 0
+            if first + len(block) == dimension:
+                block[-1, -2] = 0
+            yield block
+
+    with open(path, "wb") as file:
+        write_header(file, dimension, dimension, seed, layout=PADDED_BITS if packed else PADDED_UINT8)
+        write_grid(file, blocks(), dimension, packed)
+
+
+class MazeFile:
+    """
+    A maze file opened through numpy.memmap.
+
+    The padded wall grid stays on disk and is paged in by the operating system as the searches touch it.
+    Every solve function accepts a MazeFile in place of a maze array: it searches the mapped grid directly,
+    keeping its visited and parent state in its own arrays, and never copies or writes the grid.
+
+    Attributes:
+        path (str): Path of the file.
+        rows (int): Number of rows of the maze.
+        cols (int): Number of columns of the maze.
+        seed (int | None): Seed stored in the header, None if unknown.
+        start (tuple of int): The (row, column) start node stored in the header.
+        goal (tuple of int): The (row, column) goal node stored in the header.
+        packed (bool): True for a file storing one bit per cell.
+        walls (numpy.memmap | Bitset): Flat uint8 wall flags of the padded grid, or for a packed file, a Bitset
+                                       over the mapped bytes.
+    """
+
+    def __init__(self, path, mode="r"):
+        """
+        Args:
+            path (str): File written by write_maze or generate_maze_file.
+            mode (str, optional): numpy.memmap mode, "r" for read-only or "r+" to edit the walls in place.
+
+        Raises:
+            ValueError: If the file is not a maze file of a supported version and layout.
+        """
+
+        with open(path, "rb") as file:
+            header = file.read(HEADER.size)
+        if len(header) != HEADER.size:
+            raise ValueError(f"{path} is too short to be a maze file")
+        magic, version, layout, rows, cols, seed, *nodes = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} maze file")
+        if layout not in (PADDED_UINT8, PADDED_BITS):
+            raise ValueError(f"{path} has an unsupported grid layout {layout}")
+
+        self.path = path
+        self.rows, self.cols = rows, cols
+        self.seed = None if seed == -1 else seed
+        self.start, self.goal = tuple(nodes[:2]), tuple(nodes[2:])
+        self.packed = layout == PADDED_BITS
+        size = (rows + 2) * (cols + 2)
+        if self.packed:
+            bits = np.memmap(path, dtype=np.uint8, mode=mode, offset=HEADER.size, shape=((size + 7) // 8,))
+            self.walls = Bitset(size, bits)
+        else:
+            self.walls = np.memmap(path, dtype=np.uint8, mode=mode, offset=HEADER.size, shape=(size,))
+
+    @property
+    def shape(self):
+        """
+        Shape (rows, cols) of the maze, so np.shape works on a MazeFile as on a maze array.
+        """
+        return (self.rows, self.cols)
+
+    @property
+    def maze(self):
+        """
+        The (rows, cols) maze, 1 for walls: a view of the mapped grid, or an unpacked copy for a packed file.
+        """
+        return np.asarray(self.walls).reshape(self.rows + 2, self.cols + 2)[1:-1, 1:-1]
+
+    def search_grid(self):
+        """
+        SearchGrid (PackedSearchGrid for a packed file) over the mapped grid, without copying it.
+        """
+        grid_class = PackedSearchGrid if self.packed else SearchGrid
+        return grid_class.from_padded(self.walls, self.rows, self.cols)
+
+    def flush(self):
+        """
+        Write wall edits made in "r+" mode back to the file.
+        """
+        (self.walls.bits if self.packed else self.walls).flush()
+
+
+def open_maze(path, mode="r"):
+    """
+    Open a maze file written by write_maze or generate_maze_file. See MazeFile.
+    """
+    return MazeFile(path, mode)
+
+
+def solve_maze_file(path, algorithm="bfs", **kwargs):
+    """
+    Solve a maze file from the start to the goal stored in its header.
+
+    Args:
+        path (str): The maze file.
+        algorithm (str, optional): Name from search_algorithms.solvers.SOLVERS. Defaults to "bfs".
+        **kwargs: Further arguments of the solver.
+
+    Returns:
+        SearchResult: The result of the search.
+    """
+
+    maze_file = open_maze(path)
+    return solve(algorithm, maze_file, maze_file.start, maze_file.goal, **kwargs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a maze file, or solve one from its stored start to goal")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="Generate a square maze straight into a file")
+    generate.add_argument("path", help="Maze file to write")
+    generate.add_argument("--dimension", type=int, required=True, help="Size of the maze")
+    generate.add_argument("--probability", type=float, default=0.2, help="Wall probability")
+    generate.add_argument("--seed", type=int, default=None, help="Seed of the wall draw")
+    generate.add_argument("--packed", action="store_true", help="Store one bit per cell instead of one byte")
+
+    solve_parser = commands.add_parser("solve", help="Solve a maze file")
+    solve_parser.add_argument("path", help="Maze file to solve")
+    solve_parser.add_argument("--algorithm", default="bfs", help="Solver name from search_algorithms.solvers")
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        generate_maze_file(args.path, args.dimension, args.probability, args.seed, packed=args.packed)
+    else:
+        result = solve_maze_file(args.path, args.algorithm)
+        print(f"{result.algorithm}: found {result.found}, path length {result.path_length}, "
+              f"expanded {result.expanded}")
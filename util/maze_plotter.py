@@ -1,8 +1,9 @@
-import matplotlib.pyplot as plt
+import numpy as np
 
 def maze_plotter(maze, search_algorithm, path_length=0):
     """
     Plots the final state of the maze and saves the plot as an image file.
+    For interactive use: it blocks in plt.show(). util.maze_renderer writes images without matplotlib.
 
     Parameters:
         maze (2D array-like): The maze to be plotted, where each element represents a cell in the maze.
@@ -12,14 +13,18 @@ def maze_plotter(maze, search_algorithm, path_length=0):
         None
     """
 
+    # matplotlib is only needed when something is plotted, so headless solves never import it
+    import matplotlib.pyplot as plt
+
     # Create a new figure and axis for the plot
     fig, ax = plt.subplots()
 
     # Clear the current axis
     ax.cla()
 
-    # Get the default colormap and set the color for bad values (e.g., masked cells) to white
-    cmap = plt.cm.get_cmap()
+    # Get a copy of the default colormap and set the color for bad values (e.g., masked cells) to white.
+    # plt.cm.get_cmap is gone from recent matplotlib, and the registered colormaps cannot be modified.
+    cmap = plt.get_cmap().copy()
     cmap.set_bad("white")
 
     ax.set_title(search_algorithm.upper()+" - Path Length : "+str(path_length), fontsize=16, color='red', loc='center')
@@ -36,4 +41,24 @@ def maze_plotter(maze, search_algorithm, path_length=0):
 
     # Save the plot as an image file based on the provided filename
     plt.savefig(f'figures/{search_algorithm}-maze.png', dpi=1000, bbox_inches='tight')
-    plt.show()
\ No newline at end of file
+    plt.show()
+
+
+def plot_result(maze, result):
+    """
+    Plots a search result on top of its maze, marking visited cells with -1 and the path with -2.
+
+    Parameters:
+        maze (2D array-like): The maze that was searched, where 1 represents a wall. It is not modified.
+        result (SearchResult): The result returned by one of the solve functions.
+
+    Returns:
+        None
+    """
+
+    # Build the marked copy of the maze the plotter expects
+    marked = (np.asarray(maze) == 1).astype(int)
+    marked[result.visited] = -1
+    marked.reshape(-1)[result.path] = -2
+
+    maze_plotter(marked, result.algorithm, result.path_length)
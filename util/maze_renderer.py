@@ -0,0 +1,158 @@
+from concurrent.futures import ProcessPoolExecutor
+import os
+import struct
+import zlib
+import numpy as np
+
+# RGB colors of open, wall, visited and path cells. They are the colors maze_plotter's default colormap
+# gives them, so both backends draw the same picture.
+PALETTE = np.array([
+    (53, 183, 121),
+    (253, 231, 37),
+    (49, 104, 142),
+    (68, 1, 84),
+], dtype=np.uint8)
+
+# Cell codes, indices into the palette
+OPEN, WALL, VISITED, PATH = range(4)
+
+
+def cell_codes(maze, result=None):
+    """
+    Code every cell of a maze, and of a search result on it, as OPEN, WALL, VISITED or PATH.
+
+    Args:
+        maze (numpy.ndarray): The maze, where 1 represents a wall.
+        result (SearchResult, optional): A result of one of the solve functions on the maze.
+
+    Returns:
+        numpy.ndarray: (rows, cols) uint8 array of cell codes.
+    """
+
+    codes = (np.asarray(maze) == 1).astype(np.uint8)
+    if result is not None:
+        codes[result.visited] = VISITED
+        codes.reshape(-1)[result.path] = PATH
+    return codes
+
+
+def render(maze, result=None, scale=1, palette=PALETTE):
+    """
+    Draw a maze, and optionally a search result on it, into an RGB buffer without matplotlib.
+
+    Args:
+        maze (numpy.ndarray): The maze, where 1 represents a wall.
+        result (SearchResult, optional): A result of one of the solve functions on the maze.
+        scale (int, optional): Side of the square of pixels drawn per cell. Defaults to 1.
+        palette (numpy.ndarray, optional): (4, 3) uint8 colors of open, wall, visited and path cells.
+
+    Returns:
+        numpy.ndarray: (rows * scale, cols * scale, 3) uint8 image.
+    """
+
+    codes = cell_codes(maze, result)
+    # Scale the one-byte codes before looking the colors up, three times less to copy
+    if scale != 1:
+        codes = np.repeat(np.repeat(codes, scale, axis=0), scale, axis=1)
+    return np.asarray(palette, dtype=np.uint8)[codes]
+
+
+def write_ppm(path, image):
+    """
+    Write an RGB buffer as a binary PPM (P6) file.
+    """
+
+    height, width, _ = image.shape
+    with open(path, "wb") as file:
+        file.write(f"P6\n{width} {height}\n255\n".encode())
+        file.write(np.ascontiguousarray(image, dtype=np.uint8).tobytes())
+
+
+def png_chunk(kind, data):
+    """
+    One PNG chunk: length, type, data and the CRC of type and data.
+    """
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def write_png(path, image, level=6):
+    """
+    Write an RGB buffer as an 8-bit truecolor PNG file, with zlib and no filtering.
+
+    Args:
+        path (str): The file to write.
+        image (numpy.ndarray): (height, width, 3) uint8 image.
+        level (int, optional): zlib compression level, 1 is fastest. Defaults to 6.
+    """
+
+    height, width, _ = image.shape
+    # Every row starts with its filter type, 0 for none
+    rows = np.zeros((height, 1 + 3 * width), dtype=np.uint8)
+    rows[:, 1:] = image.reshape(height, 3 * width)
+
+    with open(path, "wb") as file:
+        file.write(b"\x89PNG\r\n\x1a\n")
+        file.write(png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        file.write(png_chunk(b"IDAT", zlib.compress(rows.tobytes(), level)))
+        file.write(png_chunk(b"IEND", b""))
+
+
+def save_image(path, image):
+    """
+    Write an RGB buffer as a PNG or PPM file, chosen by the extension of the path.
+
+    Raises:
+        ValueError: If the extension is neither .png nor .ppm.
+    """
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".png":
+        write_png(path, image)
+    elif extension == ".ppm":
+        write_ppm(path, image)
+    else:
+        raise ValueError(f"cannot write {path!r}, expected a .png or .ppm file")
+
+
+def save_result(path, maze, result=None, scale=1):
+    """
+    Render a maze and a search result on it and write the image to path (.png or .ppm).
+
+    Returns:
+        str: The path written.
+    """
+
+    save_image(path, render(maze, result, scale))
+    return path
+
+
+def save_chunk(jobs, scale):
+    """
+    Worker task: render and write a list of (path, maze, result) jobs.
+    """
+    return [save_result(path, maze, result, scale) for path, maze, result in jobs]
+
+
+def render_batch(jobs, scale=1, workers=None, chunk_size=64):
+    """
+    Render many results to image files over a process pool.
+
+    Args:
+        jobs (iterable): (path, maze, result) tuples, result may be None to draw the maze alone.
+        scale (int, optional): Side of the square of pixels drawn per cell. Defaults to 1.
+        workers (int, optional): Number of worker processes, 0 to render in this process. Defaults to the
+                                 CPU count.
+        chunk_size (int, optional): Number of jobs sent to a worker per task. Defaults to 64.
+
+    Returns:
+        list of str: The paths written, in the order of the jobs.
+    """
+
+    jobs = list(jobs)
+    chunks = [jobs[start:start + chunk_size] for start in range(0, len(jobs), chunk_size)]
+    if workers == 0 or len(chunks) <= 1:
+        return [path for chunk in chunks for path in save_chunk(chunk, scale)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        written = executor.map(save_chunk, chunks, [scale] * len(chunks))
+        return [path for chunk in written for path in chunk]
@@ -0,0 +1,270 @@
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from generator.maze_generator import maze_batch_generator, maze_solvable
+from util.batch_solver import ALGORITHMS, RESULT_DTYPE, SEARCHES
+import itertools
+import os
+import time
+import numpy as np
+
+
+def generate_mazes(count, dimension, probabillity, seed=None, block_size=256):
+    """
+    Stream mazes, drawing them block_size at a time so only one block is in memory.
+
+    Args:
+        count (int | None): Number of mazes, or None for an endless stream.
+        dimension (int): The size of each maze (dimension x dimension).
+        probabillity (float): The probability of placing a wall in each cell.
+        seed (int, optional): Seed of the stream. The same seed always yields the same mazes.
+        block_size (int, optional): Number of mazes drawn at once. Defaults to 256.
+
+    Yields:
+        numpy.ndarray: (dimension, dimension) uint8 mazes, 1 for walls.
+    """
+
+    rng = np.random.default_rng(seed)
+    remaining = count
+    while remaining is None or remaining > 0:
+        size = block_size if remaining is None else min(block_size, remaining)
+        yield from maze_batch_generator(size, dimension, probabillity, rng)
+        if remaining is not None:
+            remaining -= size
+
+
+def solvable_mazes(mazes, block_size=256):
+    """
+    Keep only the mazes with a path between the corners, checking block_size of them at once.
+    """
+
+    iterator = iter(mazes)
+    while True:
+        block = list(itertools.islice(iterator, block_size))
+        if len(block) == 0:
+            return
+        for maze, solvable in zip(block, maze_solvable(np.stack(block))):
+            if solvable:
+                yield maze
+
+
+def solve_chunk(first_index, mazes, algorithm_codes):
+    """
+    Worker task: solve a (k, n, n) stack of mazes with every algorithm.
+
+    Returns:
+        numpy.ndarray: A RESULT_DTYPE array with one row per maze and algorithm.
+    """
+
+    results = np.zeros(len(mazes) * len(algorithm_codes), dtype=RESULT_DTYPE)
+    row = 0
+    for k, maze in enumerate(mazes):
+        for code in algorithm_codes:
+            started = time.perf_counter()
+            result = SEARCHES[ALGORITHMS[code]](maze)
+            elapsed = time.perf_counter() - started
+            results[row] = (first_index + k, code, result.found, result.path_length, result.expanded, elapsed)
+            row += 1
+    return results
+
+
+def solve_stream(mazes, algorithms=("bfs",), workers=None, chunk_size=64, max_in_flight=None):
+    """
+    Solve a stream of mazes over a process pool with a bounded number of chunks in flight.
+
+    Mazes are only pulled from the input while fewer than max_in_flight chunks are pending, so a slow pool
+    holds back the generator instead of letting mazes pile up in memory.
+
+    Args:
+        mazes (iterable): The (n, n) mazes, where 1 represents a wall.
+        algorithms (sequence of str, optional): Names from util.batch_solver.ALGORITHMS. Defaults to ("bfs",).
+        workers (int, optional): Number of worker processes, 0 to solve in this process. Defaults to the CPU count.
+        chunk_size (int, optional): Number of mazes per worker task. Defaults to 64.
+        max_in_flight (int, optional): Maximum number of pending chunks. Defaults to twice the worker count.
+
+    Yields:
+        numpy.ndarray: RESULT_DTYPE arrays of finished chunks, in completion order. The "maze" field is the
+                       position of the maze in the stream.
+    """
+
+    algorithm_codes = tuple(ALGORITHMS.index(name) for name in algorithms)
+
+    # Lists of up to chunk_size mazes, numbered, read lazily from the input
+    iterator = iter(mazes)
+    chunks = enumerate(iter(lambda: list(itertools.islice(iterator, chunk_size)), []))
+
+    if workers == 0:
+        for number, chunk in chunks:
+            yield solve_chunk(number * chunk_size, np.stack(chunk), algorithm_codes)
+        return
+
+    workers = workers if workers is not None else os.cpu_count() or 1
+    limit = max_in_flight if max_in_flight is not None else 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        try:
+            for number, chunk in chunks:
+                pending.add(executor.submit(solve_chunk, number * chunk_size, np.stack(chunk), algorithm_codes))
+
+                # Backpressure: wait for a chunk to finish before reading more mazes
+                while len(pending) >= limit:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+
+            while len(pending) != 0:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+class RunningStats:
+    """
+    Running mean, variance and percentiles of a non-negative integer metric, in constant memory.
+
+    The mean and variance are updated with Welford's method, merging whole batches at a time. Percentiles
+    come from a histogram with one bin per value below `exact` and log-spaced bins above it, each one
+    `precision` wider than the previous. The bin count is bounded (about 4700 with the defaults, for any
+    int64 value), and percentiles above `exact` are within `precision` of the true value.
+    """
+
+    def __init__(self, exact=1024, precision=0.01):
+        """
+        Args:
+            exact (int, optional): Values below this get a bin each and exact percentiles. Defaults to 1024.
+            precision (float, optional): Relative width of the log-spaced bins above exact. Defaults to 0.01.
+        """
+
+        self.exact = exact
+        self.growth = np.log1p(precision)
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.histogram = np.zeros(0, dtype=np.int64)
+
+    def bins(self, values):
+        """
+        Histogram bin of every value: the value itself below exact, a log-spaced bin above.
+        """
+
+        bins = values.copy()
+        large = values >= self.exact
+        bins[large] = self.exact + (np.log(values[large] / self.exact) / self.growth).astype(np.int64)
+        return bins
+
+    def bin_value(self, index):
+        """
+        Smallest value of a histogram bin.
+        """
+        if index < self.exact:
+            return index
+        return int(np.ceil(self.exact * np.exp((index - self.exact) * self.growth)))
+
+    def update(self, values):
+        """
+        Add a batch of values.
+        """
+
+        values = np.asarray(values, dtype=np.int64)
+        if len(values) == 0:
+            return
+
+        # Merge the batch mean and sum of squared deviations into the running ones
+        count = self.count + len(values)
+        batch_mean = values.mean()
+        delta = batch_mean - self.mean
+        self.m2 += ((values - batch_mean) ** 2).sum() + delta ** 2 * self.count * len(values) / count
+        self.mean += delta * len(values) / count
+        self.count = count
+        low, high = int(values.min()), int(values.max())
+        self.minimum = low if self.minimum is None else min(self.minimum, low)
+        self.maximum = high if self.maximum is None else max(self.maximum, high)
+
+        counts = np.bincount(self.bins(values))
+        if len(counts) > len(self.histogram):
+            self.histogram = np.pad(self.histogram, (0, len(counts) - len(self.histogram)))
+        self.histogram[:len(counts)] += counts
+
+    @property
+    def variance(self):
+        return self.m2 / self.count if self.count != 0 else 0.0
+
+    def percentile(self, q):
+        """
+        Nearest-rank percentile q (0 to 100) of the values so far, None if there are none. Exact below
+        `exact`, and the smallest value of its log-spaced bin above.
+        """
+
+        if self.count == 0:
+            return None
+        rank = max(int(np.ceil(q / 100 * self.count)), 1)
+        value = self.bin_value(int(np.searchsorted(np.cumsum(self.histogram), rank)))
+        return min(max(value, self.minimum), self.maximum)
+
+    def as_dict(self, percentiles=(50, 90, 99)):
+        summary = {"count": self.count, "mean": float(self.mean), "std": float(self.variance) ** 0.5}
+        summary.update({f"p{q}": self.percentile(q) for q in percentiles})
+        return summary
+
+
+class SolveSummary:
+    """
+    Running summary of the results of one algorithm: solvability rate, path lengths of the solved mazes,
+    nodes expanded and total search time.
+    """
+
+    def __init__(self, algorithm):
+        self.algorithm = algorithm
+        self.mazes = 0
+        self.solved = 0
+        self.seconds = 0.0
+        self.path_length = RunningStats()
+        self.expanded = RunningStats()
+
+    def update(self, rows):
+        """
+        Add RESULT_DTYPE rows of this algorithm.
+        """
+        self.mazes += len(rows)
+        self.solved += int(rows["found"].sum())
+        self.seconds += float(rows["seconds"].sum())
+        self.path_length.update(rows["path_length"][rows["found"]])
+        self.expanded.update(rows["expanded"])
+
+    def as_dict(self):
+        return {
+            "algorithm": self.algorithm,
+            "mazes": self.mazes,
+            "solvable_rate": self.solved / self.mazes if self.mazes != 0 else 0.0,
+            "seconds": self.seconds,
+            "path_length": self.path_length.as_dict(),
+            "expanded": self.expanded.as_dict(),
+        }
+
+
+def run_pipeline(mazes, algorithms=("bfs",), workers=None, chunk_size=64, max_in_flight=None, progress=None):
+    """
+    Solve a stream of mazes and aggregate the results as they arrive, without keeping them.
+
+    Args:
+        mazes (iterable): The (n, n) mazes, typically generate_mazes, optionally filtered by solvable_mazes.
+        algorithms (sequence of str, optional): Names from util.batch_solver.ALGORITHMS. Defaults to ("bfs",).
+        workers (int, optional): Number of worker processes, 0 to solve in this process.
+        chunk_size (int, optional): Number of mazes per worker task. Defaults to 64.
+        max_in_flight (int, optional): Maximum number of pending chunks. Defaults to twice the worker count.
+        progress (callable, optional): Called with the summaries after every finished chunk.
+
+    Returns:
+        dict: A SolveSummary per algorithm name.
+    """
+
+    summaries = {name: SolveSummary(name) for name in algorithms}
+    for results in solve_stream(mazes, algorithms, workers, chunk_size, max_in_flight):
+        for name, summary in summaries.items():
+            summary.update(results[results["algorithm"] == ALGORITHMS.index(name)])
+        if progress is not None:
+            progress(summaries)
+    return summaries
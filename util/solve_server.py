@@ -0,0 +1,346 @@
+from search_algorithms.solvers import SOLVERS, solve
+from util.solve_pipeline import RunningStats
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import numpy as np
+
+
+def decode_line(line):
+    """
+    Decode one JSON line of the protocol into its object.
+
+    Raises:
+        ValueError: If the line is not a JSON object.
+    """
+
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as error:
+        raise ValueError(f"invalid JSON: {error}") from None
+    if not isinstance(request, dict):
+        raise ValueError("a request must be a JSON object")
+    return request
+
+
+def parse_request(request, default_algorithm="bfs"):
+    """
+    Validate a decoded solve request.
+
+    A request is an object with a "maze" (list of rows, 1 for walls) and optionally an "id" echoed in the
+    response, an "algorithm" name from SOLVERS and "start" and "goal" [row, column] nodes, the corners by
+    default. {"command": "stats"} asks for the latency summary instead.
+
+    Returns:
+        dict: The request with the maze as a uint8 array and the defaults filled in.
+
+    Raises:
+        ValueError: If the request is not valid.
+    """
+
+    algorithm = request.get("algorithm", default_algorithm)
+    if algorithm not in SOLVERS:
+        raise ValueError(f"unknown solver {algorithm!r}, expected one of {tuple(SOLVERS)}")
+    # Any value other than 1 is an open cell, so out-of-range numbers cannot overflow the uint8 maze
+    try:
+        cells = np.asarray(request.get("maze", []))
+    except (ValueError, TypeError):
+        raise ValueError("maze must be a non-empty list of rows of equal length") from None
+    if cells.ndim != 2 or cells.size == 0:
+        raise ValueError("maze must be a non-empty list of rows")
+    maze = (cells == 1).view(np.uint8)
+    return {
+        "id": request.get("id"),
+        "algorithm": algorithm,
+        "maze": maze,
+        "start": parse_node(request.get("start"), maze.shape, "start"),
+        "goal": parse_node(request.get("goal"), maze.shape, "goal"),
+    }
+
+
+def parse_node(node, shape, name):
+    """
+    Validate an optional [row, column] node of a request.
+
+    Returns:
+        tuple of int | None: The node, None when the request leaves it to the default corner.
+
+    Raises:
+        ValueError: If the node is not two ints inside the maze.
+    """
+
+    if node is None:
+        return None
+    if (not isinstance(node, list) or len(node) != 2
+            or not all(isinstance(value, int) and not isinstance(value, bool) for value in node)):
+        raise ValueError(f"{name} must be a [row, column] pair of ints")
+    if not (0 <= node[0] < shape[0] and 0 <= node[1] < shape[1]):
+        raise ValueError(f"{name} {node} is outside the {shape[0]}x{shape[1]} maze")
+    return tuple(node)
+
+
+def solve_batch(requests):
+    """
+    Worker task: solve a micro-batch of parsed requests one after the other.
+
+    Returns:
+        list of dict: Per request, the path as [row, column] nodes, its length, the expanded nodes and the
+                      solve time, or the error raised by the solver.
+    """
+
+    responses = []
+    for request in requests:
+        started = time.perf_counter()
+        # Any failure is answered for its own request, not for the whole batch
+        try:
+            result = solve(request["algorithm"], request["maze"], request["start"], request["goal"])
+        except Exception as error:
+            responses.append({"error": f"{type(error).__name__}: {error}"})
+            continue
+        responses.append({
+            "found": result.found,
+            "path": result.nodes().tolist(),
+            "path_length": result.path_length,
+            "expanded": result.expanded,
+            "solve_ms": (time.perf_counter() - started) * 1e3,
+        })
+    return responses
+
+
+class SolveServer:
+    """
+    Asyncio front end that micro-batches concurrent solve requests onto a process pool.
+
+    Requests are queued as they arrive. A batcher task takes the first one, waits up to max_delay for
+    more, and sends up to max_batch of them to a worker as one task, so the pool round trip is paid per
+    batch instead of per request. Several batches are in flight at once, up to twice the worker count.
+    Every response carries its latency from arrival to reply, and the server keeps running statistics of
+    the latencies and batch sizes.
+
+    Example:
+        server = SolveServer(workers=8)
+        asyncio.run(server.serve_unix("/tmp/maze.sock"))
+    """
+
+    def __init__(self, workers=None, max_batch=32, max_delay=0.002, default_algorithm="bfs"):
+        """
+        Args:
+            workers (int, optional): Number of worker processes, 0 to solve in the event loop. Defaults to the
+                                     CPU count.
+            max_batch (int, optional): Maximum number of requests per batch. Defaults to 32.
+            max_delay (float, optional): Seconds the first request of a batch waits for others. Defaults to 0.002.
+            default_algorithm (str, optional): Solver of the requests that do not name one. Defaults to "bfs".
+        """
+
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.default_algorithm = default_algorithm
+        # Latencies go into log-spaced bins 1% wide above 100 us, so a slow request costs a few bins,
+        # not one bin per microsecond
+        self.latency = RunningStats(exact=100, precision=0.01)
+        self.batch_size = RunningStats()
+        self.queue = None
+        self.executor = None
+        self.in_flight = None
+        self.batcher_task = None
+
+    async def start(self):
+        """
+        Start the worker pool and the batcher. Called by the serve methods.
+        """
+
+        self.queue = asyncio.Queue()
+        if self.workers != 0:
+            # Fork the workers now: forked later, they would inherit the client sockets open at that time and
+            # keep them open after the server closes them
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(*(loop.run_in_executor(self.executor, os.getpid) for _ in range(self.workers)))
+        self.in_flight = asyncio.Semaphore(2 * max(self.workers, 1))
+        self.batcher_task = asyncio.create_task(self.batcher())
+
+    def close(self):
+        """
+        Stop the batcher and shut the worker pool down.
+        """
+
+        self.batcher_task.cancel()
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+
+    async def batcher(self):
+        """
+        Collect queued requests into batches and dispatch them.
+        """
+
+        while True:
+            batch = [await self.queue.get()]
+
+            # Give concurrent requests max_delay to arrive, then take what is queued. Cancelling a pending
+            # queue.get() with wait_for can lose a request, so the queue is only read without waiting.
+            if self.queue.qsize() < self.max_batch - 1:
+                await asyncio.sleep(self.max_delay)
+            while len(batch) < self.max_batch and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            # Backpressure: past the in-flight limit, requests wait in the queue
+            await self.in_flight.acquire()
+            asyncio.create_task(self.dispatch(batch))
+
+    async def dispatch(self, batch):
+        """
+        Solve a batch on the pool and hand every response to its waiting request.
+        """
+
+        requests = [request for request, _ in batch]
+        try:
+            if self.executor is None:
+                responses = solve_batch(requests)
+            else:
+                responses = await asyncio.get_running_loop().run_in_executor(self.executor, solve_batch, requests)
+        except Exception as error:
+            responses = [{"error": f"worker failed: {error}"}] * len(batch)
+        finally:
+            self.in_flight.release()
+
+        self.batch_size.update([len(batch)])
+        for (_, future), response in zip(batch, responses):
+            if not future.done():
+                future.set_result(dict(response, batch=len(batch)))
+
+    async def submit(self, request):
+        """
+        Queue a parsed request and wait for its response.
+        """
+
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((request, future))
+        return await future
+
+    def stats(self):
+        """
+        Summary of the latencies in microseconds, with percentiles within 1%, and of the batch sizes so far.
+        """
+        return {"latency_us": self.latency.as_dict(), "batch_size": self.batch_size.as_dict()}
+
+    async def handle_line(self, line):
+        """
+        Answer one request line with its JSON response line.
+        """
+
+        received = time.perf_counter()
+        request_id = None
+        try:
+            request = decode_line(line)
+            if request.get("command") == "stats":
+                return json.dumps(self.stats())
+            request_id = request.get("id")
+            response = await self.submit(parse_request(request, self.default_algorithm))
+        except (ValueError, TypeError, OverflowError) as error:
+            response = {"error": str(error)}
+
+        latency = time.perf_counter() - received
+        self.latency.update([int(latency * 1e6)])
+        return json.dumps(dict({"id": request_id}, latency_ms=latency * 1e3, **response))
+
+    async def serve_lines(self, readline, write):
+        """
+        Answer every line of a stream concurrently, writing the responses in the order they complete.
+
+        Args:
+            readline (callable): Coroutine function returning the next line, empty at the end of the stream.
+            write (callable): Called with every response line.
+        """
+
+        async def answer(line):
+            write(await self.handle_line(line) + "\n")
+
+        pending = set()
+        while True:
+            line = await readline()
+            if not line:
+                break
+            if line.strip():
+                task = asyncio.create_task(answer(line))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        if len(pending) != 0:
+            await asyncio.wait(pending)
+
+    async def serve_connection(self, reader, writer):
+        """
+        Serve one socket client until it closes its side.
+        """
+
+        try:
+            await self.serve_lines(reader.readline, lambda text: writer.write(text.encode()))
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve_unix(self, path):
+        """
+        Serve JSON lines on a unix socket until cancelled.
+        """
+
+        await self.start()
+        try:
+            server = await asyncio.start_unix_server(self.serve_connection, path)
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.close()
+
+    async def serve_stdin(self):
+        """
+        Serve JSON lines from stdin to stdout until the end of the input.
+        """
+
+        await self.start()
+        try:
+            # stdin may be a regular file, which the event loop cannot watch, so it is read on a thread
+            async def readline():
+                return await asyncio.to_thread(sys.stdin.readline)
+
+            def write(text):
+                sys.stdout.write(text)
+                sys.stdout.flush()
+
+            await self.serve_lines(readline, write)
+        finally:
+            self.close()
+
+
+def serve(socket_path=None, workers=None, max_batch=32, max_delay=0.002, default_algorithm="bfs"):
+    """
+    Run a SolveServer on a unix socket, or on stdin and stdout when socket_path is None or "-".
+    The latency and batch size summary is printed to stderr on exit.
+    """
+
+    server = SolveServer(workers, max_batch, max_delay, default_algorithm)
+    try:
+        if socket_path is None or socket_path == "-":
+            asyncio.run(server.serve_stdin())
+        else:
+            asyncio.run(server.serve_unix(socket_path))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(server.stats()), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve maze solve requests as JSON lines with micro-batching")
+    parser.add_argument("--socket", default="-", help="Unix socket path to listen on, - for stdin/stdout")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes, 0 for none")
+    parser.add_argument("--max-batch", type=int, default=32, help="Maximum number of requests per batch")
+    parser.add_argument("--max-delay", type=float, default=2.0, help="Milliseconds a batch waits to fill up")
+    parser.add_argument("--algorithm", default="bfs", choices=list(SOLVERS), help="Solver of requests naming none")
+    args = parser.parse_args()
+
+    serve(args.socket, args.workers, args.max_batch, args.max_delay / 1e3, args.algorithm)
@@ -0,0 +1,187 @@
+from multiprocessing import shared_memory
+from search_algorithms.solvers import OPTIMAL_SOLVERS, get_solver, solve
+import multiprocessing
+import queue
+import time
+import numpy as np
+
+# When a race stops: at the first result, at the first path found, at the first path found by an optimal
+# solver, or when every solver is done
+CONDITIONS = ("first", "first-found", "first-optimal", "all")
+
+
+class RaceResult:
+    """
+    Outcome of a solver race.
+
+    Attributes:
+        winner (str | None): The solver whose result met the condition, None if none did. In a race run
+                             until "all" are done, the first solver that found a path.
+        results (dict): SearchResult of every solver that finished, by name, in the order they finished.
+        seconds (dict): Solve time of every solver that finished, by name.
+        errors (dict): Error message of every solver that failed, by name.
+        cancelled (list of str): Solvers stopped before they finished.
+    """
+
+    def __init__(self, winner, results, seconds, errors, cancelled):
+        self.winner = winner
+        self.results = results
+        self.seconds = seconds
+        self.errors = errors
+        self.cancelled = cancelled
+
+    @property
+    def result(self):
+        """
+        SearchResult of the winner, None if there is none.
+        """
+        return self.results.get(self.winner)
+
+    def __repr__(self):
+        return (f"RaceResult(winner={self.winner!r}, finished={list(self.results)}, "
+                f"cancelled={self.cancelled}, errors={list(self.errors)})")
+
+
+def race_worker(shm_name, shape, name, source, destination, ready, start, results):
+    """
+    Worker process: solve the shared maze with one solver once the race starts, and report the result.
+
+    Args:
+        shm_name (str): Name of the shared memory block holding the uint8 maze.
+        shape (tuple of int): Shape of the maze.
+        name (str): Name of the solver in SOLVERS.
+        source (tuple of int | None): The (row, column) start node.
+        destination (tuple of int | None): The (row, column) goal node.
+        ready (multiprocessing.Semaphore): Released once the maze is attached and the solver is about to wait.
+        start (multiprocessing.Event): Set when every worker is ready, so all solvers start together.
+        results (multiprocessing.Queue): Receives (name, SearchResult or None, seconds, error or None).
+    """
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        # The solvers build their own grids from the maze and never write to it, so it is read in place
+        maze = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+        maze.flags.writeable = False
+        ready.release()
+        start.wait()
+        started = time.perf_counter()
+        try:
+            result, error = solve(name, maze, source, destination), None
+        except Exception as exception:
+            result, error = None, f"{type(exception).__name__}: {exception}"
+        results.put((name, result, time.perf_counter() - started, error))
+        del maze
+    finally:
+        shm.close()
+
+
+def condition_met(condition, name, result):
+    """
+    True if the result of a solver ends a race run until the condition.
+    """
+
+    if condition == "first":
+        return True
+    if condition == "first-found":
+        return result.found
+    if condition == "first-optimal":
+        return result.found and name in OPTIMAL_SOLVERS
+    return False
+
+
+def race(maze, algorithms=("bfs", "dfs", "a-star"), until="first-found", source=None, destination=None,
+         timeout=None):
+    """
+    Run several solvers at the same time on one maze, each in its own process, and stop the race as soon
+    as a condition is met.
+
+    The maze is copied once into shared memory, which every worker reads in place. The workers attach to
+    it, then wait until all of them are ready, so the solvers start together and their times are
+    measured under the same conditions. Workers still running when the race stops are terminated.
+
+    Args:
+        maze (numpy.ndarray): The maze as a 2D array where 1 represents a wall. It is not modified.
+        algorithms (sequence of str, optional): Names of solvers from SOLVERS. Defaults to BFS, DFS and A*.
+        until (str, optional): When to stop, one of CONDITIONS: "first" result, "first-found" path, first
+                               path of an optimal solver ("first-optimal"), or when "all" are done.
+                               Defaults to "first-found".
+        source (tuple of int, optional): The (row, column) start node, the top-left corner by default.
+        destination (tuple of int, optional): The (row, column) goal node, the bottom-right corner by default.
+        timeout (float, optional): Seconds after which the race stops whatever the condition. No limit by default.
+
+    Returns:
+        RaceResult: The winner, the results and times of the solvers that finished and the cancelled ones.
+
+    Raises:
+        ValueError: If a solver or the condition is unknown.
+    """
+
+    if until not in CONDITIONS:
+        raise ValueError(f"unknown race condition {until!r}, expected one of {CONDITIONS}")
+    for name in algorithms:
+        get_solver(name)
+
+    maze = np.asarray(maze)
+    shm = shared_memory.SharedMemory(create=True, size=max(maze.size, 1))
+    shared = np.ndarray(maze.shape, dtype=np.uint8, buffer=shm.buf)
+    shared[...] = maze == 1
+    del shared
+
+    ready, start, results = multiprocessing.Semaphore(0), multiprocessing.Event(), multiprocessing.Queue()
+    workers = {
+        name: multiprocessing.Process(target=race_worker, daemon=True,
+                                      args=(shm.name, maze.shape, name, source, destination, ready, start,
+                                            results))
+        for name in dict.fromkeys(algorithms)
+    }
+    winner, finished, seconds, errors = None, {}, {}, {}
+    try:
+        for worker in workers.values():
+            worker.start()
+        deadline = None if timeout is None else time.perf_counter() + timeout
+
+        # Wait until every worker has attached the maze, so that none starts while the others are still
+        # importing and the times compare. A worker that dies first is reported by the loop below.
+        waiting = len(workers)
+        while waiting and not any(worker.exitcode not in (None, 0) for worker in workers.values()):
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            waiting -= ready.acquire(timeout=0.1)
+        start.set()
+
+        while len(finished) + len(errors) < len(workers):
+            wait = None if deadline is None else deadline - time.perf_counter()
+            try:
+                # Poll so that a worker that died without reporting does not hang the race
+                name, result, elapsed, error = results.get(timeout=0.1 if wait is None else max(min(wait, 0.1), 0))
+            except queue.Empty:
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+                # A worker that reported exits with code 0, its result may still be on its way
+                for name, worker in workers.items():
+                    if worker.exitcode not in (None, 0) and name not in finished and name not in errors:
+                        errors[name] = f"worker exited with code {worker.exitcode}"
+                continue
+            if error is not None:
+                errors[name] = error
+                continue
+            finished[name], seconds[name] = result, elapsed
+            if condition_met(until, name, result):
+                winner = name
+                break
+    finally:
+        # Cancel the solvers still running
+        cancelled = [name for name in workers if name not in finished and name not in errors]
+        for worker in workers.values():
+            if worker.is_alive():
+                worker.terminate()
+        for worker in workers.values():
+            worker.join()
+        results.close()
+        shm.close()
+        shm.unlink()
+
+    # Run to the end, the winner is the first solver that found a path
+    if until == "all":
+        winner = next((name for name, result in finished.items() if result.found), None)
+    return RaceResult(winner, finished, seconds, errors, cancelled)
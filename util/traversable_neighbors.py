@@ -1,13 +1,17 @@
 
-def traversable_neighbors(maze, node):
+def traversable_neighbors(maze, node, visited=None):
     """
     Given a maze and a node, this function returns a list of traversable neighbors.
 
     Args:
-        maze (list of list of int): A 2D list representing the maze where 1 represents a wall, 
+        maze (list of list of int | SearchGrid): A 2D list representing the maze where 1 represents a wall, 
                                     -1 represents a visited cell, and any other value represents 
-                                    an unvisited traversable cell.
+                                    an unvisited traversable cell. It can also be a SearchGrid or a
+                                    PackedSearchGrid, whose neighbor tests run on its wall flags.
         node (tuple of int): A tuple (row, coloumn) representing the current node's position in the maze.
+        visited (SearchGrid flags, optional): For a grid, visited flags indexed by its flat cell index,
+                                              such as a Bitset from grid.new_visited(). Visited neighbors
+                                              are left out.
 
     Returns:
         list of tuple of int: A list of tuples representing the positions of traversable neighbors 
@@ -15,6 +19,11 @@ def traversable_neighbors(maze, node):
                               within the maze boundaries, not a wall, and not already visited.
     """
 
+    # A grid keeps visited cells apart from its walls, and checks the neighbors on its own flags
+    if hasattr(maze, "open_neighbors"):
+        neighbors = maze.open_neighbors(maze.index(node))
+        return [maze.node(index) for index in neighbors if visited is None or not visited[index]]
+
     # Sets the current node and initializes an empty neighbors array
     (i,j) = node
     neighbors = []